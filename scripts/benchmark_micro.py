@@ -0,0 +1,967 @@
+"""Micro-benchmarks for generated-code and runtime-helper hot paths.
+
+Usage:
+    uv run python scripts/benchmark_micro.py
+    uv run python scripts/benchmark_micro.py --case list-index --repeat 7
+
+Each case times a few variants of the same work (typically "current
+translator output" versus "previous helper-based form") and reports the
+best-of-N seconds plus the ratio against the first variant.
+"""
+
+import argparse
+import io
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable, Sequence
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+# Keep repository root first so `import wenyan` resolves local `wenyan.py`.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import wenyan
+
+
+@dataclass
+class 測項:
+    """One benchmark case.
+
+    Attributes:
+        名稱: Case id used by `--case`.
+        說明: One-line description.
+        變體: Variant label → zero-argument callable doing one unit of work.
+        附記: Optional callable run after timing; returns extra report lines.
+    """
+
+    名稱: str
+    說明: str
+    變體: dict[str, Callable[[], object]]
+    附記: Callable[[], list[str]] | None = None
+
+
+測項登記: dict[str, Callable[[], 測項]] = {}
+
+
+def 登記(名稱: str) -> Callable[[Callable[[], 測項]], Callable[[], 測項]]:
+    """Register a case factory under `名稱`."""
+
+    def 裝飾(函: Callable[[], 測項]) -> Callable[[], 測項]:
+        測項登記[名稱] = 函
+        return 函
+
+    return 裝飾
+
+
+def 執行碼(程式碼: Any, 域: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Run a compiled module in `域` (fresh `__bench__` globals by default)."""
+
+    if 域 is None:
+        域 = {"__name__": "__bench__"}
+    exec(程式碼, 域)
+    return 域
+
+
+def 序言域() -> dict[str, object]:
+    """Fresh globals holding the translator's runtime prelude."""
+
+    return 執行碼(compile(wenyan.內建序言源碼, "<內建序言>", "exec"))
+
+
+def 載入文言(源碼: str, 文檔名: str = "<bench>") -> dict[str, Any]:
+    """Compile and run Wenyan source once; return its globals."""
+
+    return 執行碼(compile(wenyan.編譯為PythonAST(源碼, 文檔名), 文檔名, "exec"))
+
+
+def 編譯片段(源碼: str, 域: dict[str, object]) -> Callable[[], object]:
+    """Compile a Python function body `def 測(): ...` into `域` and return it."""
+
+    執行碼(compile(源碼, "<bench>", "exec"), 域)
+    return cast(Callable[[], object], 域["測"])
+
+
+@登記("list-index")
+def 列下標測項() -> 測項:
+    """`之` reads on a list with an unproven integer index."""
+
+    域 = 序言域()
+    域["列"] = list(range(1000))
+    助函式 = 編譯片段(
+        "def 測():\n"
+        "    總 = 0\n"
+        "    for 索 in range(1, 1001):\n"
+        "        總 += 取物(列, 文言轉整(索, 0))\n"
+        "    return 總\n",
+        域,
+    )
+    內聯式 = 編譯片段(
+        "def 測():\n"
+        "    總 = 0\n"
+        "    for 索 in range(1, 1001):\n"
+        "        總 += (列[索 - 1] if type(列) is list and type(索) is int\n"
+        "               and 0 < 索 <= len(列) else 取物(列, 文言轉整(索, 0)))\n"
+        "    return 總\n",
+        域,
+    )
+    文言域 = 載入文言(
+        "吾有一列。名之曰「列」。\n"
+        "為是一千遍。充「列」以一。云云。\n"
+        "吾有一術。名之曰「和」。欲行是術。必先得一元。曰「甲」。乃行是術曰。\n"
+        "  吾有一數。曰零。名之曰「總」。吾有一數。曰一。名之曰「索」。\n"
+        "  為是一千遍。\n"
+        "    夫「甲」之「索」。加「總」以其。昔之「總」者。今其是矣。\n"
+        "    加「索」以一。昔之「索」者。今其是矣。\n"
+        "  云云。\n"
+        "  乃得「總」。\n"
+        "是謂「和」之術也。\n"
+    )
+    和 = cast(Callable[[object], object], 文言域["和"])
+    列 = 文言域["列"]
+    return 測項(
+        名稱="list-index",
+        說明="1000 reads of 列之索 (helper vs inline guard vs compiled 術)",
+        變體={
+            "取物 helper": 助函式,
+            "inline guard": 內聯式,
+            "wenyan 術": lambda: 和(列),
+        },
+    )
+
+
+@登記("neg-slot-soak")
+def 負索浸泡測項() -> 測項:
+    """Churn short-lived lists that each write a <=0 slot."""
+
+    文言域 = 載入文言(
+        "吾有一術。名之曰「攪」。欲行是術。必先得一數。曰「次」。乃行是術曰。\n"
+        "  為是「次」遍。\n"
+        "    吾有一列。名之曰「甲」。\n"
+        "    昔之「甲」之零者。今一是矣。\n"
+        "  云云。\n"
+        "是謂「攪」之術也。\n"
+    )
+    攪 = cast(Callable[[int], object], 文言域["攪"])
+    表 = cast(dict[object, object], 文言域["__文言負索"])
+
+    def 浸泡() -> list[str]:
+        tracemalloc.start()
+        行列: list[str] = []
+        try:
+            起點, _ = tracemalloc.get_traced_memory()
+            for 輪 in range(1, 11):
+                攪(100_000)
+                現存, _ = tracemalloc.get_traced_memory()
+                if 輪 in {1, 5, 10}:
+                    行列.append(
+                        f"  after {輪 * 100_000:>9,} lists: table={len(表):>4} "
+                        f"traced={(現存 - 起點) / 1024:8.1f} KiB"
+                    )
+        finally:
+            tracemalloc.stop()
+        return 行列
+
+    return 測項(
+        名稱="neg-slot-soak",
+        說明="10k short-lived lists writing 之零; memory must stay flat",
+        變體={"churn 10k": lambda: 攪(10_000)},
+        附記=浸泡,
+    )
+
+
+@登記("print-lines")
+def 書之測項() -> 測項:
+    """2000 single-value 書之 lines into an in-memory stdout."""
+
+    域 = 序言域()
+    域["io"] = io
+    域["redirect_stdout"] = redirect_stdout
+    print式 = 編譯片段(
+        "def 測():\n"
+        "    with redirect_stdout(io.StringIO()):\n"
+        "        for 值 in range(2000):\n"
+        "            __暫存 = [值]\n"
+        "            print(*(__暫存 if not globals().get('__wenyan_no_output_hanzi__', False)\n"
+        "                    else [__輸出格式值(值, 0) for 值 in __暫存]))\n",
+        域,
+    )
+    書者式 = 編譯片段(
+        "def 測():\n"
+        "    with redirect_stdout(io.StringIO()):\n"
+        "        書 = 文言書者(sys, None, True, False)\n"
+        "        for 值 in range(2000):\n"
+        "            __暫存 = [值]\n"
+        "            書.書(__暫存)\n"
+        "        書.閉()\n",
+        域 | {"sys": sys},
+    )
+    return 測項(
+        名稱="print-lines",
+        說明="2000 書之 lines (per-line print vs buffered writer)",
+        變體={"print per line": print式, "文言書者": 書者式},
+    )
+
+
+@登記("format-values")
+def 輸出格式測項() -> 測項:
+    """`__輸出格式值` on scalars and short flat lists."""
+
+    域 = 載入文言("噫。")
+    格式 = cast(Callable[[object, int], str], 域["__輸出格式值"])
+
+    class 通則整(int):
+        pass
+
+    class 通則浮(float):
+        pass
+
+    class 通則列(list):
+        pass
+
+    純量 = list(range(-500, 500)) + [0.5 * i for i in range(500)]
+    平列 = [[i, i + 1, i * 0.5] for i in range(500)]
+    通則純量 = [通則整(值) if isinstance(值, int) else 通則浮(值) for 值 in 純量]
+    通則平列 = [通則列(值) for 值 in 平列]
+
+    def 速路() -> None:
+        for 值 in 純量:
+            格式(值, 0)
+        for 值 in 平列:
+            格式(值, 0)
+
+    def 通則() -> None:
+        for 值 in 通則純量:
+            格式(值, 0)
+        for 值 in 通則平列:
+            格式(值, 0)
+
+    return 測項(
+        名稱="format-values",
+        說明="1500 scalars + 500 three-item lists (general path vs tiered fast path)",
+        變體={"general path": 通則, "tiered fast path": 速路},
+    )
+
+
+@登記("hanzi-output")
+def 漢字輸出測項() -> 測項:
+    """Whole example programs printed with Arabic versus Hanzi numerals."""
+
+    根目錄 = Path(__file__).resolve().parents[1]
+    程式列: list[tuple[str, object]] = []
+    for 名 in ("multiplication_table", "fibonacci"):
+        路徑 = 根目錄 / "examples" / f"{名}.wy"
+        源碼 = 路徑.read_text(encoding="utf-8")
+        程式列.append(
+            (名, compile(wenyan.編譯為PythonAST(源碼, str(路徑)), str(路徑), "exec"))
+        )
+
+    def 執行(程式碼: object, 漢字: bool) -> None:
+        域 = {
+            "__name__": "__main__",
+            "__wenyan_no_output_hanzi__": not 漢字,
+            "__wenyan_output_hanzi__": 漢字,
+        }
+        with redirect_stdout(io.StringIO()):
+            執行碼(程式碼, 域)
+
+    變體: dict[str, Callable[[], object]] = {}
+    for 名, 程式碼 in 程式列:
+        變體[f"{名} arabic"] = lambda 碼=程式碼: 執行(碼, False)
+        變體[f"{名} hanzi"] = lambda 碼=程式碼: 執行(碼, True)
+    return 測項(
+        名稱="hanzi-output",
+        說明="multiplication_table / fibonacci runs, --no-outputHanzi vs default",
+        變體=變體,
+    )
+
+
+@登記("hanzi-numerals")
+def 漢字數測項() -> 測項:
+    """`__數轉漢字` on small ints (cold/warm cache), large ints and decimals."""
+
+    域 = 序言域()
+    轉 = cast(Callable[[object], str], 域["__數轉漢字"])
+    快取 = cast(dict[object, str], 域["__漢字快取"])
+    大數 = [i * 1_000_003 for i in range(1000)]
+    小數 = [i / 8 + 0.001 for i in range(1000)]
+
+    def 冷() -> None:
+        快取.clear()
+        for 數 in range(1000):
+            轉(數)
+
+    return 測項(
+        名稱="hanzi-numerals",
+        說明="1000 conversions each (str() baseline vs converter)",
+        變體={
+            "str() baseline": lambda: [str(數) for 數 in range(1000)],
+            "ints <1000, cold cache": 冷,
+            "ints <1000, warm cache": lambda: [轉(數) for 數 in range(1000)],
+            "ints ~1e9": lambda: [轉(數) for 數 in 大數],
+            "decimals": lambda: [轉(數) for 數 in 小數],
+        },
+    )
+
+
+@登記("call-overhead")
+def 術呼叫測項() -> 測項:
+    """Calls to a two-argument 術: old wrapper/helper triple vs `文言術`."""
+
+    域 = 序言域()
+    舊域 = 編譯片段(
+        "def 測():\n"
+        "    def 本(甲, 乙):\n"
+        "        return 甲\n"
+        "    def 調用(術, *args):\n"
+        "        try:\n"
+        "            需 = 術.__文言術參數數__\n"
+        "        except AttributeError:\n"
+        "            return 術(*args)\n"
+        "        已 = len(args)\n"
+        "        if 已 >= 需:\n"
+        "            結 = 術(*args[:需])\n"
+        "            if 已 == 需:\n"
+        "                return 結\n"
+        "            return 調用(結, *args[需:])\n"
+        "        def _後續(*後):\n"
+        "            return 調用(術, *args + 後)\n"
+        "        return _後續\n"
+        "    def 包(*群):\n"
+        "        已 = len(群)\n"
+        "        if 已 >= 2:\n"
+        "            結 = 本(*群[:2])\n"
+        "            if 已 == 2:\n"
+        "                return 結\n"
+        "            return 調用(結, *群[2:])\n"
+        "        def 續(*後):\n"
+        "            return 調用(包, *群 + 後)\n"
+        "        return 續\n"
+        "    本.__文言術參數數__ = 2\n"
+        "    包.__文言術參數數__ = 2\n"
+        "    return 包\n",
+        域,
+    )
+    舊 = cast(Callable[..., object], 舊域())
+    新 = cast(Callable[..., object], 域["文言術"])(lambda 甲, 乙: 甲, 2, False, "測")
+
+    def 全參(術: Callable[..., object]) -> None:
+        for 值 in range(1000):
+            術(值, 值)
+
+    def 逐參(術: Callable[..., object]) -> None:
+        for 值 in range(1000):
+            cast(Callable[..., object], 術(值))(值)
+
+    return 測項(
+        名稱="call-overhead",
+        說明="1000 calls, full and one-at-a-time partial (wrapper vs 文言術)",
+        變體={
+            "wrapper full": lambda: 全參(舊),
+            "文言術 full": lambda: 全參(新),
+            "wrapper partial": lambda: 逐參(舊),
+            "文言術 partial": lambda: 逐參(新),
+        },
+    )
+
+
+@登記("inline-call")
+def 內聯呼叫測項() -> 測項:
+    """A loop calling two small 術, with and without call-site inlining."""
+
+    源碼 = (
+        "吾有一術。名之曰「倍」。欲行是術。必先得一數。曰「甲」。乃行是術曰。\n"
+        "  乘「甲」以二。乃得其。\n"
+        "是謂「倍」之術也。\n"
+        "吾有一術。名之曰「方和」。欲行是術。必先得二數。曰「甲」。曰「乙」。乃行是術曰。\n"
+        "  加「甲」以「乙」。名之曰「丙」。乘「丙」以「丙」。乃得其。\n"
+        "是謂「方和」之術也。\n"
+        "吾有一術。名之曰「跑」。欲行是術。必先得一數。曰「次」。乃行是術曰。\n"
+        "  吾有一數。曰零。名之曰「總」。\n"
+        "  為是「次」遍。\n"
+        "    施「倍」於「總」。施「方和」於其。於一。昔之「總」者。今其是矣。\n"
+        "    除「總」以七。所餘幾何。昔之「總」者。今其是矣。\n"
+        "  云云。\n"
+        "  乃得「總」。\n"
+        "是謂「跑」之術也。\n"
+    )
+
+    def 載入(內聯: bool) -> Callable[[int], object]:
+        環境 = wenyan._建立編譯環境()
+        環境.內聯 = 內聯
+        程, 處理後 = wenyan._解析前處理(源碼, "<bench>", 環境)
+        模組樹 = wenyan.轉譯為PythonAST(程, 處理後, "<bench>", 環境)
+        域 = 執行碼(compile(模組樹, "<bench>", "exec"))
+        return cast(Callable[[int], object], 域["跑"])
+
+    不展開 = 載入(False)
+    展開 = 載入(True)
+    return 測項(
+        名稱="inline-call",
+        說明="1000 iterations calling 倍 and 方和 (--no-inline vs default)",
+        變體={"--no-inline": lambda: 不展開(1000), "inlined": lambda: 展開(1000)},
+    )
+
+
+@登記("host-operator")
+def 宿主算式測項() -> 測項:
+    """A two-argument host lambda applied per call vs the folded operator."""
+
+    源碼 = (
+        "吾有一術。名之曰「跑」。欲行是術。必先得一數。曰「次」。乃行是術曰。\n"
+        "  吾有一數。曰零。名之曰「總」。\n"
+        "  為是「次」遍。\n"
+        "    施「(lambda x, y: x ^ y)」於「總」。於五。昔之「總」者。今其是矣。\n"
+        "  云云。\n"
+        "  乃得「總」。\n"
+        "是謂「跑」之術也。\n"
+    )
+    摺疊 = cast(Callable[[int], object], 載入文言(源碼)["跑"])
+
+    def 逐呼(次: int) -> int:
+        總 = 0
+        for _ in range(次):
+            # 每次新建函式，如未提升之宿主 lambda。
+            def 異或(x: int, y: int) -> int:
+                return x ^ y
+
+            總 = 異或(總, 5)
+        return 總
+
+    return 測項(
+        名稱="host-operator",
+        說明="1000 applications of an xor lambda (per-call lambda vs folded)",
+        變體={"lambda": lambda: 逐呼(1000), "folded": lambda: 摺疊(1000)},
+    )
+
+
+@登記("string-builder")
+def 字串累積測項() -> 測項:
+    """Loop-carried 言 accumulation at 10k–1M characters, concatenation vs list + join."""
+
+    源碼 = (
+        "吾有一術。名之曰「累」。欲行是術。必先得一數。曰「次」。乃行是術曰。\n"
+        "  吾有一言。名之曰「文」。\n"
+        "  為是「次」遍。\n"
+        "    加「文」以「「字」」。昔之「文」者。今其是矣。\n"
+        "  云云。\n"
+        "  乃得「文」。\n"
+        "是謂「累」之術也。\n"
+    )
+    累 = cast(Callable[[int], object], 載入文言(源碼)["累"])
+    # 以無累積之轉譯為對照（即此前之逐次相加）。
+    原判定 = wenyan._字串累積名
+    wenyan._字串累積名 = lambda 術節, 迴圈: []
+    try:
+        逐加 = cast(Callable[[int], object], 載入文言(源碼)["累"])
+    finally:
+        wenyan._字串累積名 = 原判定
+    return 測項(
+        名稱="string-builder",
+        說明="append one 言 per iteration; concat is quadratic so stops at 100k",
+        變體={
+            "concat 10k": lambda: 逐加(10_000),
+            "join 10k": lambda: 累(10_000),
+            "concat 100k": lambda: 逐加(100_000),
+            "join 100k": lambda: 累(100_000),
+            "join 1M": lambda: 累(1_000_000),
+        },
+    )
+
+
+@登記("list-ops")
+def 列操作測項() -> 測項:
+    """銜 of three lists, 充 with seven values and 取二以施, old vs new shapes."""
+
+    域 = 序言域()
+    域["首"], 域["頷"], 域["尾"] = list(range(50)), [0], list(range(50))
+    域["合"] = lambda 甲, 乙: 甲
+    片段 = {
+        "銜 a+b+c": "    __暫存.append(首 + 頷 + 尾)\n",
+        "銜 a+b; +=c": "    銜 = 首 + 頷\n    銜 += 尾\n    __暫存.append(銜)\n",
+        "充 7×append": "".join(f"    列.append({值})\n" for 值 in range(7)),
+        "充 extend": "    列.extend((0, 1, 2, 3, 4, 5, 6))\n",
+        "取 __取(2)": "    __暫存.append(1)\n    __暫存.append(2)\n"
+        "    __暫存.append(合(*__取(2)))\n",
+        "取 direct": "    __暫存.append(合(1, 2))\n",
+    }
+    變體: dict[str, Callable[[], object]] = {}
+    for 名, 體 in 片段.items():
+        變體[名] = 編譯片段(
+            "def 測():\n"
+            "    列 = []\n"
+            "    for _ in range(100):\n"
+            + "".join("    " + 行 + "\n" for 行 in 體.splitlines())
+            + "        __暫存.clear()\n",
+            域,
+        )
+    return 測項(
+        名稱="list-ops",
+        說明="100 iterations each; compare pairs (old shape first)",
+        變體=變體,
+    )
+
+
+@登記("list-sort")
+def 列經排序測項() -> 測項:
+    """列經's recursive 排序 (銜 of three lists per level) on 2000 numbers."""
+
+    import random
+
+    域 = 載入文言(
+        (Path(__file__).resolve().parents[1] / "lib" / "列經.wy").read_text(
+            encoding="utf-8"
+        )
+        + "\n吾有一術。名之曰「較」。欲行是術。必先得二數。曰「甲」曰「乙」。乃行是術曰。"
+        "減「甲」以「乙」。乃得其。是謂「較」之術也。\n"
+    )
+    排序 = cast(Callable[[object, object], object], 域["排序"])
+    較 = 域["較"]
+    亂 = random.Random(0)
+    數列 = [亂.randrange(100_000) for _ in range(2000)]
+    return 測項(
+        名稱="list-sort",
+        說明="排序 from lib/列經.wy on 2000 random ints",
+        變體={"排序": lambda: 排序(較, 數列)},
+    )
+
+
+@登記("list-lib-native")
+def 列經宿主測項() -> 測項:
+    """lib/列經.wy against its lib/py override on 10⁵ random numbers."""
+
+    import random
+
+    庫 = Path(__file__).resolve().parents[1] / "lib"
+    附 = (
+        "\n吾有一術。名之曰「較」。欲行是術。必先得二數。曰「甲」曰「乙」。乃行是術曰。"
+        "減「甲」以「乙」。乃得其。是謂「較」之術也。\n"
+        "吾有一術。名之曰「倍」。欲行是術。必先得一數。曰「甲」。乃行是術曰。"
+        "乘「甲」以二。乃得其。是謂「倍」之術也。\n"
+        "吾有一術。名之曰「奇」。欲行是術。必先得一數。曰「甲」。乃行是術曰。"
+        "除「甲」以二。所餘幾何。乃得其。是謂「奇」之術也。\n"
+        "吾有一術。名之曰「和」。欲行是術。必先得二數。曰「甲」曰「乙」。乃行是術曰。"
+        "加「甲」以「乙」。乃得其。是謂「和」之術也。\n"
+    )
+    亂 = random.Random(0)
+    數列 = [亂.randrange(1_000_000) for _ in range(100_000)]
+    版本 = {
+        版: 載入文言(路徑.read_text(encoding="utf-8") + 附)
+        for 版, 路徑 in (("lib", 庫 / "列經.wy"), ("lib/py", 庫 / "py" / "列經.wy"))
+    }
+    變體: dict[str, Callable[[], object]] = {}
+    for 術名, 參名 in (
+        ("排序", ("較",)),
+        ("遍施", ("倍",)),
+        ("篩剔", ("奇",)),
+        ("左併", ("和", 0)),
+        ("倒序", ()),
+    ):
+        for 版, 域 in 版本.items():
+            術 = cast(Callable[..., object], 域[術名])
+            參 = tuple(域[名] if isinstance(名, str) else 名 for 名 in 參名) + (數列,)
+            變體[f"{版} {術名}"] = lambda 術=術, 參=參: 術(*參)
+    return 測項(
+        名稱="list-lib-native",
+        說明="10⁵ random ints; each lib/py row against its lib row",
+        變體=變體,
+    )
+
+
+@登記("math-lib-native")
+def 算經宿主測項() -> 測項:
+    """lib/算經.wy against its lib/py override: module body and hot 術."""
+
+    import random
+
+    庫 = Path(__file__).resolve().parents[1] / "lib"
+    亂 = random.Random(0)
+    數列 = [亂.uniform(-100, 100) for _ in range(1000)]
+    正數列 = [abs(數) + 1e-3 for 數 in 數列]
+    版本: dict[str, tuple[object, dict[str, object]]] = {}
+    for 版, 路徑 in (("lib", 庫 / "算經.wy"), ("lib/py", 庫 / "py" / "算經.wy")):
+        源碼 = 路徑.read_text(encoding="utf-8")
+        程式碼 = compile(wenyan.編譯為PythonAST(源碼, str(路徑)), str(路徑), "exec")
+        版本[版] = (程式碼, 載入文言(源碼))
+    變體: dict[str, Callable[[], object]] = {}
+    for 版, (程式碼, _) in 版本.items():
+        變體[f"{版} module body"] = lambda 程式碼=程式碼: 執行碼(程式碼)
+    for 術名, 參 in (
+        ("平方根", lambda 數: (數,)),
+        ("析浮點數", lambda 數: (數,)),
+        ("相乘得雙", lambda 數: (數, 數)),
+        ("對數", lambda 數: (數,)),
+        ("正弦", lambda 數: (數,)),
+        ("冪", lambda 數: (數, 1.5)),
+    ):
+        for 版, (_, 域) in 版本.items():
+            術 = cast(Callable[..., object], 域[術名])
+            參列 = [參(數) for 數 in 正數列]
+
+            def 測(
+                術: Callable[..., object] = 術, 參列: list[tuple[float, ...]] = 參列
+            ) -> None:
+                for 參數 in 參列:
+                    術(*參數)
+
+            變體[f"{版} {術名} ×1000"] = 測
+    return 測項(
+        名稱="math-lib-native",
+        說明="import-time body and 1000 calls per 術; each lib/py row against its lib row",
+        變體=變體,
+    )
+
+
+@登記("chaos-lib-native")
+def 渾沌經宿主測項() -> 測項:
+    """lib/渾沌經.wy against its lib/py override on a ~2 MB 包諸渾沌 payload."""
+
+    import random
+
+    庫 = Path(__file__).resolve().parents[1] / "lib"
+    亂 = random.Random(0)
+    詩字 = "春風拂檻露華濃雲想衣裳花相容"
+    列 = [
+        {
+            "名": f"第{序}",
+            "壽": 亂.randint(-(10**6), 10**6),
+            "在": 亂.random() < 0.5,
+            "文": "".join(亂.choice(詩字) for _ in range(40)),
+            "子": [亂.randint(0, 99) for _ in range(3)],
+        }
+        for 序 in range(6000)
+    ]
+    版本: dict[str, dict[str, Any]] = {}
+    for 版, 路徑 in (("lib", 庫 / "渾沌經.wy"), ("lib/py", 庫 / "py" / "渾沌經.wy")):
+        源碼 = 路徑.read_text(encoding="utf-8")
+        版本[版] = 載入文言(源碼, str(路徑))
+    語 = cast(str, 版本["lib"]["包諸渾沌"](列))
+    變體: dict[str, Callable[[], object]] = {}
+    for 術名, 參 in (("包諸渾沌", 列), ("食諸渾沌", 語)):
+        for 版, 域 in 版本.items():
+            變體[f"{版} {術名}"] = lambda 術=域[術名], 參=參: 術(參)
+    return 測項(
+        名稱="chaos-lib-native",
+        說明=f"{len(列)} records, {len(語.encode('utf-8')) / 1e6:.1f} MB; each lib/py row against its lib row",
+        變體=變體,
+    )
+
+
+@登記("parse-throughput")
+def 解析吞吐測項() -> 測項:
+    """文法分析器 on pre-lexed `wenyan.wy` and on the concatenated examples."""
+
+    根 = Path(__file__).resolve().parents[1]
+
+    def 可析(源碼: str) -> bool:
+        try:
+            wenyan.文法分析器(源碼, "<bench>").解析程式()
+        except wenyan.文法之禍:
+            return False
+        return True
+
+    # 需宏展開之例不能單獨解析，略之。
+    例文 = [
+        路.read_text(encoding="utf-8") for 路 in sorted((根 / "examples").glob("*.wy"))
+    ]
+    輸入 = {
+        "wenyan.wy": (根 / "wenyan.wy").read_text(encoding="utf-8"),
+        "examples/*.wy": "\n".join(文 for 文 in 例文 if 可析(文)),
+    }
+    分析器 = {名: wenyan.文法分析器(文, 名) for 名, 文 in 輸入.items()}
+    符號表 = {id(析): list(析.符號列) for 析 in 分析器.values()}
+
+    def 解析(析: wenyan.文法分析器) -> object:
+        # `是也` 會補插「也」符，故每輪以原符號列重起。
+        析.符號列 = list(符號表[id(析)])
+        析._索引 = 0
+        return 析.解析程式()
+
+    def 吞吐() -> list[str]:
+        行列 = []
+        for 名, 析 in 分析器.items():
+            秒, _ = 測時(lambda 析=析: 解析(析), 3, 3)
+            行列.append(f"  {名:<24} {len(析.符號列) / 秒 / 1e6:12.2f} M tokens/s")
+        return 行列
+
+    return 測項(
+        名稱="parse-throughput",
+        說明="文法分析器.解析程式 over pre-lexed tokens (lexing excluded)",
+        變體={名: lambda 析=析: 解析(析) for 名, 析 in 分析器.items()},
+        附記=吞吐,
+    )
+
+
+@登記("ast-footprint")
+def 語法樹體積測項() -> 測項:
+    """Memory held by the Wenyan AST of `wenyan.wy`, and the time to build it."""
+
+    源碼 = (Path(__file__).resolve().parents[1] / "wenyan.wy").read_text(
+        encoding="utf-8"
+    )
+    析 = wenyan.文法分析器(源碼, "wenyan.wy")
+    符號列 = list(析.符號列)
+
+    def 解析() -> wenyan.程式:
+        析.符號列 = list(符號列)
+        析._索引 = 0
+        return 析.解析程式()
+
+    def 體積() -> list[str]:
+        解析()
+        新列 = list(符號列)
+        tracemalloc.start()
+        try:
+            析.符號列 = 新列
+            析._索引 = 0
+            樹 = 析.解析程式()
+            現存, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        節數 = sum(1 for 子 in wenyan._遍節(樹.句列) if isinstance(子, wenyan.節點))
+        return [
+            (
+                f"  source {len(源碼.encode()) / 1024:8.1f} KiB  nodes {節數:>6,}  "
+                f"AST {現存 / 1024:8.1f} KiB ({現存 / 節數:5.1f} B/node)"
+            )
+        ]
+
+    return 測項(
+        名稱="ast-footprint",
+        說明="build the wenyan.wy AST from pre-lexed tokens; report traced size",
+        變體={"wenyan.wy": 解析},
+        附記=體積,
+    )
+
+
+@登記("import-shake")
+def 方悟測項() -> 測項:
+    """Compiling `方悟` imports of one 術 against whole-module imports."""
+
+    import ast
+
+    主檔 = str(Path(__file__).resolve().parents[1] / "<bench>.wy")
+    源碼表 = {
+        "算經 whole": "吾嘗觀「「算經」」之書。",
+        "算經 方悟「正弦」": "吾嘗觀「「算經」」之書。方悟「正弦」之義。",
+        "曆法 whole": "吾嘗觀「「曆法」」之書。",
+        "曆法 方悟「今日何日」": "吾嘗觀「「曆法」」之書。方悟「今日何日」之義。",
+    }
+
+    def 編譯(源碼: str) -> object:
+        return compile(wenyan.編譯為PythonAST(源碼, 主檔), 主檔, "exec")
+
+    def 節點數() -> list[str]:
+        return [
+            f"  {標籤:<24} {sum(1 for _ in ast.walk(wenyan.編譯為PythonAST(源碼, 主檔)))} AST nodes"
+            for 標籤, 源碼 in 源碼表.items()
+        ]
+
+    return 測項(
+        名稱="import-shake",
+        說明="lex+parse+translate+compile of an import; 方悟 rows emit only the 術 needed",
+        變體={標籤: lambda 源碼=源碼: 編譯(源碼) for 標籤, 源碼 in 源碼表.items()},
+        附記=節點數,
+    )
+
+
+@登記("lazy-import-startup")
+def 惰性匯入測項() -> 測項:
+    """Importing 50 `.wy` modules eagerly versus through `LazyLoader`."""
+
+    import shutil
+    import tempfile
+
+    目錄 = tempfile.mkdtemp(prefix="wenyan-bench-")
+    庫 = Path(__file__).resolve().parents[1] / "lib" / "列經.wy"
+    正文 = 庫.read_text(encoding="utf-8")
+    名單 = [f"惰模組{序}" for 序 in range(50)]
+    for 名 in 名單:
+        (Path(目錄) / f"{名}.wy").write_text(正文, encoding="utf-8")
+    sys.path.insert(0, 目錄)
+
+    def 匯入(惰性: bool, 取用: int) -> None:
+        for 名 in 名單:
+            sys.modules.pop(名, None)
+        模組列: list[Any] = [wenyan.載入文言模組(名, 惰性) for 名 in 名單]
+        for 模組 in 模組列[:取用]:
+            _ = 模組.__file__  # 取屬性以觸發惰性載入
+
+    def 還原() -> list[str]:
+        for 名 in 名單:
+            sys.modules.pop(名, None)
+        sys.path.remove(目錄)
+        shutil.rmtree(目錄)
+        return []
+
+    return 測項(
+        名稱="lazy-import-startup",
+        說明="import 50 copies of lib/列經.wy; lazy rows defer compile+exec to first attribute access",
+        變體={
+            "eager": lambda: 匯入(False, 0),
+            "lazy, none touched": lambda: 匯入(True, 0),
+            "lazy, 5 touched": lambda: 匯入(True, 5),
+            "lazy, all touched": lambda: 匯入(True, 50),
+        },
+        附記=還原,
+    )
+
+
+@登記("wyast-load")
+def 語法樹載入測項() -> 測項:
+    """Front end (preprocess + lex + parse) of `wenyan.wy` against loading its `.wyast`."""
+
+    import shutil
+    import tempfile
+    from unittest import mock
+
+    目錄 = tempfile.mkdtemp(prefix="wenyan-bench-")
+    路徑 = str(Path(目錄) / "wenyan.wy")
+    shutil.copy(Path(__file__).resolve().parents[1] / "wenyan.wy", 路徑)
+    源碼 = Path(路徑).read_text(encoding="utf-8")
+
+    def 前端(快取: bool) -> object:
+        環境 = wenyan._建立編譯環境()
+        環境.語法樹快取 = 快取
+        return wenyan._解析前處理(源碼, 路徑, 環境)
+
+    with mock.patch.object(sys, "dont_write_bytecode", False):
+        前端(True)
+    快取檔 = cast(str, wenyan._語法樹快取檔(路徑))
+    資料 = wenyan.序列化語法樹(wenyan.解析(源碼, 路徑), 源碼)
+
+    def 體積() -> list[str]:
+        行 = (
+            f"  source {len(源碼.encode()) / 1024:8.1f} KiB  "
+            f".wyast {len(資料) / 1024:8.1f} KiB  "
+            f"cache file {Path(快取檔).stat().st_size / 1024:8.1f} KiB"
+        )
+        shutil.rmtree(目錄)
+        return [行]
+
+    return 測項(
+        名稱="wyast-load",
+        說明="wenyan.wy: preprocess+lex+parse vs .wyast cache hit vs 反序列化語法樹",
+        變體={
+            "preprocess+lex+parse": lambda: 前端(False),
+            "front end, .wyast hit": lambda: 前端(True),
+            "反序列化語法樹": lambda: wenyan.反序列化語法樹(資料),
+            "惰性, first stmt only": lambda: wenyan.反序列化語法樹(
+                資料, 惰性=True
+            ).句列[0],
+        },
+        附記=體積,
+    )
+
+
+@登記("semantic-pass")
+def 語意分析測項() -> 測項:
+    """The translator's single semantic pass over `wenyan.wy` and a deeply nested program."""
+
+    源碼 = (Path(__file__).resolve().parents[1] / "wenyan.wy").read_text(
+        encoding="utf-8"
+    )
+    樹 = wenyan.解析(源碼, "wenyan.wy")
+    體: list[wenyan.句] = [wenyan.乃止句(0, 0)]
+    for _ in range(3000):
+        體 = [wenyan.若句(0, 0, [], False, 體, [], [])]
+    深巢 = [wenyan.恆為是句(0, 0, 體)]
+
+    return 測項(
+        名稱="semantic-pass",
+        說明="scopes, name validity, binding sites and loop depth in one iterative walk",
+        變體={
+            "wenyan.wy": lambda: wenyan._語意分析(樹.句列),
+            "若 nested 3000 deep": lambda: wenyan._語意分析(深巢),
+        },
+    )
+
+
+@登記("translate-throughput")
+def 轉譯吞吐測項() -> 測項:
+    """PythonAST轉譯器 on large generated programs, parsing excluded."""
+
+    段 = (
+        "加「甲」以一。昔之「甲」者。今其是矣。"
+        "若「甲」大於三者。昔之「甲」者。今零是矣。若非。充「列」以「甲」。云云。"
+        "為是二遍。減「甲」以一。昔之「甲」者。今其是矣。若「甲」等於零者乃止也。云云。"
+        "夫「列」之長。名之曰「長」。"
+    )
+    首 = "吾有一數。曰零。名之曰「甲」。吾有一列。名之曰「列」。\n"
+    輸入 = {f"{段數:,} blocks": 首 + "\n".join([段] * 段數) for 段數 in (500, 5000)}
+    程表 = {名: wenyan.解析(文, "<bench>") for 名, 文 in 輸入.items()}
+
+    def 轉譯(名: str) -> object:
+        return wenyan.轉譯為PythonAST(程表[名], 輸入[名], "<bench>")
+
+    def 吞吐() -> list[str]:
+        行列 = []
+        for 名, 程 in 程表.items():
+            句數 = sum(1 for 子 in wenyan._遍節(程.句列) if isinstance(子, wenyan.句))
+            秒, _ = 測時(lambda 名=名: 轉譯(名), 3, 1)
+            行列.append(f"  {名:<24} {句數 / 秒 / 1e3:12.1f} k statements/s")
+        return 行列
+
+    return 測項(
+        名稱="translate-throughput",
+        說明="轉譯為PythonAST over generated 昔今/若/為是 blocks",
+        變體={名: lambda 名=名: 轉譯(名) for 名 in 程表},
+        附記=吞吐,
+    )
+
+
+def 解析參數(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse CLI arguments."""
+
+    parser = argparse.ArgumentParser(description="Wenyan 生成碼/執行期 helper 微基準。")
+    parser.add_argument(
+        "--case",
+        action="append",
+        choices=sorted(測項登記),
+        help="僅執行指定測項（可重複；預設全部）。",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="重複輪數，取最佳（預設：5）。"
+    )
+    parser.add_argument(
+        "--number", type=int, default=0, help="每輪呼叫次數；0 表示自動（預設：0）。"
+    )
+    return parser.parse_args(list(argv))
+
+
+def 測時(函: Callable[[], object], 輪數: int, 次數: int) -> tuple[float, int]:
+    """Return (best seconds per call, calls per round)."""
+
+    計時器 = timeit.Timer(函)
+    if 次數 <= 0:
+        次數, _ = 計時器.autorange()
+    最佳 = min(計時器.repeat(repeat=輪數, number=次數))
+    return 最佳 / 次數, 次數
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Program entrypoint."""
+
+    參數 = 解析參數(sys.argv[1:] if argv is None else argv)
+    名單 = 參數.case or list(測項登記)
+    for 名 in 名單:
+        項 = 測項登記[名]()
+        print(f"[{項.名稱}] {項.說明}")
+        基準: float | None = None
+        for 標籤, 函 in 項.變體.items():
+            秒, 次數 = 測時(函, 參數.repeat, 參數.number)
+            基準 = 秒 if 基準 is None else 基準
+            print(
+                f"  {標籤:<24} {秒 * 1e6:12.2f} µs/call  x{基準 / 秒:6.2f}  (n={次數})"
+            )
+        if 項.附記 is not None:
+            for 行 in 項.附記():
+                print(行)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,3 +1,4 @@
+import ast
 import io
 import unittest
 from contextlib import redirect_stdout
@@ -42,6 +43,269 @@ class 語法樹轉譯測試(unittest.TestCase):
         )
         self.assertEqual(輸出, "3\n")
 
+    def test_型別已證之列下標直取(self):
+        源碼 = (
+            "吾有一列。名之曰「甲」。充「甲」以三。以五。"
+            "有數二。名之曰「乙」。夫「甲」之「乙」。書之。"
+            "昔之「甲」之「乙」者。今九是矣。夫「甲」之二。書之。"
+            "夫「甲」之四。書之。"
+        )
+        程式碼 = ast.unparse(wenyan.編譯為PythonAST(源碼, "<測試>"))
+        self.assertIn("甲[乙 - 1] if 0 < 乙 <= len(甲) else 取物(甲, 乙)", 程式碼)
+        self.assertIn("甲[1] if len(甲) >= 2 else None", 程式碼)
+        self.assertNotIn("文言轉整(乙", 程式碼)
+        self.assertNotIn("isinstance(甲, list)", 程式碼)
+        self.assertEqual(self._執行(源碼), "5\n9\nNone\n")
+
+    def test_型別未證仍走通用路徑(self):
+        源碼 = (
+            "吾有一術。名之曰「取」。欲行是術。必先得一元。曰「甲」。一數。曰「乙」。"
+            "乃行是術曰。夫「甲」之「乙」。乃得矣。是謂「取」之術也。"
+            "吾有一列。名之曰「丙」。充「丙」以七。"
+            "施「取」於「丙」。於一。書之。"
+        )
+        程式碼 = ast.unparse(wenyan.編譯為PythonAST(源碼, "<測試>"))
+        self.assertIn("取物(甲, 文言轉整(乙, 0))", 程式碼)
+        self.assertEqual(self._執行(源碼), "7\n")
+
+    def test_參數宣告之型不足為證(self):
+        源碼 = (
+            "吾有一術。名之曰「首」。欲行是術。必先得一列。曰「甲」。乃行是術曰。"
+            "夫「甲」之一。乃得矣。是謂「首」之術也。"
+            "吾有一術。名之曰「改」。欲行是術。必先得一列。曰「甲」。乃行是術曰。"
+            "昔之「甲」之一者。今「「新」」是矣。乃得「甲」。是謂「改」之術也。"
+            "吾有一物。其物如是。物之「「乙」」者。數曰三。是謂「丙」之物也。"
+            "施「首」於「丙」。書之。"
+            "施「改」於「丙」。書之。"
+        )
+        self.assertEqual(self._執行(源碼), "{} None\n{'乙': 3, 0: '新'}\n")
+
+    def test_術為單一文言術物件(self):
+        源碼 = (
+            "吾有一術。名之曰「加」。欲行是術。必先得二數。曰「甲」。曰「乙」。"
+            "乃行是術曰。加「甲」以「乙」。乃得其。是謂「加」之術也。"
+            "施「加」於一。名之曰「增」。施「增」於五。書之。"
+            "吾有一術。名之曰「造」。欲行是術。必先得一數。曰「甲」。乃行是術曰。"
+            "乃得「加」。是謂「造」之術也。"
+            "施「造」於零。於二。於三。書之。"
+        )
+        模組樹 = wenyan.編譯為PythonAST(源碼, "<測試>")
+        程式碼 = ast.unparse(模組樹)
+        self.assertIn("加 = 文言術(", 程式碼)
+        self.assertNotIn("__文言術參數數__", 程式碼)
+        self.assertNotIn("調用", 程式碼)
+        self.assertEqual(self._執行(源碼), "6\n5\n")
+
+    def test_小術於施處展開(self):
+        源碼 = (
+            "吾有一數。曰零。名之曰「計」。"
+            "吾有一術。名之曰「方和」。欲行是術。必先得二數。曰「甲」。曰「乙」。"
+            "乃行是術曰。加「甲」以「乙」。名之曰「丙」。乘「丙」以「丙」。乃得其。"
+            "是謂「方和」之術也。"
+            "吾有一術。名之曰「記」。欲行是術。必先得一數。曰「甲」。乃行是術曰。"
+            "昔之「計」者。今「甲」是矣。乃得「甲」。是謂「記」之術也。"
+            "吾有一術。名之曰「階」。欲行是術。必先得一數。曰「甲」。乃行是術曰。"
+            "若「甲」不大於一者。乃得一。云云。"
+            "減「甲」以一。施「階」於其。乘其以「甲」。乃得其。是謂「階」之術也。"
+            "施「方和」於二。於一。書之。"
+            "吾有一數。曰三。名之曰「丁」。夫「丁」。施「方和」於「丁」。於其。書之。"
+            "施「記」於五。夫「計」。書之。施「階」於四。書之。"
+        )
+        程式碼 = ast.unparse(wenyan.編譯為PythonAST(源碼, "<測試>"))
+        self.assertNotIn("方和(", 程式碼)
+        self.assertIn("記(5)", 程式碼)
+        self.assertIn("階(4)", 程式碼)
+        self.assertEqual(self._執行(源碼), "9\n36\n5 5\n24\n")
+
+        環境 = wenyan._建立編譯環境()
+        環境.內聯 = False
+        程, 處理後 = wenyan._解析前處理(源碼, "<測試>", 環境)
+        程式碼 = ast.unparse(wenyan.轉譯為PythonAST(程, 處理後, "<測試>", 環境))
+        self.assertIn("方和(2, 1)", 程式碼)
+
+    def test_宿主表式提升與純算lambda折疊(self):
+        源碼 = (
+            "施「__import__」於「「math」」。名之曰「算具」。"
+            "吾有一術。名之曰「加」。欲行是術。必先得一數。曰「甲」。乃行是術曰。"
+            "施「(lambda y: 甲 + y)」於一。名之曰「乙」。"
+            "施「(lambda x: x * 2)」於「乙」。名之曰「丙」。"
+            "施「算具.floor」於「丙」。乃得矣。是謂「加」之術也。"
+            "施「加」於四。書之。"
+            "施「(lambda x, y: x - y)」於九。於二。書之。"
+            "施「(lambda x: [x])」於九。書之。"
+        )
+        程式碼 = ast.unparse(wenyan.編譯為PythonAST(源碼, "<測試>"))
+        self.assertIn("(lambda y: 甲 + y)(1)", 程式碼)
+        self.assertIn("= 算具.floor\n", 程式碼)
+        self.assertNotIn("算具.floor(", 程式碼)
+        self.assertIn("9 - 2", 程式碼)
+        self.assertNotIn("(lambda x: [x])(9)", 程式碼)
+        self.assertEqual(self._執行(源碼), "10\n7\n[9]\n")
+
+        # 柯里化者不折，與未折時同為 f(9, 2)。
+        柯里 = "施「(lambda x: lambda y: x - y)」於九。於二。書之。"
+        self.assertNotIn("9 - 2", ast.unparse(wenyan.編譯為PythonAST(柯里, "<測試>")))
+        with self.assertRaises(TypeError):
+            self._執行(柯里)
+
+    def test_迴圈累加之言以串列合之(self):
+        源碼 = (
+            "吾有一術。名之曰「連」。欲行是術。必先得一數。曰「次」。一言。曰「源」。乃行是術曰。"
+            "吾有一言。名之曰「文」。吾有一列。名之曰「段列」。有數一。名之曰「讀」。"
+            "為是「次」遍。"
+            "夫「源」之「讀」。加其於「文」。昔之「文」者。今其是矣。"
+            "若「文」之長等於三者。充「段列」以「文」。昔之「文」者。今「「」」是矣。云云。"
+            "加「文」以「「·」」。昔之「文」者。今其是矣。"
+            "加「讀」以一。昔之「讀」者。今其是矣。"
+            "云云。"
+            "充「段列」以「文」。乃得「段列」。"
+            "是謂「連」之術也。"
+            "施「連」於五。於「「甲乙丙丁戊」」。書之。"
+            "施「連」於零。於「「甲」」。書之。"
+        )
+        程式碼 = ast.unparse(wenyan.編譯為PythonAST(源碼, "<測試>"))
+        self.assertIn("文 = ''.join(__段", 程式碼)
+        self.assertIn(".append('·')", 程式碼)
+        self.assertNotIn("append(文 + ", 程式碼)
+        self.assertEqual(self._執行(源碼), "['甲·乙', '·丙·丁·戊·']\n['']\n")
+
+    def test_巢狀迴圈累加之言外層讀時先合(self):
+        源碼 = (
+            "吾有一術。名之曰「連」。乃行是術曰。"
+            "吾有一言。曰「「」」。名之曰「段」。"
+            "吾有一言。曰「「」」。名之曰「總」。"
+            "為是三遍。"
+            "為是一遍。加「段」以「「abc」」。昔之「段」者。今其是矣。云云。"
+            "加「總」以「段」。昔之「總」者。今其是矣。"
+            "云云。"
+            "乃得「總」。"
+            "是謂「連」之術也。"
+            "施「連」。書之。"
+        )
+        self.assertEqual(self._執行(源碼), "abc" * 6 + "\n")
+
+    def test_迴圈累加非言仍如原句拋錯(self):
+        源碼 = (
+            "吾有一術。名之曰「連」。欲行是術。乃行是術曰。"
+            "吾有一言。名之曰「文」。"
+            "為是三遍。加「文」以一。昔之「文」者。今其是矣。云云。"
+            "乃得「文」。"
+            "是謂「連」之術也。"
+            "施「連」。書之。"
+        )
+        with self.assertRaisesRegex(TypeError, "can only concatenate str"):
+            self._執行(源碼)
+
+    def test_列操作以單次配置生成(self):
+        源碼 = (
+            "吾有三列。名之曰「甲」曰「乙」曰「丙」。"
+            "充「甲」以一以二。充「乙」以三。充「丙」以四以五以六。"
+            "銜「甲」以「乙」以「丙」。名之曰「丁」。"
+            "吾有一術。名之曰「減」。欲行是術。必先得二數。曰「子」曰「丑」。乃行是術曰。"
+            "減「子」以「丑」。乃得其。是謂「減」之術也。"
+            "夫「丁」之長。夫一。取二以施「減」。書之。"
+            "夫「丁」。書之。"
+        )
+        程式碼 = ast.unparse(wenyan.編譯為PythonAST(源碼, "<測試>"))
+        self.assertIn("丙.extend((4, 5, 6))", 程式碼)
+        self.assertIn("乙.append(3)", 程式碼)
+        self.assertRegex(程式碼, r"__銜\w+ = 甲 \+ 乙\n\s*__銜\w+ \+= 丙")
+        self.assertIn("減(len(丁), 1)", 程式碼)
+        self.assertEqual(self._執行(源碼), "5\n[1, 2, 3, 4, 5, 6]\n")
+
+    def test_句首分派之禍訊(self):
+        for 源碼, 訊息 in (
+            ("云云。", "不當之終"),
+            ("是術曰。", "術體不可獨立"),
+            ("以「甲」。", "不識之句"),
+            ("曰一。", "不識之句"),
+        ):
+            with self.subTest(源碼=源碼):
+                with self.assertRaisesRegex(wenyan.文法之禍, 訊息):
+                    wenyan.文法分析器(源碼).解析程式()
+
+    def test_語意分析深巢不逾遞迴上限(self):
+        止 = wenyan.乃止句(0, 0)
+        改 = wenyan.昔今句(0, 0, "甲", None, wenyan.數值(0, 0, "一"), None, False)
+        術 = wenyan.術定義句(0, 0, "乙", [], [改], False)
+        體: list[wenyan.句] = [止, 術]
+        for _ in range(5000):
+            體 = [wenyan.若句(0, 0, [], False, 體, [], [])]
+        宣 = wenyan.宣告句(0, 0, 1, "數", [], ["甲", "if"], False)
+        表 = wenyan._語意分析([宣, wenyan.恆為是句(0, 0, 體)])
+        self.assertEqual(表.迴圈深[id(止)], 1)
+        self.assertEqual(表.迴圈深[id(改)], 0)
+        self.assertEqual(表.作用域[id(術)].全域, {"甲"})
+        self.assertEqual(表.劣名, {"if"})
+        self.assertEqual(表.定義["乙"], [術])
+
+    def test_乃止須在迴圈之中(self):
+        with self.assertRaisesRegex(wenyan.文法之禍, "乃止不在迴圈之中"):
+            wenyan.編譯為PythonAST("若陽者。乃止。云云。", "<測試>")
+        with self.assertRaisesRegex(wenyan.文法之禍, "乃止不在迴圈之中"):
+            wenyan.編譯為PythonAST(
+                "恆為是。吾有一術。名之曰「甲」。是術曰。乃止是遍。是謂「甲」之術也。云云。",
+                "<測試>",
+            )
+
+    def test_句轉譯表遍及諸句類且可於子類改寫(self):
+        句類 = {
+            類
+            for 類 in wenyan._語法樹類列
+            if issubclass(類, wenyan.句) and 類 is not wenyan.句
+        }
+        self.assertEqual(set(wenyan.PythonAST轉譯器._句轉譯表), 句類)
+
+        class 改噫轉譯器(wenyan.PythonAST轉譯器):
+            _句轉譯表 = {
+                **wenyan.PythonAST轉譯器._句轉譯表,
+                wenyan.噫句: lambda 己, 節: [ast.Expr(value=ast.Constant(value="噫"))],
+            }
+
+        程 = wenyan.解析("夫一。噫。", "<測試>")
+        模組 = 改噫轉譯器("夫一。噫。", "<測試>", 插入序言=False).轉譯(程)
+        self.assertIn("'噫'", ast.unparse(模組))
+
+    def test_句與宿主式標其文言源碼位置(self):
+        源碼 = (
+            "吾有一數。曰三。名之曰「甲」。\n"
+            "吾有一言。曰「「乙」」。書之。\n"
+            "除「甲」以零。名之曰「丙」。\n"
+        )
+        模組 = wenyan.編譯為PythonAST(源碼, "<測試>")
+        行列 = {
+            節.lineno for 節 in ast.walk(模組) if isinstance(節, (ast.stmt, ast.expr))
+        }
+        self.assertLessEqual(行列, {0, 1, 2, 3})
+        首句 = next(
+            節 for 節 in ast.walk(模組) if isinstance(節, ast.Assign) and 節.lineno > 0
+        )
+        self.assertEqual((首句.lineno, 首句.col_offset, 首句.end_lineno), (1, 0, 1))
+        try:
+            with redirect_stdout(io.StringIO()):
+                exec(compile(模組, "<測試>", "exec"), {})
+        except ZeroDivisionError as 禍:
+            框 = 禍.__traceback__
+        else:
+            self.fail("除零未拋錯")
+        while 框.tb_next is not None:
+            框 = 框.tb_next
+        self.assertEqual(框.tb_lineno, 3)
+
+        宿主 = wenyan.編譯為PythonAST(
+            "吾有一數。曰三。\n施「str.upper」於「「乙」」。書之。"
+        )
+        屬性 = [
+            節
+            for 節 in ast.walk(宿主)
+            if isinstance(節, ast.Attribute) and 節.attr == "upper"
+        ]
+        self.assertEqual(len(屬性), 1)
+        self.assertEqual(
+            (屬性[0].lineno, 屬性[0].col_offset, 屬性[0].end_col_offset),
+            (2, len("施".encode()), len("施「str.upper」".encode())),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,7 @@
+import ast
 import io
+import json
+import sys
 import tempfile
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
@@ -44,6 +47,87 @@ class 命令列選項測試(unittest.TestCase):
         self.assertEqual(標準出.getvalue(), "1\n")
         self.assertEqual(標準誤.getvalue(), "")
 
+    def test_不緩衝選項逐句清出(self) -> None:
+        class 計清(io.StringIO):
+            次數 = 0
+
+            def flush(self) -> None:
+                type(self).次數 += 1
+                super().flush()
+
+        with tempfile.TemporaryDirectory() as 目錄:
+            路徑 = Path(目錄) / "例.wy"
+            路徑.write_text("為是三遍。吾有一數。曰一。書之。云云。", encoding="utf-8")
+
+            標準出 = 計清()
+            with redirect_stdout(標準出):
+                結果 = wenyan.主術(["--unbuffered", str(路徑)])
+
+        self.assertEqual(結果, 0)
+        self.assertEqual(標準出.getvalue(), "一\n一\n一\n")
+        self.assertGreaterEqual(計清.次數, 3)
+
+    def test_預設以漢字記數輸出(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            路徑 = Path(目錄) / "例.wy"
+            路徑.write_text(
+                "吾有三數。曰三。曰一萬零五。曰負一又五分。書之。"
+                "吾有一言。曰「「九」」。吾有一爻。曰陽。書之。"
+                "吾有一列。名之曰「甲」。充「甲」以一以二。夫「甲」。書之。",
+                encoding="utf-8",
+            )
+
+            標準出 = io.StringIO()
+            with redirect_stdout(標準出):
+                結果 = wenyan.主術([str(路徑)])
+
+        self.assertEqual(結果, 0)
+        self.assertEqual(
+            標準出.getvalue(), "三 一萬零五 負一又五分\n九 陽\n[ 1, 2 ]\n"
+        )
+
+    def test_說明型別推斷結果(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            路徑 = Path(目錄) / "例.wy"
+            路徑.write_text(
+                "吾有一列。名之曰「甲」。除十以四。名之曰「乙」。"
+                "吾有一術。名之曰「倍」。欲行是術。必先得一數。曰「丙」。乃行是術曰。"
+                "乘「丙」以二。名之曰「丁」。乃得「丁」。是謂「倍」之術也。"
+                "施「倍」於三。名之曰「戊」。",
+                encoding="utf-8",
+            )
+
+            標準出 = io.StringIO()
+            with redirect_stdout(標準出):
+                結果 = wenyan.主術(["--explain-types", str(路徑)])
+
+        self.assertEqual(結果, 0)
+        self.assertEqual(
+            標準出.getvalue().splitlines(),
+            [
+                "「甲」：列",
+                "「乙」：浮",
+                "「倍」：術 → 數|言|列",
+                "「倍」之「丙」：任",
+                "「倍」之「丁」：數|言|列",
+                "「戊」：數|言|列",
+            ],
+        )
+
+    def test_二進位語法樹輸出可復原(self) -> None:
+        源碼 = "吾有一數。曰三。名之曰「甲」。加「甲」以一。書之。"
+        with tempfile.TemporaryDirectory() as 目錄:
+            路徑 = Path(目錄) / "例.wy"
+            路徑.write_text(源碼, encoding="utf-8")
+
+            位元組 = io.BytesIO()
+            標準出 = io.TextIOWrapper(位元組, encoding="utf-8")
+            with redirect_stdout(標準出):
+                結果 = wenyan.主術(["--wyast-bin", str(路徑)])
+
+        self.assertEqual(結果, 0)
+        self.assertEqual(wenyan.反序列化語法樹(位元組.getvalue()), wenyan.解析(源碼))
+
     def test_不輸出漢字陣列格式與官版相容(self) -> None:
         充語 = "".join(f"充「甲」以{值}。" for 值 in ["十二", "六", "三", "十", "五", "十六", "八", "四", "二", "一", "一"])
         源碼 = f"吾有一列。名之曰「甲」。{充語}夫「甲」。書之。"
@@ -71,12 +155,86 @@ class 命令列選項測試(unittest.TestCase):
         )
         self.assertEqual(實得, "[ 1, None, 3 ]\n")
 
+    def test_輸出格式速路與通則逐字相同(self) -> None:
+        _, 執行域 = self._執行文言("噫。")
+        格式 = 執行域["__輸出格式值"]
+
+        class 子列(list):
+            pass
+
+        純量列 = [
+            0, -7, 12345678901234, 2.5, 3.0, -0.125, 1e20, float("inf"),
+            True, False, None, "", "言", "多行\n言", "長" * 40,
+        ]
+        for 長度 in range(7):
+            for 起 in range(len(純量列)):
+                列值 = [純量列[(起 + i * 3) % len(純量列)] for i in range(長度)]
+                for 縮排 in (0, 2, 30, 60):
+                    with self.subTest(列值=列值, 縮排=縮排):
+                        self.assertEqual(
+                            格式(列值, 縮排), 格式(子列(列值), 縮排)
+                        )
+
     def test_JSON_stringify整數浮點輸出整數(self) -> None:
         _, 執行域 = self._執行文言("")
         JSON類 = 執行域["JSON"]
         實得 = JSON類.stringify({"甲": 1.0, "乙": [2.0, 2.5]})
         self.assertEqual(實得, "{\"甲\":1,\"乙\":[2,2.5]}")
 
+    def test_逐行剖析計次並寫JSON(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            路徑 = Path(目錄) / "例.wy"
+            JSON路徑 = Path(目錄) / "剖.json"
+            路徑.write_text(
+                "吾有一數。曰零。名之曰「甲」。\n"
+                "為是三遍。\n"
+                "加「甲」以一。昔之「甲」者。今其是矣。\n"
+                "云云。\n"
+                "夫「甲」。書之。\n",
+                encoding="utf-8",
+            )
+
+            標準出 = io.StringIO()
+            標準誤 = io.StringIO()
+            with redirect_stdout(標準出), redirect_stderr(標準誤):
+                結果 = wenyan.主術(
+                    ["--profile-lines", "--profile-json", str(JSON路徑), str(路徑)]
+                )
+            剖 = json.loads(JSON路徑.read_text(encoding="utf-8"))
+
+        self.assertEqual(結果, 0)
+        self.assertEqual(標準出.getvalue(), "三\n")
+        次數 = {項["行"]: 項["次"] for 項 in 剖["檔"][str(路徑)]}
+        self.assertEqual(次數[1], 1)
+        self.assertEqual(次數[3], 3)
+        self.assertEqual(次數[5], 1)
+        self.assertNotIn(0, 次數)
+        self.assertNotIn(4, 次數)
+        self.assertIn("最熱之行", 標準誤.getvalue())
+        self.assertIn("加「甲」以一。昔之「甲」者。今其是矣。", 標準誤.getvalue())
+
+    @unittest.skipUnless(hasattr(sys, "monitoring"), "唯 3.12+ 有 sys.monitoring")
+    def test_逐行剖析不佔他者之工具號(self) -> None:
+        監 = getattr(sys, "monitoring")
+        樹 = ast.parse("甲 = 0\nfor 乙 in range(3):\n    甲 += 乙\n")
+        for 他佔 in ([監.PROFILER_ID], [監.PROFILER_ID, 3, 4]):
+            with self.subTest(他佔=他佔):
+                for 號 in 他佔:
+                    監.use_tool_id(號, "他")
+                try:
+                    for _ in range(2):
+                        剖析器 = wenyan.文言行剖析器(["<剖>"])
+                        程式碼 = 剖析器.編譯(樹, "<剖>")
+                        with 剖析器:
+                            exec(程式碼, {})
+                        次數 = {行: 項[0] for (_, 行), 項 in 剖析器._計.items()}
+                        self.assertEqual(次數, {1: 1, 2: 4, 3: 3})
+                    for 號 in 他佔:
+                        self.assertEqual(監.get_tool(號), "他")
+                finally:
+                    for 號 in 他佔:
+                        監.free_tool_id(號)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import wenyan
 
@@ -104,6 +105,85 @@ class 匯入橋接測試(unittest.TestCase):
         self.assertEqual(_尋者數(), 0)
         wenyan.安裝文言匯入鉤子()
 
+    def test_尋者快取目錄清單(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = str(Path(目錄).resolve())
+            原列 = wenyan.os.listdir
+            列次: list[str] = []
+
+            def 計列(路: str = ".") -> list[str]:
+                if 路 == 根:
+                    列次.append(路)
+                return 原列(路)
+
+            sys.path.insert(0, 根)
+            try:
+                with mock.patch.object(wenyan.os, "listdir", 計列):
+                    for _ in range(3):
+                        with self.assertRaises(ImportError):
+                            importlib.import_module("未有之模組")
+                    self.assertEqual(len(列次), 1)
+
+                    (Path(根) / "未有之模組.wy").write_text(
+                        "吾有一數。曰五。名之曰「乙」。", encoding="utf-8"
+                    )
+                    importlib.invalidate_caches()
+                    模組 = importlib.import_module("未有之模組")
+                self.assertEqual(getattr(模組, "乙", None), 5)
+            finally:
+                self._清模組("未有之模組")
+                sys.path.remove(根)
+
+    def test_惰性載入至取屬性方編譯(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            (根 / "惰甲.wy").write_text(
+                "吾有一數。曰七。名之曰「乙」。", encoding="utf-8"
+            )
+            (根 / "惰丙.wy").write_text(
+                "吾有一數。曰八。名之曰「丁」。", encoding="utf-8"
+            )
+            (根 / "惰戊.wy").write_text(
+                "吾有一數。曰九。名之曰「己」。", encoding="utf-8"
+            )
+            sys.path.insert(0, str(根))
+            原編譯 = wenyan.編譯為PythonAST
+            編譯次: list[str] = []
+
+            def 計編譯(源碼: str, 文檔名: str = "<源>") -> object:
+                編譯次.append(文檔名)
+                return 原編譯(源碼, 文檔名)
+
+            名單 = ("惰甲", "惰丙", "惰戊")
+            try:
+                for 名 in 名單:
+                    self._清模組(名)
+                with mock.patch.object(wenyan, "編譯為PythonAST", 計編譯):
+                    甲 = wenyan.載入文言模組("惰甲", 惰性=True)
+                    戊 = wenyan.載入文言模組("惰戊", 惰性=True)
+                    self.assertEqual(編譯次, [])
+                    # 惰性唯及所請之模組，他處之匯入仍即時載入。
+                    丙 = importlib.import_module("惰丙")
+                    self.assertEqual(len(編譯次), 1)
+                    self.assertEqual(getattr(甲, "乙", None), 7)
+                    self.assertEqual(len(編譯次), 2)
+                    self.assertEqual(wenyan.盡載文言模組(), 1)
+                    self.assertEqual(len(編譯次), 3)
+                    self.assertEqual(wenyan.盡載文言模組(), 0)
+                self.assertEqual(getattr(丙, "丁", None), 8)
+                self.assertEqual(getattr(戊, "己", None), 9)
+            finally:
+                for 名 in 名單:
+                    self._清模組(名)
+                sys.path.remove(str(根))
+
+    def test_尋者居PathFinder之前(self) -> None:
+        尋者位 = next(
+            序 for 序, 尋者 in enumerate(sys.meta_path)
+            if isinstance(尋者, wenyan.文言模組尋者)
+        )
+        self.assertIs(sys.meta_path[尋者位 + 1], importlib.machinery.PathFinder)
+
 
 if __name__ == "__main__":
     unittest.main()
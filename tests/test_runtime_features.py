@@ -1,3 +1,4 @@
+import ast
 import io
 import os
 import tempfile
@@ -5,6 +6,8 @@ import textwrap
 import unittest
 from contextlib import redirect_stdout
 from pathlib import Path
+from typing import Any
+from unittest import mock
 
 import wenyan
 
@@ -141,6 +144,166 @@ class 執行測試(unittest.TestCase):
             輸出 = self._執行檔案(主檔)
             self.assertEqual(輸出, "嘿\n書「甲」焉\n")
 
+    def test_語法樹序列化往返且可惰性復原(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            吾有一術。名之曰「倍」。欲行是術。必先得一數。曰「甲」。乃行是術曰。
+            	乘「甲」以二。名之曰「乙」。
+            	若「乙」大於十者。乃得「乙」。若非。乃得零。云云。
+            是謂「倍」之術也。
+            吾有一物。名之曰「丙」。其物如是。物之「「丁」」者。言曰「「戊」」。是謂「丙」之物也。
+            施「倍」於九。書之。
+            """
+        ).strip()
+        程 = wenyan.解析(源碼)
+        資料 = wenyan.序列化語法樹(程, 源碼)
+        self.assertEqual(wenyan.反序列化語法樹(資料), 程)
+
+        惰程 = wenyan.反序列化語法樹(資料, 惰性=True)
+        self.assertEqual(len(惰程.句列), len(程.句列))
+        self.assertEqual(惰程.句列[-1], 程.句列[-1])
+        self.assertIs(惰程.句列[-1], 惰程.句列[-1])
+        self.assertEqual(list(惰程.句列), 程.句列)
+
+        for 壞 in (b"", b"WYAST", 資料[:5] + b"\xff" + 資料[6:], 資料[:-8]):
+            with self.assertRaises(ValueError):
+                wenyan.反序列化語法樹(壞)
+
+    def test_語法樹快取免前處理且隨依據失效(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            宏經 = 根 / "宏經.wy"
+            宏經.write_text(
+                "或云「「書「甲」焉」」。蓋謂「「吾有一言。曰「甲」。書之」」。", encoding="utf-8"
+            )
+            主檔 = 根 / "主.wy"
+            主檔.write_text("吾嘗觀「「宏經」」之書。\n書「「嘿」」焉。", encoding="utf-8")
+            原前處理 = wenyan._前處理
+            前處理次: list[str] = []
+
+            def 計前處理(內容: str, 文檔名: str, 環境: Any) -> Any:
+                前處理次.append(文檔名)
+                return 原前處理(內容, 文檔名, 環境)
+
+            with (
+                mock.patch.object(wenyan.sys, "dont_write_bytecode", False),
+                mock.patch.object(wenyan, "_前處理", 計前處理),
+            ):
+                self.assertEqual(self._執行檔案(主檔), "嘿\n")
+                self.assertTrue((根 / "__pycache__" / "主.wyast").is_file())
+                self.assertEqual(self._執行檔案(主檔), "嘿\n")
+                self.assertEqual(前處理次.count(str(主檔)), 1)
+
+                宏經.write_text(
+                    "或云「「書「甲」焉」」。蓋謂「「吾有一言。曰「甲」。書之。書之」」。",
+                    encoding="utf-8",
+                )
+                self.assertEqual(self._執行檔案(主檔), "嘿\n\n")
+                self.assertEqual(前處理次.count(str(主檔)), 2)
+
+    def test_方悟僅出所需之術(self) -> None:
+        庫源 = textwrap.dedent(
+            """
+            吾有一數。曰三。名之曰「底」。
+            吾有一列。名之曰「表」。
+            充「表」以「底」。
+            吾有一術。名之曰「甲」。欲行是術。必先得一數。曰「數」。乃行是術曰。
+            \t加「數」以「底」。乃得矣。
+            是謂「甲」之術也。
+            吾有一術。名之曰「乙」。欲行是術。必先得一數。曰「數」。乃行是術曰。
+            \t施「甲」於「數」。乘其以二。乃得矣。
+            是謂「乙」之術也。
+            吾有一術。名之曰「丙」。欲行是術。乃行是術曰。
+            \t乃得「表」。
+            是謂「丙」之術也。
+            """
+        ).strip()
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            (根 / "小經.wy").write_text(庫源, encoding="utf-8")
+            主檔 = str(根 / "主.wy")
+
+            def 執行(源碼: str) -> dict[str, object]:
+                模組樹 = wenyan.編譯為PythonAST(源碼, 主檔)
+                作用域: dict[str, object] = {"__name__": "__main__"}
+                with redirect_stdout(io.StringIO()):
+                    exec(compile(模組樹, 主檔, "exec"), 作用域)
+                return 作用域
+
+            作用域 = 執行("吾嘗觀「「小經」」之書。方悟「乙」之義。")
+            self.assertIn("甲", 作用域)
+            self.assertIn("底", 作用域)
+            self.assertNotIn("丙", 作用域)
+            self.assertNotIn("表", 作用域)
+
+            # 再匯入所需及程式所提及而未方悟之名，皆於首次匯入處出之，其後之匯入不出一句。
+            源碼 = textwrap.dedent(
+                """
+                吾嘗觀「「小經」」之書。方悟「甲」之義。
+                吾嘗觀「「小經」」之書。方悟「丙」之義。
+                施「丙」。名之曰「丁」。
+                施「乙」於一。名之曰「戊」。
+                """
+            ).strip()
+            作用域 = 執行(源碼)
+            self.assertEqual(作用域.get("丁"), [3])
+            self.assertEqual(作用域.get("戊"), 8)
+            # 內聯之句標以匯入句之位置，故「丙」之定義當在第一行。
+            丙行 = [
+                節.lineno
+                for 節 in ast.walk(wenyan.編譯為PythonAST(源碼, 主檔))
+                if isinstance(節, ast.Assign)
+                and any(isinstance(標, ast.Name) and 標.id == "丙" for 標 in 節.targets)
+            ]
+            self.assertEqual(丙行, [1])
+
+    def test_方悟之模組頂層於首次匯入處一次出之(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            (根 / "計經.wy").write_text(
+                "吾有一數。曰一。名之曰「計」。吾有一數。曰「計」。名之曰「副」。",
+                encoding="utf-8",
+            )
+            (根 / "改經.wy").write_text(
+                "吾嘗觀「「計經」」之書。方悟「計」之義。昔之「計」者。今五是矣。",
+                encoding="utf-8",
+            )
+            主檔 = 根 / "主.wy"
+            主檔.write_text(
+                "吾嘗觀「「改經」」之書。"
+                "吾嘗觀「「計經」」之書。方悟「副」之義。"
+                "夫「副」。書之。",
+                encoding="utf-8",
+            )
+            self.assertEqual(self._執行檔案(主檔), "1\n")
+
+    def test_頂層有副作用者全出(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            (根 / "鳴經.wy").write_text(
+                textwrap.dedent(
+                    """
+                    吾有一言。曰「「鳴」」。書之。
+                    吾有一數。曰一。名之曰「甲」。
+                    吾有一數。曰二。名之曰「乙」。
+                    """
+                ).strip(),
+                encoding="utf-8",
+            )
+            主檔 = 根 / "主.wy"
+            主檔.write_text(
+                "吾嘗觀「「鳴經」」之書。方悟「甲」之義。夫「甲」。書之。",
+                encoding="utf-8",
+            )
+            self.assertEqual(self._執行檔案(主檔), "鳴\n1\n")
+            模組樹 = wenyan.編譯為PythonAST(主檔.read_text(encoding="utf-8"), str(主檔))
+            所綁 = {
+                節.id
+                for 節 in ast.walk(模組樹)
+                if isinstance(節, ast.Name) and isinstance(節.ctx, ast.Store)
+            }
+            self.assertIn("乙", 所綁)
+
     def test_試擲與捕(self) -> None:
         源碼 = textwrap.dedent(
             """
@@ -338,6 +501,318 @@ class 執行測試(unittest.TestCase):
         輸出 = self._執行(源碼)
         self.assertEqual(輸出, "2\n")
 
+    def test_之讀取內聯快路與慢路同義(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            吾有一術。名之曰「讀」。欲行是術。必先得一元。曰「器」。一元。曰「索」。乃行是術曰。
+            	夫「器」之「索」。乃得矣。
+            是謂「讀」之術也。
+            吾有一列。名之曰「甲」。充「甲」以七以八。
+            昔之「甲」之負一者。今九是矣。
+            施「讀」於「甲」。於二。書之。
+            施「讀」於「甲」。於三。書之。
+            施「讀」於「甲」。於負一。書之。
+            施「讀」於「甲」。於一又五分。書之。
+            施「讀」於「「天地」」。於二。書之。
+            """
+        ).strip()
+        輸出 = self._執行(源碼)
+        self.assertEqual(輸出, "8\nNone\n9\n7\n地\n")
+
+    def test_負索槽隨列釋放且不串值(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            吾有一列。名之曰「丙」。
+            昔之「丙」之零者。今「「留」」是矣。
+            為是五千遍。
+            	吾有一列。名之曰「甲」。
+            	昔之「甲」之零者。今一是矣。
+            云云。
+            吾有一列。名之曰「乙」。
+            夫「乙」之零。書之。
+            夫「丙」之零。書之。
+            """
+        ).strip()
+        模組樹 = wenyan.編譯為PythonAST(源碼, "<測試>")
+        執行域: dict[str, object] = {"__name__": "__main__"}
+        緩衝 = io.StringIO()
+        with redirect_stdout(緩衝):
+            exec(compile(模組樹, "<測試>", "exec"), 執行域)
+        self.assertEqual(緩衝.getvalue(), "None\n留\n")
+        self.assertLessEqual(len(執行域["__文言負索"]), 128)
+
+    def test_負索槽之列自引互引亦清(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            吾有一術。名之曰「攪」。欲行是術。必先得一數。曰「次」。乃行是術曰。
+            	為是「次」遍。
+            		吾有一列。名之曰「甲」。
+            		吾有一列。名之曰「乙」。
+            		充「甲」以「甲」以「乙」。
+            		充「乙」以「甲」。
+            		昔之「甲」之零者。今「乙」是矣。
+            		昔之「乙」之零者。今「甲」是矣。
+            	云云。
+            是謂「攪」之術也。
+            吾有一列。名之曰「丙」。
+            充「丙」以「丙」。
+            昔之「丙」之零者。今「「留」」是矣。
+            施「攪」於五千。噫。
+            夫「丙」之零。書之。
+            """
+        ).strip()
+        模組樹 = wenyan.編譯為PythonAST(源碼, "<測試>")
+        執行域: dict[str, Any] = {"__name__": "__main__"}
+        緩衝 = io.StringIO()
+        with redirect_stdout(緩衝):
+            exec(compile(模組樹, "<測試>", "exec"), 執行域)
+        self.assertEqual(緩衝.getvalue(), "留\n")
+        self.assertLessEqual(len(執行域["__文言負索"]), 128)
+
+        # 非 CPython 者無從知列之存亡，寧留其槽而不清；存活之列仍得其值。
+        執行域["__文言負索可掃"] = False
+        表長 = len(執行域["__文言負索"])
+        執行域["攪"](5000)
+        self.assertEqual(len(執行域["__文言負索"]), 表長 + 10000)
+        丙 = 執行域["丙"]
+        self.assertEqual(執行域["取物"](丙, 0), "留")
+
+    def test_書之緩衝至結束且不亂宿主輸出先後(self) -> None:
+        class 計寫(io.StringIO):
+            次數 = 0
+
+            def write(self, 文: str) -> int:
+                type(self).次數 += 1
+                return super().write(文)
+
+        源碼 = textwrap.dedent(
+            """
+            為是三百遍。吾有一數。曰一。書之。云云。
+            施「print」於「「宿主」」。噫。
+            吾有一言。曰「「末」」。書之。
+            嗚呼「「禍」」之禍。
+            """
+        ).strip()
+        模組樹 = wenyan.編譯為PythonAST(源碼, "<測試>")
+        緩衝 = 計寫()
+        with redirect_stdout(緩衝):
+            with self.assertRaises(Exception):
+                exec(compile(模組樹, "<測試>", "exec"), {"__name__": "__main__"})
+        self.assertEqual(緩衝.getvalue(), "1\n" * 300 + "宿主\n末\n")
+        self.assertLessEqual(計寫.次數, 5)
+
+    def test_數轉漢字為漢字數字之逆(self) -> None:
+        執行域: dict[str, object] = {"__name__": "__main__"}
+        exec(compile(wenyan.編譯為PythonAST("噫。", "<測試>"), "<測試>", "exec"), 執行域)
+        轉 = 執行域["__數轉漢字"]
+        for 數 in [
+            *range(-120, 1200),
+            10_000,
+            10_005,
+            10_012,
+            100_010,
+            1_000_1000_0000,
+            10**8 + 5,
+            10**48 * 7 + 3,
+        ]:
+            self.assertEqual(wenyan.漢字數字(轉(數)), str(數), 數)
+        for 數 in [0.5, -3.14, 2.000001, 1e-7, 0.1 + 0.2, 123456.789]:
+            self.assertEqual(float(wenyan.漢字數字(轉(數))), 數, 數)
+        self.assertEqual(轉(12), "十二")
+        self.assertEqual(轉(112), "一百一十二")
+        self.assertEqual(轉(10**8 + 10), "一億零一十")
+        self.assertEqual(轉(-1.5), "負一又五分")
+        self.assertEqual(轉(4.0), "四")
+
+    def test_呼未證為術之名前先清書之緩衝(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            夫「print」。名之曰「印」。
+            吾有一元。曰「print」。名之曰「寫」。
+            吾有一術。名之曰「倍」。欲行是術。必先得一數。曰「甲」。乃行是術曰。
+            \t乘「甲」以二。乃得矣。
+            是謂「倍」之術也。
+            吾有一言。曰「「甲」」。書之。
+            施「印」於「「乙」」。噫。
+            吾有一言。曰「「丙」」。書之。
+            施「寫」於「「丁」」。噫。
+            施「倍」於三。書之。
+            """
+        ).strip()
+        self.assertEqual(self._執行(源碼), "甲\n乙\n丙\n丁\n6\n")
+        程式碼 = ast.unparse(wenyan.編譯為PythonAST(源碼, "<測試>"))
+        self.assertEqual(程式碼.count("__文言書.清()"), 2)
+
+    def test_位經以宿主運算實作(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            吾嘗觀「「位經」」之書。方悟「左移」「補零右移」「与非」「位變」之義。
+            施「左移」於三。於二。書之。
+            施「補零右移」於負一。於二十八。書之。
+            施「与非」於六。於三。書之。
+            施「位變」於五。書之。
+            """
+        ).strip()
+        self.assertEqual(self._執行(源碼), "12\n15\n-3\n-6\n")
+        # 不折為運算式者，宿主 lambda 照常呼之，結果同。
+        with mock.patch.object(wenyan.PythonAST轉譯器, "_宿主算式", return_value=None):
+            self.assertEqual(self._執行(源碼), "12\n15\n-3\n-6\n")
+
+    def test_列經宿主實作與根庫同義(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            吾嘗觀「「列經」」之書。方悟「遍施」「篩剔」「左併」「右併」「排序」「倒序」「擷取」「製列」「索一」之義。
+            吾有一術。名之曰「倍」。欲行是術。必先得一數。曰「甲」。乃行是術曰。乘「甲」以二。乃得其。是謂「倍」之術也。
+            吾有一術。名之曰「奇」。欲行是術。必先得一數。曰「甲」。乃行是術曰。除「甲」以二。所餘幾何。乃得其。是謂「奇」之術也。
+            吾有一術。名之曰「減」。欲行是術。必先得二數。曰「甲」曰「乙」。乃行是術曰。減「甲」以「乙」。乃得其。是謂「減」之術也。
+            吾有一術。名之曰「聯」。欲行是術。必先得二元。曰「甲」曰「乙」。乃行是術曰。
+            \t吾有一列。名之曰「丙」。充「丙」以「甲」以「乙」。乃得「丙」。
+            是謂「聯」之術也。
+            吾有一列。名之曰「列」。充「列」以五以三以八以一以三以九以二。
+            施「遍施」於「倍」於「列」。書之。
+            施「篩剔」於「奇」於「列」。書之。
+            施「左併」於「聯」於零於「列」。書之。
+            施「右併」於「聯」於零於「列」。書之。
+            施「排序」於「減」於「列」。書之。
+            施「排序」於「減」。名之曰「升」。施「升」於「列」。書之。
+            施「倒序」於「列」。書之。
+            施「擷取」於「列」於二於四。書之。
+            施「擷取」於「列」於零於二。書之。
+            施「擷取」於「列」於六於九。書之。
+            施「擷取」於「列」於二於負一。書之。
+            施「擷取」於「列」於一於負七。書之。
+            施「擷取」於「列」於一於負九。書之。
+            施「擷取」於「列」於三於負五。書之。
+            施「製列」於四於「倍」於「列」。書之。
+            施「製列」於二又五分於「倍」於「列」。書之。
+            施「索一」於「列」於三。書之。
+            施「索一」於「列」於七。書之。
+            """
+        ).strip()
+        庫 = Path(wenyan.__file__).resolve().parent / "lib"
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            (根 / "列經.wy").write_text(
+                (庫 / "列經.wy").read_text(encoding="utf-8"), encoding="utf-8"
+            )
+            原輸出 = self._執行(源碼, str(根 / "主.wy"))
+        輸出 = self._執行(源碼)
+        self.assertEqual(輸出, 原輸出)
+        self.assertIn("[None, 5, 3]\n", 輸出)
+        self.assertIn("lambda", (庫 / "py" / "列經.wy").read_text(encoding="utf-8"))
+
+    def test_算經宿主實作與根庫同義(self) -> None:
+        import math
+        import random
+
+        庫 = Path(wenyan.__file__).resolve().parent / "lib"
+
+        def 載(路徑: Path) -> dict[str, object]:
+            源碼 = 路徑.read_text(encoding="utf-8")
+            域: dict[str, object] = {"__name__": "__main__"}
+            exec(compile(wenyan.編譯為PythonAST(源碼, str(路徑)), str(路徑), "exec"), 域)
+            return 域
+
+        def 果(術: Any, *參: object) -> str:
+            try:
+                return repr(術(*參))
+            except Exception as 禍:
+                return type(禍).__name__
+
+        原, 新 = 載(庫 / "算經.wy"), 載(庫 / "py" / "算經.wy")
+        for 名 in ("至巨數", "至微數", "總算位", "位極差", "分算常數", "分算上溢限乙", "半圓周率密率"):
+            self.assertEqual(repr(新[名]), repr(原[名]), 名)
+
+        亂 = random.Random(0)
+        值列: list[object] = [
+            0, 1, -7, 2**61 - 1, True, 0.0, -0.0, 0.5, -0.5, 2.5, -2.5,
+            0.49999999999999994, -1e-20, 5e-324, 1e-310, 2.0**52 + 0.5,
+            1.7976931348623157e308, -math.inf, math.inf, math.nan, 6.7e299,
+        ]
+        值列 += [亂.uniform(-10, 10) for _ in range(60)]
+        值列 += [亂.uniform(-1, 1) * 10.0 ** 亂.randint(-320, 300) for _ in range(60)]
+        for 名 in (
+            "絕對", "取頂", "取底", "取整", "捨餘", "正負", "不可算數乎", "平方根",
+            "析浮點數", "分算", "自乘得雙", "取外鄰數", "正弦", "反正切", "對數", "指數",
+        ):
+            for 值 in 值列:
+                self.assertEqual(果(新[名], 值), 果(原[名], 值), (名, 值))
+        for 位 in (-1100, -1074, -1023, -3, 0, 52, 1023, 1024, 2.0, 2.5):
+            self.assertEqual(果(新["求進冪"], 位), 果(原["求進冪"], 位), 位)
+        式 = [亂.uniform(-1, 1) for _ in range(6)]
+        for 甲, 乙 in zip(值列, reversed(值列)):
+            self.assertEqual(果(新["求多項式"], 式, 甲), 果(原["求多項式"], 式, 甲), 甲)
+            for 名 in ("相乘得雙", "相加得雙", "冪", "勾股求弦"):
+                self.assertEqual(果(新[名], 甲, 乙), 果(原[名], 甲, 乙), (名, 甲, 乙))
+
+    def test_渾沌經宿主實作與根庫同義(self) -> None:
+        import random
+
+        庫 = Path(wenyan.__file__).resolve().parent / "lib"
+
+        def 載(路徑: Path) -> dict[str, Any]:
+            源碼 = 路徑.read_text(encoding="utf-8")
+            域: dict[str, Any] = {"__name__": "__main__"}
+            exec(compile(wenyan.編譯為PythonAST(源碼, str(路徑)), str(路徑), "exec"), 域)
+            return 域
+
+        def 果(術: Any, *參: object) -> str:
+            try:
+                return repr(術(*參))
+            except Exception as 禍:
+                return type(禍).__name__
+
+        原, 新 = 載(庫 / "渾沌經.wy"), 載(庫 / "py" / "渾沌經.wy")
+        亂 = random.Random(0)
+
+        def 造(層: int) -> object:
+            選 = 亂.randrange(7 if 層 < 3 else 4)
+            if 選 == 0:
+                return 亂.randint(-(10**6), 10**6)
+            if 選 == 1:
+                return 亂.choice(["", "長安", "「白銅鞮」", "也", "物", "負一"])
+            if 選 == 2:
+                return 亂.random() < 0.5
+            if 選 == 3:
+                return 亂.choice([0, -0.0, 4.0, 2**52])
+            if 選 < 6:
+                return {f"端{i}": 造(層 + 1) for i in range(亂.randint(0, 3))}
+            return [造(層 + 1) for _ in range(亂.randint(0, 3))]
+
+        def 數化(元: object) -> object:
+            if isinstance(元, dict):
+                return {鍵: 數化(值) for 鍵, 值 in 元.items()}
+            if isinstance(元, list):
+                return [數化(值) for 值 in 元]
+            if isinstance(元, int) and not isinstance(元, bool):
+                return float(元)
+            return 元
+
+        for _ in range(40):
+            物 = {f"端{i}": 造(0) for i in range(亂.randint(0, 4))}
+            列 = [造(0) for _ in range(亂.randint(0, 4))]
+            for 名, 元 in (("包渾沌", 物), ("包諸渾沌", 列)):
+                self.assertEqual(果(新[名], 元), 果(原[名], 元), 元)
+            for 食, 包, 元 in (("食渾沌", "包渾沌", 物), ("食諸渾沌", "包諸渾沌", 列)):
+                語 = 原[包](元)
+                self.assertEqual(果(新[食], 語), 果(原[食], 語), 語)
+                # 言與咒同者，根庫亦不能還原，故不驗其往返。
+                if "「也」" not in 語 and "「物」" not in 語:
+                    self.assertEqual(新[食](語), 數化(元))
+                for 變 in (語[:-1], 語.replace("」", "", 1), 語 + "物", "列" + 語[1:]):
+                    self.assertEqual(果(新[食], 變), 果(原[食], 變), 變)
+        for 數 in (2**60, -(2**55), 1e22, 2.5, float("nan")):
+            self.assertEqual(果(新["包諸渾沌"], [數]), 果(原["包諸渾沌"], [數]), 數)
+        for 語 in (
+            "物之「甲」言「「「乙」」」也",
+            "物之「甲」數「一·五」之「乙」數「負」也",
+            "物「甲」言「乙」也",
+            "列列列也也也",
+            "物之「甲」言「乙」言「丙」也",
+        ):
+            for 食 in ("食渾沌", "食諸渾沌"):
+                self.assertEqual(果(新[食], 語), 果(原[食], 語), 語)
+
     def test_曆法優先採用根庫實作(self) -> None:
         源碼 = textwrap.dedent(
             """
@@ -391,6 +866,63 @@ class 執行測試(unittest.TestCase):
             輸出 = self._執行(源碼, str(主檔))
             self.assertEqual(輸出, "42\n")
 
+    def test_匯入解析快取隨目錄更動失效(self) -> None:
+        源碼 = textwrap.dedent(
+            """
+            吾嘗觀「「位經」」之書。方悟「左移」之義。
+            施「左移」於一。於三。書之。
+            """
+        ).strip()
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            主檔 = str(根 / "主.wy")
+            self.assertEqual(self._執行(源碼, 主檔), "8\n")
+            (根 / "位經.wy").write_text(
+                textwrap.dedent(
+                    """
+                    吾有一術。名之曰「左移」。欲行是術。必先得二數。曰「甲」。曰「乙」。乃行是術曰。
+                    \t乃得零。
+                    是謂「左移」之術也。
+                    """
+                ).strip(),
+                encoding="utf-8",
+            )
+            # mtime 粒度或粗於兩次寫入之隔，故顯式推進之。
+            時 = os.stat(目錄).st_mtime_ns + 10**9
+            os.utime(目錄, ns=(時, 時))
+            self.assertEqual(self._執行(源碼, 主檔), "0\n")
+
+    def test_文言庫索引免列庫目錄且陳舊則棄(self) -> None:
+        with tempfile.TemporaryDirectory() as 目錄:
+            根 = Path(目錄)
+            (根 / "lib" / "py").mkdir(parents=True)
+            (根 / "lib" / "甲.wy").write_text("吾有一數。曰一。名之曰「甲」。", encoding="utf-8")
+            他處 = str(根 / "他處")
+            索引檔 = wenyan.寫入文言庫索引(str(根))
+            self.assertTrue(Path(索引檔).is_file())
+            wenyan.清除文言解析快取()
+            原列 = os.listdir
+            列次: list[str] = []
+
+            def 計列(路: str = ".") -> list[str]:
+                列次.append(路)
+                return 原列(路)
+
+            try:
+                with mock.patch.object(wenyan.os, "listdir", 計列):
+                    路徑 = wenyan._解析文言模組("甲", 他處, str(根))
+                self.assertEqual(路徑, str(根 / "lib" / "甲.wy"))
+                self.assertEqual(列次, [])
+
+                (根 / "lib" / "py" / "甲.wy").write_text("", encoding="utf-8")
+                時 = os.stat(根 / "lib" / "py").st_mtime_ns + 10**9
+                os.utime(根 / "lib" / "py", ns=(時, 時))
+                wenyan.清除文言解析快取()
+                路徑 = wenyan._解析文言模組("甲", 他處, str(根))
+                self.assertEqual(路徑, str(根 / "lib" / "py" / "甲.wy"))
+            finally:
+                wenyan.清除文言解析快取()
+
     def test_Python表式名值(self) -> None:
         源碼 = textwrap.dedent(
             """
@@ -7,16 +7,25 @@
 """
 
 import ast
+import bisect
+import copy
+import hashlib
 import importlib
 import importlib.abc
+import importlib.machinery
 import importlib.util
+import json
 import keyword
+import marshal
 import os
 import re
 import sys
-from dataclasses import dataclass
+import time
+import types
+import zlib
+from dataclasses import dataclass, field, fields
 from functools import lru_cache
-from typing import Callable, Iterator, NoReturn, cast
+from typing import Any, Callable, Iterable, Iterator, NoReturn, Sequence, TypeVar, cast
 
 __all__ = [
     "詞法分析器",
@@ -27,6 +36,9 @@ __all__ = [
     "安裝文言匯入鉤子",
     "卸載文言匯入鉤子",
     "載入文言模組",
+    "盡載文言模組",
+    "寫入文言庫索引",
+    "清除文言解析快取",
     "符號",
     "文法之禍",
     "文法錯誤",
@@ -75,6 +87,8 @@ __all__ = [
     "宏句",
     "文法分析器",
     "解析",
+    "序列化語法樹",
+    "反序列化語法樹",
     "轉譯為PythonAST",
     "編譯為PythonAST",
 ]
@@ -82,31 +96,143 @@ __all__ = [
 
 
 def _尋文言檔(
-    模組全名: str, 路徑列: list[str] | None = None
+    模組全名: str,
+    路徑列: list[str] | None = None,
+    列目錄: Callable[[str], frozenset[str]] | None = None,
 ) -> tuple[str, bool] | None:
     片段 = 模組全名.split(".")
     if not 片段:
         return None
+    if 列目錄 is None:
+        列目錄 = _列目錄
     搜尋列: list[str] = []
     if 路徑列 is None:
         for 路 in sys.path:
             if isinstance(路, str):
                 搜尋列.append(路)
-        相對路 = os.path.join(*片段)
+        上層 = 片段[:-1]
     else:
         搜尋列 = [路 for 路 in 路徑列 if isinstance(路, str)]
-        相對路 = 片段[-1]
+        上層 = []
+    葉 = 片段[-1]
+    模組名 = f"{葉}.wy"
 
+    # 先看目錄清單再定奪，未中者不必逐檔 stat；命中時仍以 isfile 排除同名目錄。
     for 基 in 搜尋列:
-        模組檔 = os.path.abspath(os.path.join(基, f"{相對路}.wy"))
-        if os.path.isfile(模組檔):
-            return 模組檔, False
-        套件檔 = os.path.abspath(os.path.join(基, 相對路, "序.wy"))
-        if os.path.isfile(套件檔):
-            return 套件檔, True
+        父 = os.path.join(基, *上層)
+        名錄 = 列目錄(父)
+        if 模組名 in 名錄:
+            模組檔 = os.path.abspath(os.path.join(父, 模組名))
+            if os.path.isfile(模組檔):
+                return 模組檔, False
+        if 葉 in 名錄 and "序.wy" in 列目錄(os.path.join(父, 葉)):
+            套件檔 = os.path.abspath(os.path.join(父, 葉, "序.wy"))
+            if os.path.isfile(套件檔):
+                return 套件檔, True
     return None
 
 
+def _列目錄(目錄: str) -> frozenset[str]:
+    try:
+        return frozenset(os.listdir(目錄 or "."))
+    except OSError:
+        return frozenset()
+
+
+# 目錄檔名清單之程序級快取：絕對路徑 → (mtime_ns, 清單)。匯入尋者與編譯期解析共用之。
+_名錄快取: dict[str, tuple[int, frozenset[str]]] = {}
+# 文言庫索引（`寫入文言庫索引` 所出）：絕對路徑 → 清單。載入時驗其 mtime 一次，其後信之。
+_庫索引: dict[str, dict[str, frozenset[str]]] = {}
+# 編譯期匯入解析之程序級快取：(模組, 當前目錄, 根目錄) → (路徑, 所經目錄及其 mtime_ns)。
+_模組解析快取: dict[
+    tuple[str, str, str], tuple[str | None, tuple[tuple[str, int | None], ...]]
+] = {}
+文言庫索引檔名 = "庫索引.json"
+
+
+def _目錄時(目錄: str) -> int | None:
+    try:
+        return os.stat(目錄).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _快取列目錄(目錄: str) -> frozenset[str]:
+    if not os.path.isabs(目錄):
+        目錄 = os.path.abspath(目錄)
+    時 = _目錄時(目錄)
+    if 時 is None:
+        return frozenset()
+    快取 = _名錄快取.get(目錄)
+    if 快取 is not None and 快取[0] == 時:
+        return 快取[1]
+    名錄 = _列目錄(目錄)
+    _名錄快取[目錄] = (時, 名錄)
+    return 名錄
+
+
+def 清除文言解析快取() -> None:
+    """清除目錄清單、匯入解析與文言庫索引之快取。
+
+    `importlib.invalidate_caches()` 亦經 `文言模組尋者` 呼之。
+    """
+
+    _名錄快取.clear()
+    _庫索引.clear()
+    _模組解析快取.clear()
+
+
+def 寫入文言庫索引(根目錄: str | None = None) -> str:
+    """列 `lib/` 及其子目錄之檔名，寫入 `lib/庫索引.json`，供編譯期解析免 stat。
+
+    宜於安裝時為之；索引所記之 mtime 與目錄不符者，載入時棄之。
+
+    Returns:
+        索引檔路徑。
+    """
+
+    根 = os.path.abspath(根目錄 or os.path.dirname(os.path.abspath(__file__)))
+    庫目錄 = os.path.join(根, "lib")
+    索引檔 = os.path.join(庫目錄, 文言庫索引檔名)
+    # 先建索引檔，lib 之 mtime 乃定；其後覆寫不動目錄之 mtime。
+    open(索引檔, "a", encoding="utf-8").close()
+    目錄表: dict[str, dict[str, object]] = {}
+    for 目錄, 子目錄列, 檔列 in os.walk(庫目錄):
+        子目錄列[:] = sorted(名 for 名 in 子目錄列 if not 名.startswith((".", "__")))
+        # `.wyast` 快取目錄亦先建之，免首次編譯新建之而動目錄之 mtime。
+        首檔 = next((名 for 名 in 檔列 if 名.endswith(".wy")), None)
+        快取檔 = None if 首檔 is None else _語法樹快取檔(os.path.join(目錄, 首檔))
+        if 快取檔 is not None and not sys.dont_write_bytecode:
+            os.makedirs(os.path.dirname(快取檔), exist_ok=True)
+        相對 = os.path.relpath(目錄, 庫目錄).replace(os.sep, "/")
+        目錄表[相對] = {"時": _目錄時(目錄), "名": sorted(子目錄列 + 檔列)}
+    with open(索引檔, "w", encoding="utf-8") as 檔案:
+        json.dump({"目錄": 目錄表}, 檔案, ensure_ascii=False, indent=1)
+    _庫索引.pop(根, None)
+    return 索引檔
+
+
+def _取庫索引(根目錄: str) -> dict[str, frozenset[str]]:
+    索引 = _庫索引.get(根目錄)
+    if 索引 is not None:
+        return 索引
+    庫目錄 = os.path.join(根目錄, "lib")
+    索引 = {}
+    try:
+        with open(os.path.join(庫目錄, 文言庫索引檔名), "r", encoding="utf-8") as 檔案:
+            目錄表 = json.load(檔案)["目錄"]
+        for 相對, 項 in 目錄表.items():
+            目錄 = os.path.normpath(os.path.join(庫目錄, 相對))
+            if _目錄時(目錄) != 項["時"]:
+                索引 = {}
+                break
+            索引[目錄] = frozenset(項["名"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        索引 = {}
+    _庫索引[根目錄] = 索引
+    return 索引
+
+
 class 文言模組載者(importlib.abc.Loader):
     def __init__(self, 檔路徑: str, 為套件: bool) -> None:
         self._檔路徑 = 檔路徑
@@ -118,6 +244,7 @@ class 文言模組載者(importlib.abc.Loader):
     def exec_module(self, 模組: object) -> None:
         if not hasattr(模組, "__dict__"):
             raise TypeError("模組物件缺少 __dict__")
+        _待載惰性規格.pop(cast(str, getattr(模組, "__name__")), None)
         with open(self._檔路徑, "r", encoding="utf-8") as 檔案:
             內容 = 檔案.read()
         模組樹 = 編譯為PythonAST(內容, self._檔路徑)
@@ -134,6 +261,15 @@ class 文言模組載者(importlib.abc.Loader):
 
 
 class 文言模組尋者(importlib.abc.MetaPathFinder):
+    """以 `.wy` 檔及 `序.wy` 套件應 Python 匯入。
+
+    各目錄之檔名清單依其 mtime 快取，如 `FileFinder`；目錄未變者不再列之。
+    `importlib.invalidate_caches()` 清之。
+    """
+
+    def invalidate_caches(self) -> None:
+        清除文言解析快取()
+
     def find_spec(
         self,
         全名: str,
@@ -145,13 +281,12 @@ class 文言模組尋者(importlib.abc.MetaPathFinder):
             路徑列 = None
         else:
             路徑列 = [路 for 路 in cast(list[object], 路徑) if isinstance(路, str)]
-        命中 = _尋文言檔(全名, 路徑列)
+        命中 = _尋文言檔(全名, 路徑列, _快取列目錄)
         if 命中 is None:
             return None
         檔路徑, 為套件 = 命中
-        載者 = 文言模組載者(檔路徑, 為套件)
         規格 = importlib.util.spec_from_loader(
-            全名, 載者, origin=檔路徑, is_package=為套件
+            全名, 文言模組載者(檔路徑, 為套件), origin=檔路徑, is_package=為套件
         )
         if 規格 is None:
             return None
@@ -161,10 +296,20 @@ class 文言模組尋者(importlib.abc.MetaPathFinder):
 
 
 def 安裝文言匯入鉤子() -> None:
+    """裝 `文言模組尋者` 於 `sys.meta_path`；已裝者不重裝。"""
     for 尋者 in sys.meta_path:
         if isinstance(尋者, 文言模組尋者):
             return
-    sys.meta_path.insert(0, 文言模組尋者())
+    # 置於 PathFinder 之前：內建、凍結模組不經此尋者，而 `.wy` 仍先於同名 `.py`。
+    位 = next(
+        (
+            序
+            for 序, 尋者 in enumerate(sys.meta_path)
+            if 尋者 is importlib.machinery.PathFinder
+        ),
+        len(sys.meta_path),
+    )
+    sys.meta_path.insert(位, 文言模組尋者())
 
 
 def 卸載文言匯入鉤子() -> None:
@@ -173,9 +318,48 @@ def 卸載文言匯入鉤子() -> None:
     ]
 
 
-def 載入文言模組(模組名: str) -> object:
+# 惰性載入而尚未執行之文言模組：全名 → 規格。載者執行時自除之。
+_待載惰性規格: dict[str, importlib.machinery.ModuleSpec] = {}
+
+
+def 載入文言模組(模組名: str, 惰性: bool = False) -> object:
+    """匯入文言模組，如 `importlib.import_module`。
+
+    `惰性` 為真且模組未載者，唯此模組之載者以 `importlib.util.LazyLoader` 包之：
+    僅立模組，編譯與執行延至首取其屬性之時。他處之匯入不受其影響。
+    """
     安裝文言匯入鉤子()
-    return importlib.import_module(模組名)
+    if not 惰性 or 模組名 in sys.modules:
+        return importlib.import_module(模組名)
+    規格 = importlib.util.find_spec(模組名)
+    if 規格 is None or not isinstance(規格.loader, 文言模組載者):
+        return importlib.import_module(模組名)
+    規格.loader = importlib.util.LazyLoader(規格.loader)
+    模組 = importlib.util.module_from_spec(規格)
+    sys.modules[模組名] = 模組
+    _待載惰性規格[模組名] = 規格
+    規格.loader.exec_module(模組)
+    父名, _, 子名 = 模組名.rpartition(".")
+    if 父名:
+        setattr(sys.modules[父名], 子名, 模組)
+    return 模組
+
+
+def 盡載文言模組() -> int:
+    """令惰性載入而尚未執行之文言模組即刻編譯執行，返其數。
+
+    宜於暖身時呼之，免首次取用之遲。
+    """
+    數 = 0
+    for 模組名, 規格 in list(_待載惰性規格.items()):
+        模組 = sys.modules.get(模組名)
+        # 以 object.__getattribute__ 窺之，不觸其載入。
+        if 模組 is None or object.__getattribute__(模組, "__spec__") is not 規格:
+            _待載惰性規格.pop(模組名, None)
+            continue
+        getattr(模組, "__name__")
+        數 += 1
+    return 數
 
 
 忽略符號 = frozenset({"。", "、", "，", "矣", " ", "\t", "\n", "\r", "　"})
@@ -345,7 +529,7 @@ class 文法之禍(SyntaxError):
 文法錯誤 = 文法之禍
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 符號:
     """詞法單元。"""
 
@@ -716,30 +900,40 @@ def 解析小數(漢字數: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 節點:
     """語法樹節點基類。
 
+    位置以兩整數存之，免每節各持一 `slice`。
+
     Args:
-        位置: 對應原始碼片段的 `slice(start, end)`，用於錯誤定位。
+        始: 對應原始碼片段之起點（字元索引），用於錯誤定位。
+        終: 對應原始碼片段之終點（不含）。
     """
 
-    位置: slice
+    始: int
+    終: int
 
+    @property
+    def 位置(self) -> slice:
+        """兼容舊介面之 `slice(始, 終)`。"""
 
-@dataclass(frozen=True)
+        return slice(self.始, self.終)
+
+
+@dataclass(frozen=True, slots=True)
 class 值(節點):
     """值（表達式）基類。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 名值(值):
     """名（identifier）。"""
 
     名: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 言值(值):
     """言（字面量字串）。
 
@@ -750,43 +944,43 @@ class 言值(值):
     文: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 數值(值):
     """數（數值字面量）。"""
 
     文: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 爻值(值):
     """爻（陰/陽）。"""
 
     真: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 其值(值):
     """其（暫存棧頂）。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 其餘值(值):
     """其餘（容器下標語法中的 REST）。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 句(節點):
     """語句基類。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 程式(節點):
     """程式根節點。"""
 
     句列: list[句]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 宣告句(句):
     """變數宣告（`吾有/今有`）。"""
 
@@ -797,7 +991,7 @@ class 宣告句(句):
     公開: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 初始化句(句):
     """初始化宣告（`有`）。"""
 
@@ -806,14 +1000,14 @@ class 初始化句(句):
     名: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 命名句(句):
     """命名（`名之曰`；從暫存棧取值）。"""
 
     名列: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 匯入句(句):
     """匯入（`吾嘗觀 ... 之書 ... 方悟 ... 之義`）。"""
 
@@ -821,7 +1015,7 @@ class 匯入句(句):
     名列: list[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 術參數(節點):
     """術參數。"""
 
@@ -830,7 +1024,7 @@ class 術參數(節點):
     其餘: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 術定義句(句):
     """術定義（函數）。"""
 
@@ -840,7 +1034,7 @@ class 術定義句(句):
     公開: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 施句(句):
     """呼叫（`施 <術> 於 <值>...`）。"""
 
@@ -848,14 +1042,14 @@ class 施句(句):
     參數列: list[值]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 以施句(句):
     """呼叫（`以施 <術>`）。"""
 
     術: 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 取句(句):
     """取參數（`取 <數>` / `取其餘`）。"""
 
@@ -863,7 +1057,7 @@ class 取句(句):
     其餘: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 返回句(句):
     """返回（`乃得/乃得矣/乃歸空無`）。"""
 
@@ -872,7 +1066,7 @@ class 返回句(句):
     空無: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 列充句(句):
     """列追加（`充`）。"""
 
@@ -880,7 +1074,7 @@ class 列充句(句):
     值列: list[值]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 列銜句(句):
     """列/言銜接（`銜`）。"""
 
@@ -888,7 +1082,7 @@ class 列銜句(句):
     列列: list[值]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 物屬性(節點):
     """物屬性（`物之...者`）。"""
 
@@ -897,7 +1091,7 @@ class 物屬性(節點):
     值: 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 物定義句(句):
     """物定義（`其物如是 ... 是謂 ... 之物也`）。"""
 
@@ -905,17 +1099,17 @@ class 物定義句(句):
     屬性列: list[物屬性]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 書之句(句):
     """輸出（`書之`）。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 噫句(句):
     """清空暫存棧（`噫`）。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 算術句(句):
     """二元運算（含算術/餘數/邏輯）。"""
 
@@ -924,21 +1118,21 @@ class 算術句(句):
     右: 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 變句(句):
     """一元運算（`變`）。"""
 
     值: 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 夫句(句):
     """取值入棧（`夫 <值>`）。"""
 
     值: 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 之句(句):
     """下標取值（`夫 <容器> 之 <索引>`）。"""
 
@@ -946,14 +1140,14 @@ class 之句(句):
     索引: 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 之長句(句):
     """取長度（`夫 <容器> 之長`）。"""
 
     容器: 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 昔今句(句):
     """賦值或刪除（`昔之...者 今 ... 是矣` / `... 不復存矣`）。"""
 
@@ -967,7 +1161,7 @@ class 昔今句(句):
 文言值 = 值
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 條件原子(節點):
     """條件式中的原子（值 + 可選後綴）。"""
 
@@ -976,7 +1170,7 @@ class 條件原子(節點):
     之長: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 或若子句(節點):
     """`或若` 子句。"""
 
@@ -984,7 +1178,7 @@ class 或若子句(節點):
     體: list[句]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 若句(句):
     """若（if/elif/else）。"""
 
@@ -995,14 +1189,14 @@ class 若句(句):
     否則: list[句]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 恆為是句(句):
     """無條件循環（`恆為是 ... 云云/也`）。"""
 
     體: list[句]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 為是遍句(句):
     """次數循環（`為是 <次數> 遍 ... 云云/也`）。"""
 
@@ -1010,17 +1204,17 @@ class 為是遍句(句):
     體: list[句]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 乃止句(句):
     """break（`乃止`）。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 乃止是遍句(句):
     """continue（`乃止是遍`）。"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 凡句(句):
     """遍歷（`凡 ... 中之 ...`）。"""
 
@@ -1029,7 +1223,7 @@ class 凡句(句):
     體: list[句]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 捕捉子句(節點):
     """捕捉子句。"""
 
@@ -1039,7 +1233,7 @@ class 捕捉子句(節點):
     亦可: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 試句(句):
     """異常處理（`姑妄行此`）。"""
 
@@ -1047,7 +1241,7 @@ class 試句(句):
     捕捉列: list[捕捉子句]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 擲句(句):
     """拋出（`嗚呼 ... 之禍`）。"""
 
@@ -1055,14 +1249,14 @@ class 擲句(句):
     訊: 值 | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 註釋句(句):
     """註釋（`注曰/疏曰/批曰`）。"""
 
     文: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class 宏句(句):
     """宏定義（`或云/蓋謂`）。"""
 
@@ -1091,6 +1285,17 @@ class 編譯環境:
     宏解析中: set[str]
     編譯中: set[str]
     已載入: set[str]
+    內聯: bool = True
+    解析快取: dict[tuple[str, str], str | None] = field(default_factory=dict)
+    # 搖樹所據：根程式之句列與文檔名、各模組諸匯入者之詞（見 `_彙匯入求詞`），
+    # 及彙時已解析、留待匯入處取用之模組。
+    根程: tuple[list[句], str] | None = None
+    匯入求詞: dict[str, set[str] | None] | None = None
+    程快取: dict[str, tuple[程式, str]] = field(default_factory=dict)
+    宏依據: dict[str, frozenset[tuple[str, str, str | None]]] = field(
+        default_factory=dict
+    )
+    語法樹快取: bool = True
 
 
 內建型別詞 = frozenset({"數", "列", "言", "爻", "物", "術", "元"})
@@ -1104,6 +1309,47 @@ class 編譯環境:
 }
 邏輯詞對照 = {"中有陽乎": "||", "中無陰乎": "&&"}
 
+# 值之首符 → 值節點：關鍵詞（無值）與帶值之符分表。
+_值關鍵詞: dict[str, Callable[[符號], 值]] = {
+    "其": lambda 符: 其值(符.位置.start, 符.位置.stop),
+    "其餘": lambda 符: 其餘值(符.位置.start, 符.位置.stop),
+    "陰": lambda 符: 爻值(符.位置.start, 符.位置.stop, False),
+    "陽": lambda 符: 爻值(符.位置.start, 符.位置.stop, True),
+}
+_值類别: dict[str, Callable[[符號], 值]] = {
+    "名": lambda 符: 名值(符.位置.start, 符.位置.stop, cast(str, 符.值)),
+    "言": lambda 符: 言值(符.位置.start, 符.位置.stop, cast(str, 符.值)),
+    "數": lambda 符: 數值(符.位置.start, 符.位置.stop, cast(str, 符.值)),
+    "數據": lambda 符: 名值(符.位置.start, 符.位置.stop, cast(str, 符.值)),
+}
+
+# 區塊語句列之終止詞；`_解析語句列` 以集合成員判之。
+_術體終止詞 = frozenset({"是謂"})
+_試體終止詞 = frozenset({"如事不諧"})
+_捕體終止詞 = frozenset({"豈", "不知何禍歟", "乃作罷"})
+_凡體終止詞 = frozenset({"云云", "也"})
+_若體終止詞 = frozenset({"或若", "若非", "云云", "也", "是謂"})
+_若非體終止詞 = frozenset({"云云", "也", "是謂"})
+_循環體終止詞 = frozenset({"云云", "也", "是謂", "乃得", "乃得矣", "乃歸空無"})
+_條件式終止詞 = frozenset({"者", "或若", "若非", "云云", "也"})
+# `是也` 之後若為此等詞，不補「也」作區塊終止。
+_結構收束詞 = frozenset(
+    {
+        "也",
+        "云云",
+        "若非",
+        "或若",
+        "是謂",
+        "乃得",
+        "乃得矣",
+        "乃歸空無",
+        "如事不諧",
+        "豈",
+        "不知何禍歟",
+        "乃作罷",
+    }
+)
+
 
 class 文法分析器:
     """將 `詞法分析器` 的輸出轉為 Wenyan AST。"""
@@ -1120,24 +1366,20 @@ class 文法分析器:
         起點 = 0
         句列 = self._解析語句列(終止詞=frozenset())
         終點 = len(self.內容)
-        return 程式(slice(起點, 終點), 句列)
+        return 程式(起點, 終點, 句列)
 
     # ---- 基礎操作 -----------------------------------------------------
 
-    def _到尾(self) -> bool:
-        return self._索引 >= len(self.符號列)
-
     def _看(self) -> 符號 | None:
-        if self._到尾():
-            return None
-        return self.符號列[self._索引]
+        索引 = self._索引
+        return self.符號列[索引] if 索引 < len(self.符號列) else None
 
     def _取(self) -> 符號:
-        符 = self._看()
-        if 符 is None:
+        索引 = self._索引
+        if 索引 >= len(self.符號列):
             self._拋出文法錯誤("意外之終", len(self.內容))
-        self._索引 += 1
-        return 符
+        self._索引 = 索引 + 1
+        return self.符號列[索引]
 
     def _是關鍵詞(self, 符: 符號 | None, 詞: str) -> bool:
         return 符 is not None and 符.類别 == 詞 and 符.值 is None
@@ -1165,24 +1407,13 @@ class 文法分析器:
 
     def _解析值(self) -> 值:
         符 = self._取()
-        if self._是關鍵詞(符, "其"):
-            return 其值(符.位置)
-        if self._是關鍵詞(符, "其餘"):
-            return 其餘值(符.位置)
-        if self._是關鍵詞(符, "陰"):
-            return 爻值(符.位置, False)
-        if self._是關鍵詞(符, "陽"):
-            return 爻值(符.位置, True)
-        if 符.類别 == "名" and 符.值 is not None:
-            return 名值(符.位置, 符.值)
-        if 符.類别 == "言" and 符.值 is not None:
-            return 言值(符.位置, 符.值)
-        if 符.類别 == "數" and 符.值 is not None:
-            return 數值(符.位置, 符.值)
-        if 符.類别 == "數據" and 符.值 is not None:
-            return 名值(符.位置, 符.值)
-        self._拋出文法錯誤("不識之值", 符.位置.start)
-        raise AssertionError("unreachable")
+        if 符.值 is None:
+            造 = _值關鍵詞.get(符.類别)
+        else:
+            造 = _值類别.get(符.類别)
+        if 造 is None:
+            self._拋出文法錯誤("不識之值", 符.位置.start)
+        return 造(符)
 
     def _解析名(self) -> str:
         符 = self._取()
@@ -1220,14 +1451,12 @@ class 文法分析器:
             self._取()
             索 = self._解析值()
             下標 = 索
-            位置 = slice(值節.位置.start, 索.位置.stop)
-            return 條件原子(位置, 值節, 下標, 之長)
+            return 條件原子(值節.位置.start, 索.位置.stop, 值節, 下標, 之長)
         if self._是關鍵詞(self._看(), "之長"):
             之長符 = self._取()
             之長 = True
-            位置 = slice(值節.位置.start, 之長符.位置.stop)
-            return 條件原子(位置, 值節, 下標, 之長)
-        return 條件原子(值節.位置, 值節, 下標, 之長)
+            return 條件原子(值節.位置.start, 之長符.位置.stop, 值節, 下標, 之長)
+        return 條件原子(值節.始, 值節.終, 值節, 下標, 之長)
 
     def _解析條件式(self) -> list[條件原子 | str]:
         片段: list[條件原子 | str] = [self._解析條件原子()]
@@ -1235,11 +1464,7 @@ class 文法分析器:
             符 = self._看()
             if 符 is None:
                 break
-            if self._是關鍵詞(符, "者"):
-                break
-            if self._是關鍵詞(符, "或若") or self._是關鍵詞(符, "若非"):
-                break
-            if self._是關鍵詞(符, "云云") or self._是關鍵詞(符, "也"):
+            if 符.值 is None and 符.類别 in _條件式終止詞:
                 break
             if 符.值 is None and 符.類别 in 比較詞對照:
                 self._取()
@@ -1257,33 +1482,16 @@ class 文法分析器:
     def _可視為區塊終止後繼(self, 符: 符號 | None) -> bool:
         if 符 is None:
             return False
-        結構收束詞 = (
-            "也",
-            "云云",
-            "若非",
-            "或若",
-            "是謂",
-            "乃得",
-            "乃得矣",
-            "乃歸空無",
-            "如事不諧",
-            "豈",
-            "不知何禍歟",
-            "乃作罷",
-        )
-        if any(self._是關鍵詞(符, 詞) for 詞 in 結構收束詞):
-            return False
-        return True
+        return 符.值 is not None or 符.類别 not in _結構收束詞
 
     # ---- 語句 ---------------------------------------------------------
 
     def _解析語句列(self, 終止詞: frozenset[str]) -> list[句]:
         句列: list[句] = []
-        while True:
-            符 = self._看()
-            if 符 is None:
-                break
-            if any(self._是關鍵詞(符, 詞) for 詞 in 終止詞):
+        符號列 = self.符號列
+        while self._索引 < len(符號列):
+            符 = 符號列[self._索引]
+            if 符.值 is None and 符.類别 in 終止詞:
                 break
             句列.append(self._解析語句())
         return 句列
@@ -1292,101 +1500,38 @@ class 文法分析器:
         符 = self._看()
         if 符 is None:
             self._拋出文法錯誤("意外之終", len(self.內容))
+        if 符.值 is None:
+            解析 = self._句首解析表.get(符.類别)
+            if 解析 is not None:
+                return 解析(self)
+        self._拋出文法錯誤("不識之句", 符.位置.start)
 
-        if self._是關鍵詞(符, "吾嘗觀"):
-            return self._解析匯入句()
-        if self._是關鍵詞(符, "或云"):
-            return self._解析宏句()
-        if (
-            self._是關鍵詞(符, "注曰")
-            or self._是關鍵詞(符, "疏曰")
-            or self._是關鍵詞(符, "批曰")
-        ):
-            return self._解析註釋句()
-        if self._是關鍵詞(符, "姑妄行此"):
-            return self._解析試句()
-        if self._是關鍵詞(符, "嗚呼"):
-            return self._解析擲句()
-        if self._是關鍵詞(符, "取"):
-            return self._解析取句()
-        if self._是關鍵詞(符, "以施"):
-            return self._解析以施句()
-        if self._是關鍵詞(符, "施"):
-            return self._解析施句()
-        if self._是關鍵詞(符, "以"):
-            下符 = (
-                self.符號列[self._索引 + 1]
-                if self._索引 + 1 < len(self.符號列)
-                else None
-            )
-            if 下符 is not None and self._是關鍵詞(下符, "名之曰"):
-                self._取()
-                return self._解析命名句()
-        if self._是關鍵詞(符, "充"):
-            return self._解析列充句()
-        if self._是關鍵詞(符, "銜"):
-            return self._解析列銜句()
-        if self._是關鍵詞(符, "其物如是"):
-            return self._解析物定義句()
-        if self._是關鍵詞(符, "凡"):
-            return self._解析凡句()
-        if self._是關鍵詞(符, "乃得矣"):
-            return self._解析返回句(取棧=True)
-        if self._是關鍵詞(符, "乃歸空無"):
-            return self._解析返回句(空無=True)
-        if self._是關鍵詞(符, "乃得"):
-            return self._解析返回句()
-        if self._是關鍵詞(符, "吾有") or self._是關鍵詞(符, "今有"):
-            if self._是術定義起始():
-                return self._解析術定義句()
-            return self._解析宣告句()
-        if self._是關鍵詞(符, "有"):
-            return self._解析初始化句()
-        if self._是關鍵詞(符, "名之曰"):
-            return self._解析命名句()
-        if self._是關鍵詞(符, "書之"):
-            開 = self._取()
-            return 書之句(開.位置)
-        if self._是關鍵詞(符, "噫"):
-            開 = self._取()
-            return 噫句(開.位置)
-        if self._是關鍵詞(符, "昔之"):
-            return self._解析昔今句()
-        if 符.值 is None and 符.類别 in {"加", "減", "乘", "除"}:
-            return self._解析算術句()
-        if self._是關鍵詞(符, "變"):
-            開 = self._取()
-            值節 = self._解析值()
-            位置 = slice(開.位置.start, 值節.位置.stop)
-            return 變句(位置, 值節)
-        if self._是關鍵詞(符, "夫"):
-            return self._解析夫句()
-        if (
-            self._是關鍵詞(符, "若")
-            or self._是關鍵詞(符, "若其然者")
-            or self._是關鍵詞(符, "若其不然者")
-        ):
-            return self._解析若句()
-        if self._是關鍵詞(符, "恆為是"):
-            return self._解析恆為是句()
-        if self._是關鍵詞(符, "為是"):
-            return self._解析為是遍句()
-        if self._是關鍵詞(符, "是術曰") or self._是關鍵詞(符, "乃行是術曰"):
-            self._拋出文法錯誤("術體不可獨立", 符.位置.start)
-        if self._是關鍵詞(符, "乃止"):
-            開 = self._取()
-            return 乃止句(開.位置)
-        if self._是關鍵詞(符, "乃止是遍"):
-            開 = self._取()
-            return 乃止是遍句(開.位置)
-        if self._是關鍵詞(符, "也"):
-            終 = self._取()
-            return 註釋句(終.位置, "")
-        if self._是關鍵詞(符, "云云"):
-            self._拋出文法錯誤("不當之終", 符.位置.start)
+    def _解析以名之句(self) -> 命名句:
+        符 = self.符號列[self._索引]
+        下符 = (
+            self.符號列[self._索引 + 1] if self._索引 + 1 < len(self.符號列) else None
+        )
+        if 下符 is None or not self._是關鍵詞(下符, "名之曰"):
+            self._拋出文法錯誤("不識之句", 符.位置.start)
+        self._取()
+        return self._解析命名句()
 
-        self._拋出文法錯誤("不識之句", 符.位置.start)
-        raise AssertionError("unreachable")
+    def _解析有句(self) -> 句:
+        if self._是術定義起始():
+            return self._解析術定義句()
+        return self._解析宣告句()
+
+    def _解析變句(self) -> 變句:
+        開 = self._取()
+        值節 = self._解析值()
+        return 變句(開.位置.start, 值節.位置.stop, 值節)
+
+    def _單符句(self, 類: Callable[..., 句], *欄: object) -> 句:
+        符 = self._取()
+        return 類(符.位置.start, 符.位置.stop, *欄)
+
+    def _拒句首(self, 訊息: str) -> NoReturn:
+        self._拋出文法錯誤(訊息, self.符號列[self._索引].位置.start)
 
     def _解析宣告句(self) -> 宣告句:
         開 = self._取()
@@ -1409,8 +1554,7 @@ class 文法分析器:
         if len(名列) > 數量:
             self._拋出文法錯誤("名多於數量", 開.位置.start)
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 宣告句(位置, 數量, 類型, 初值列, 名列, 公開)
+        return 宣告句(開.位置.start, 終.位置.stop, 數量, 類型, 初值列, 名列, 公開)
 
     def _解析初始化句(self) -> 初始化句:
         開 = self._期("有")
@@ -1421,8 +1565,7 @@ class 文法分析器:
             self._取()
             名 = self._解析名()
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 初始化句(位置, 類型, 初值, 名)
+        return 初始化句(開.位置.start, 終.位置.stop, 類型, 初值, 名)
 
     def _解析命名句(self) -> 命名句:
         開 = self._期("名之曰")
@@ -1431,8 +1574,7 @@ class 文法分析器:
             self._取()
             名列.append(self._解析名())
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 命名句(位置, 名列)
+        return 命名句(開.位置.start, 終.位置.stop, 名列)
 
     def _是術定義起始(self) -> bool:
         起點 = self._索引
@@ -1498,7 +1640,7 @@ class 文法分析器:
                         開.位置.start,
                     )
                 for 名稱, 位 in 名列:
-                    參數列.append(術參數(位, 名稱, 組型別, 其餘參組))
+                    參數列.append(術參數(位.start, 位.stop, 名稱, 組型別, 其餘參組))
                 if 其餘參組:
                     已見其餘參 = True
                 下符 = self._看()
@@ -1523,12 +1665,11 @@ class 文法分析器:
         ):
             self._拋出文法錯誤("術體未始", 開.位置.start)
         self._取()
-        體 = self._解析語句列(終止詞=frozenset({"是謂"}))
+        體 = self._解析語句列(終止詞=_術體終止詞)
         self._期("是謂")
         self._解析名()
         終 = self._期("之術也")
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 術定義句(位置, 名, 參數列, 體, 公開)
+        return 術定義句(開.位置.start, 終.位置.stop, 名, 參數列, 體, 公開)
 
     def _解析匯入句(self) -> 匯入句:
         開 = self._期("吾嘗觀")
@@ -1549,8 +1690,7 @@ class 文法分析器:
                     break
                 名列.append(self._解析名())
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 匯入句(位置, 模組, 名列)
+        return 匯入句(開.位置.start, 終.位置.stop, 模組, 名列)
 
     def _解析宏句(self) -> 宏句:
         開 = self._期("或云")
@@ -1562,16 +1702,16 @@ class 文法分析器:
         if 置換符.類别 != "言" or 置換符.值 is None:
             self._拋出文法錯誤("宏替當為言", 置換符.位置.start)
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 宏句(位置, _還原言值(模式符.值), _還原言值(置換符.值))
+        return 宏句(
+            開.位置.start, 終.位置.stop, _還原言值(模式符.值), _還原言值(置換符.值)
+        )
 
     def _解析註釋句(self) -> 註釋句:
         開 = self._取()
         文符 = self._看()
         if 文符 is not None and 文符.類别 == "言" and 文符.值 is not None:
             self._取()
-            位置 = slice(開.位置.start, 文符.位置.stop)
-            return 註釋句(位置, _還原言值(文符.值))
+            return 註釋句(開.位置.start, 文符.位置.stop, _還原言值(文符.值))
         行終 = self.內容.find("\n", 開.位置.stop)
         if 行終 == -1:
             行終 = len(self.內容)
@@ -1581,12 +1721,11 @@ class 文法分析器:
             if 觀 is None or 觀.位置.start >= 行終:
                 break
             self._取()
-        位置 = slice(開.位置.start, 行終)
-        return 註釋句(位置, 文)
+        return 註釋句(開.位置.start, 行終, 文)
 
     def _解析試句(self) -> 試句:
         開 = self._期("姑妄行此")
-        體 = self._解析語句列(終止詞=frozenset({"如事不諧"}))
+        體 = self._解析語句列(終止詞=_試體終止詞)
         if not self._是關鍵詞(self._看(), "如事不諧"):
             self._拋出文法錯誤("試句未終", 開.位置.start)
         self._取()
@@ -1597,8 +1736,7 @@ class 文法分析器:
                 self._拋出文法錯誤("試句未終", 開.位置.start)
             if self._是關鍵詞(符, "乃作罷"):
                 終 = self._取()
-                位置 = slice(開.位置.start, 終.位置.stop)
-                return 試句(位置, 體, 捕捉列)
+                return 試句(開.位置.start, 終.位置.stop, 體, 捕捉列)
             if self._是關鍵詞(符, "豈"):
                 起 = 符.位置.start
                 self._取()
@@ -1608,13 +1746,9 @@ class 文法分析器:
                 if self._是關鍵詞(self._看(), "名之曰"):
                     self._取()
                     變數名 = self._解析名()
-                捕體 = self._解析語句列(
-                    終止詞=frozenset({"豈", "不知何禍歟", "乃作罷"})
-                )
+                捕體 = self._解析語句列(終止詞=_捕體終止詞)
                 終符 = self.符號列[self._索引 - 1]
-                捕捉列.append(
-                    捕捉子句(slice(起, 終符.位置.stop), 錯名, 變數名, 捕體, False)
-                )
+                捕捉列.append(捕捉子句(起, 終符.位置.stop, 錯名, 變數名, 捕體, False))
                 continue
             if self._是關鍵詞(符, "不知何禍歟"):
                 起 = 符.位置.start
@@ -1623,13 +1757,9 @@ class 文法分析器:
                 if self._是關鍵詞(self._看(), "名之曰"):
                     self._取()
                     變數名 = self._解析名()
-                捕體 = self._解析語句列(
-                    終止詞=frozenset({"豈", "不知何禍歟", "乃作罷"})
-                )
+                捕體 = self._解析語句列(終止詞=_捕體終止詞)
                 終符 = self.符號列[self._索引 - 1]
-                捕捉列.append(
-                    捕捉子句(slice(起, 終符.位置.stop), None, 變數名, 捕體, True)
-                )
+                捕捉列.append(捕捉子句(起, 終符.位置.stop, None, 變數名, 捕體, True))
                 continue
             self._拋出文法錯誤("捕捉未始", 符.位置.start)
 
@@ -1642,27 +1772,23 @@ class 文法分析器:
             self._取()
             訊 = self._解析值()
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 擲句(位置, 名, 訊)
+        return 擲句(開.位置.start, 終.位置.stop, 名, 訊)
 
     def _解析取句(self) -> 取句:
         開 = self._期("取")
         if self._是關鍵詞(self._看(), "其餘"):
             self._取()
             終 = self.符號列[self._索引 - 1]
-            位置 = slice(開.位置.start, 終.位置.stop)
-            return 取句(位置, None, True)
+            return 取句(開.位置.start, 終.位置.stop, None, True)
         數量 = self._解析數量()
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 取句(位置, 數量, False)
+        return 取句(開.位置.start, 終.位置.stop, 數量, False)
 
     def _解析以施句(self) -> 以施句:
         開 = self._期("以施")
         術 = self._解析值()
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 以施句(位置, 術)
+        return 以施句(開.位置.start, 終.位置.stop, 術)
 
     def _解析施句(self) -> 施句:
         開 = self._期("施")
@@ -1672,8 +1798,7 @@ class 文法分析器:
             self._取()
             參數列.append(self._解析值())
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 施句(位置, 術, 參數列)
+        return 施句(開.位置.start, 終.位置.stop, 術, 參數列)
 
     def _解析列充句(self) -> 列充句:
         開 = self._期("充")
@@ -1685,8 +1810,7 @@ class 文法分析器:
             self._取()
             值列.append(self._解析值())
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 列充句(位置, 列, 值列)
+        return 列充句(開.位置.start, 終.位置.stop, 列, 值列)
 
     def _解析列銜句(self) -> 列銜句:
         開 = self._期("銜")
@@ -1698,8 +1822,7 @@ class 文法分析器:
             self._取()
             列列.append(self._解析值())
         終 = self.符號列[self._索引 - 1]
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 列銜句(位置, 列, 列列)
+        return 列銜句(開.位置.start, 終.位置.stop, 列, 列列)
 
     def _解析物定義句(self) -> 物定義句:
         開 = self._期("其物如是")
@@ -1709,41 +1832,35 @@ class 文法分析器:
             鍵符 = self._取()
             if 鍵符.類别 != "言" or 鍵符.值 is None:
                 self._拋出文法錯誤("物鍵當為言", 鍵符.位置.start)
-            鍵 = 言值(鍵符.位置, 鍵符.值)
+            鍵 = 言值(鍵符.位置.start, 鍵符.位置.stop, 鍵符.值)
             self._期("者")
             類型 = self._解析型別詞()
             self._期("曰")
             值節 = self._解析值()
             終符 = self.符號列[self._索引 - 1]
-            屬性列.append(
-                物屬性(slice(鍵符.位置.start, 終符.位置.stop), 鍵, 類型, 值節)
-            )
+            屬性列.append(物屬性(鍵符.位置.start, 終符.位置.stop, 鍵, 類型, 值節))
         self._期("是謂")
         名 = self._解析名()
         終 = self._期("之物也")
-        位置 = slice(開.位置.start, 終.位置.stop)
-        return 物定義句(位置, 名, 屬性列)
+        return 物定義句(開.位置.start, 終.位置.stop, 名, 屬性列)
 
     def _解析凡句(self) -> 凡句:
         開 = self._期("凡")
         容器 = self._解析值()
         self._期("中之")
         變數名 = self._解析名()
-        體 = self._解析語句列(終止詞=frozenset({"云云", "也"}))
+        體 = self._解析語句列(終止詞=_凡體終止詞)
         終符 = self._取()
         if not (self._是關鍵詞(終符, "云云") or self._是關鍵詞(終符, "也")):
             self._拋出文法錯誤("凡未終", 終符.位置.start)
-        位置 = slice(開.位置.start, 終符.位置.stop)
-        return 凡句(位置, 容器, 變數名, 體)
+        return 凡句(開.位置.start, 終符.位置.stop, 容器, 變數名, 體)
 
     def _解析返回句(self, 取棧: bool = False, 空無: bool = False) -> 返回句:
         開 = self._取()
         if 空無:
-            位置 = slice(開.位置.start, 開.位置.stop)
-            return 返回句(位置, None, False, True)
+            return 返回句(開.位置.start, 開.位置.stop, None, False, True)
         if 取棧:
-            位置 = slice(開.位置.start, 開.位置.stop)
-            return 返回句(位置, None, True, False)
+            return 返回句(開.位置.start, 開.位置.stop, None, True, False)
         值節 = self._解析值()
         終點 = 值節.位置.stop
         終符 = self._看()
@@ -1751,8 +1868,7 @@ class 文法分析器:
             self._是關鍵詞(終符, "是矣") or self._是關鍵詞(終符, "是也")
         ):
             終點 = self._取().位置.stop
-        位置 = slice(開.位置.start, 終點)
-        return 返回句(位置, 值節, False, False)
+        return 返回句(開.位置.start, 終點, 值節, False, False)
 
     def _解析算術句(self) -> 算術句:
         開 = self._取()
@@ -1777,8 +1893,7 @@ class 文法分析器:
             終點 = mod符.位置.stop
         else:
             終點 = 乙.位置.stop
-        位置 = slice(開.位置.start, 終點)
-        return 算術句(位置, 運, 左, 右)
+        return 算術句(開.位置.start, 終點, 運, 左, 右)
 
     def _解析夫句(self) -> 句:
         開 = self._期("夫")
@@ -1786,15 +1901,13 @@ class 文法分析器:
         if self._是關鍵詞(self._看(), "之"):
             self._取()
             索 = self._解析值()
-            位置 = slice(開.位置.start, 索.位置.stop)
-            節點: 句 = 之句(位置, 甲, 索)
+            節點: 句 = 之句(開.位置.start, 索.位置.stop, 甲, 索)
             if self._是關鍵詞(self._看(), "者"):
                 self._取()
             return 節點
         if self._是關鍵詞(self._看(), "之長"):
             之長符 = self._取()
-            位置 = slice(開.位置.start, 之長符.位置.stop)
-            節點 = 之長句(位置, 甲)
+            節點 = 之長句(開.位置.start, 之長符.位置.stop, 甲)
             if self._是關鍵詞(self._看(), "者"):
                 self._取()
             return 節點
@@ -1812,15 +1925,13 @@ class 文法分析器:
             if op符 is not None and op符.值 is None and op符.類别 in 邏輯詞對照:
                 self._取()
                 運 = 邏輯詞對照[op符.類别]
-                位置 = slice(開.位置.start, op符.位置.stop)
-                節點 = 算術句(位置, 運, 甲, 乙)
+                節點 = 算術句(開.位置.start, op符.位置.stop, 運, 甲, 乙)
                 if self._是關鍵詞(self._看(), "者"):
                     self._取()
                 return 節點
             # 回退：非邏輯二元，視為僅取值
             self._索引 -= 1
-        位置 = slice(開.位置.start, 甲.位置.stop)
-        節點 = 夫句(位置, 甲)
+        節點 = 夫句(開.位置.start, 甲.位置.stop, 甲)
         if self._是關鍵詞(self._看(), "者"):
             self._取()
         return 節點
@@ -1843,8 +1954,7 @@ class 文法分析器:
                 # 與 @wenyan/cli 對齊：刪除後可寫「是也」，且僅在可收束區塊時保留「也」作終止。
                 if self._可視為區塊終止後繼(self._看()):
                     self.符號列.insert(self._索引, 符號("也", None, 是也符.位置))
-            位置 = slice(開.位置.start, 終點)
-            return 昔今句(位置, 左名, 左下標, None, None, True)
+            return 昔今句(開.位置.start, 終點, 左名, 左下標, None, None, True)
         右值 = self._解析值()
         右下標: 值 | None = None
         if self._是關鍵詞(self._看(), "之"):
@@ -1853,15 +1963,17 @@ class 文法分析器:
         終符 = self._看()
         if 終符 is not None and self._是關鍵詞(終符, "是矣"):
             終 = self._取()
-            位置 = slice(開.位置.start, 終.位置.stop)
-            return 昔今句(位置, 左名, 左下標, 右值, 右下標, False)
+            return 昔今句(
+                開.位置.start, 終.位置.stop, 左名, 左下標, 右值, 右下標, False
+            )
         if 終符 is not None and self._是關鍵詞(終符, "是也"):
             終 = self._取()
             if self._可視為區塊終止後繼(self._看()):
                 # 與 @wenyan/cli 對齊："是也" 視情境可等價於 "是" + "也"，保留 "也" 作區塊終止。
                 self.符號列.insert(self._索引, 符號("也", None, 終.位置))
-            位置 = slice(開.位置.start, 終.位置.stop)
-            return 昔今句(位置, 左名, 左下標, 右值, 右下標, False)
+            return 昔今句(
+                開.位置.start, 終.位置.stop, 左名, 左下標, 右值, 右下標, False
+            )
         if 終符 is not None and 終符.類别 == "數據" and 終符.值 == "是":
             終 = self._取()
             終點 = 終.位置.stop
@@ -1870,43 +1982,47 @@ class 文法分析器:
                 夾段 = self.內容[終.位置.stop : 下符.位置.start]
                 if not any(字 in "。、，" for 字 in 夾段):
                     終點 = self._取().位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 昔今句(位置, 左名, 左下標, 右值, 右下標, False)
+            return 昔今句(開.位置.start, 終點, 左名, 左下標, 右值, 右下標, False)
         if 終符 is not None and self._是關鍵詞(終符, "也"):
             終 = self._取()
-            位置 = slice(開.位置.start, 終.位置.stop)
-            return 昔今句(位置, 左名, 左下標, 右值, 右下標, False)
-        位置 = slice(開.位置.start, self.符號列[self._索引 - 1].位置.stop)
-        return 昔今句(位置, 左名, 左下標, 右值, 右下標, False)
+            return 昔今句(
+                開.位置.start, 終.位置.stop, 左名, 左下標, 右值, 右下標, False
+            )
+        return 昔今句(
+            開.位置.start,
+            self.符號列[self._索引 - 1].位置.stop,
+            左名,
+            左下標,
+            右值,
+            右下標,
+            False,
+        )
 
     def _解析若句(self) -> 若句:
         開 = self._取()
+        起, 迄 = 開.位置.start, 開.位置.stop
         反轉 = False
         if self._是關鍵詞(開, "若其然者"):
-            條件: list[條件原子 | str] = [條件原子(開.位置, 其值(開.位置), None, False)]
+            條件: list[條件原子 | str] = [條件原子(起, 迄, 其值(起, 迄), None, False)]
         elif self._是關鍵詞(開, "若其不然者"):
             反轉 = True
-            條件 = [條件原子(開.位置, 其值(開.位置), None, False)]
+            條件 = [條件原子(起, 迄, 其值(起, 迄), None, False)]
         else:
             條件 = self._解析條件式()
             self._期("者")
-        然 = self._解析語句列(終止詞=frozenset({"或若", "若非", "云云", "也", "是謂"}))
+        然 = self._解析語句列(終止詞=_若體終止詞)
         另若列: list[或若子句] = []
         while self._是關鍵詞(self._看(), "或若"):
             或若開 = self._取()
             或若條 = self._解析條件式()
             self._期("者")
-            或若體 = self._解析語句列(
-                終止詞=frozenset({"或若", "若非", "云云", "也", "是謂"})
-            )
+            或若體 = self._解析語句列(終止詞=_若體終止詞)
             終 = self.符號列[self._索引 - 1]
-            另若列.append(
-                或若子句(slice(或若開.位置.start, 終.位置.stop), 或若條, 或若體)
-            )
+            另若列.append(或若子句(或若開.位置.start, 終.位置.stop, 或若條, 或若體))
         否則: list[句] = []
         if self._是關鍵詞(self._看(), "若非"):
             self._取()
-            否則 = self._解析語句列(終止詞=frozenset({"云云", "也", "是謂"}))
+            否則 = self._解析語句列(終止詞=_若非體終止詞)
         終結 = self._看()
         if 終結 is None:
             終點 = 開.位置.stop
@@ -1916,12 +2032,10 @@ class 文法分析器:
                 終點 = 另若列[-1].位置.stop
             elif 然:
                 終點 = 然[-1].位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 若句(位置, 條件, 反轉, 然, 另若列, 否則)
+            return 若句(開.位置.start, 終點, 條件, 反轉, 然, 另若列, 否則)
         if self._是關鍵詞(終結, "云云") or self._是關鍵詞(終結, "也"):
             終符 = self._取()
-            位置 = slice(開.位置.start, 終符.位置.stop)
-            return 若句(位置, 條件, 反轉, 然, 另若列, 否則)
+            return 若句(開.位置.start, 終符.位置.stop, 條件, 反轉, 然, 另若列, 否則)
         if self._是關鍵詞(終結, "是謂"):
             終點 = 開.位置.stop
             if 否則:
@@ -1930,39 +2044,32 @@ class 文法分析器:
                 終點 = 另若列[-1].位置.stop
             elif 然:
                 終點 = 然[-1].位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 若句(位置, 條件, 反轉, 然, 另若列, 否則)
+            return 若句(開.位置.start, 終點, 條件, 反轉, 然, 另若列, 否則)
         self._拋出文法錯誤("若未終", 開.位置.start)
         raise AssertionError("unreachable")
 
     def _解析恆為是句(self) -> 恆為是句:
         開 = self._期("恆為是")
-        體 = self._解析語句列(
-            終止詞=frozenset({"云云", "也", "是謂", "乃得", "乃得矣", "乃歸空無"})
-        )
+        體 = self._解析語句列(終止詞=_循環體終止詞)
         終符 = self._看()
         if 終符 is not None and (
             self._是關鍵詞(終符, "云云") or self._是關鍵詞(終符, "也")
         ):
             終取 = self._取()
-            位置 = slice(開.位置.start, 終取.位置.stop)
-            return 恆為是句(位置, 體)
+            return 恆為是句(開.位置.start, 終取.位置.stop, 體)
         if 終符 is not None and self._是關鍵詞(終符, "是謂"):
             終點 = 體[-1].位置.stop if 體 else 開.位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 恆為是句(位置, 體)
+            return 恆為是句(開.位置.start, 終點, 體)
         if 終符 is not None and (
             self._是關鍵詞(終符, "乃得")
             or self._是關鍵詞(終符, "乃得矣")
             or self._是關鍵詞(終符, "乃歸空無")
         ):
             終點 = 體[-1].位置.stop if 體 else 開.位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 恆為是句(位置, 體)
+            return 恆為是句(開.位置.start, 終點, 體)
         if 終符 is None:
             終點 = 體[-1].位置.stop if 體 else 開.位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 恆為是句(位置, 體)
+            return 恆為是句(開.位置.start, 終點, 體)
         self._拋出文法錯誤("循環未終", 終符.位置.start)
         raise AssertionError("unreachable")
 
@@ -1970,35 +2077,77 @@ class 文法分析器:
         開 = self._期("為是")
         次數 = self._解析值()
         self._期("遍")
-        體 = self._解析語句列(
-            終止詞=frozenset({"云云", "也", "是謂", "乃得", "乃得矣", "乃歸空無"})
-        )
+        體 = self._解析語句列(終止詞=_循環體終止詞)
         終符 = self._看()
         if 終符 is not None and (
             self._是關鍵詞(終符, "云云") or self._是關鍵詞(終符, "也")
         ):
             終取 = self._取()
-            位置 = slice(開.位置.start, 終取.位置.stop)
-            return 為是遍句(位置, 次數, 體)
+            return 為是遍句(開.位置.start, 終取.位置.stop, 次數, 體)
         if 終符 is not None and self._是關鍵詞(終符, "是謂"):
             終點 = 體[-1].位置.stop if 體 else 開.位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 為是遍句(位置, 次數, 體)
+            return 為是遍句(開.位置.start, 終點, 次數, 體)
         if 終符 is not None and (
             self._是關鍵詞(終符, "乃得")
             or self._是關鍵詞(終符, "乃得矣")
             or self._是關鍵詞(終符, "乃歸空無")
         ):
             終點 = 體[-1].位置.stop if 體 else 開.位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 為是遍句(位置, 次數, 體)
+            return 為是遍句(開.位置.start, 終點, 次數, 體)
         if 終符 is None:
             終點 = 體[-1].位置.stop if 體 else 開.位置.stop
-            位置 = slice(開.位置.start, 終點)
-            return 為是遍句(位置, 次數, 體)
+            return 為是遍句(開.位置.start, 終點, 次數, 體)
         self._拋出文法錯誤("循環未終", 終符.位置.start)
         raise AssertionError("unreachable")
 
+    # ---- 句首分派 -----------------------------------------------------
+
+    # 句首關鍵詞 → 解析之術。新增句類者，於此登記。
+    _句首解析表: dict[str, Callable[["文法分析器"], 句]] = {
+        "吾嘗觀": _解析匯入句,
+        "或云": _解析宏句,
+        "注曰": _解析註釋句,
+        "疏曰": _解析註釋句,
+        "批曰": _解析註釋句,
+        "姑妄行此": _解析試句,
+        "嗚呼": _解析擲句,
+        "取": _解析取句,
+        "以施": _解析以施句,
+        "施": _解析施句,
+        "以": _解析以名之句,
+        "充": _解析列充句,
+        "銜": _解析列銜句,
+        "其物如是": _解析物定義句,
+        "凡": _解析凡句,
+        "乃得矣": lambda 己: 己._解析返回句(取棧=True),
+        "乃歸空無": lambda 己: 己._解析返回句(空無=True),
+        "乃得": _解析返回句,
+        "吾有": _解析有句,
+        "今有": _解析有句,
+        "有": _解析初始化句,
+        "名之曰": _解析命名句,
+        "書之": lambda 己: 己._單符句(書之句),
+        "噫": lambda 己: 己._單符句(噫句),
+        "昔之": _解析昔今句,
+        "加": _解析算術句,
+        "減": _解析算術句,
+        "乘": _解析算術句,
+        "除": _解析算術句,
+        "變": _解析變句,
+        "夫": _解析夫句,
+        "若": _解析若句,
+        "若其然者": _解析若句,
+        "若其不然者": _解析若句,
+        "恆為是": _解析恆為是句,
+        "為是": _解析為是遍句,
+        "是術曰": lambda 己: 己._拒句首("術體不可獨立"),
+        "乃行是術曰": lambda 己: 己._拒句首("術體不可獨立"),
+        "乃止": lambda 己: 己._單符句(乃止句),
+        "乃止是遍": lambda 己: 己._單符句(乃止是遍句),
+        "也": lambda 己: 己._單符句(註釋句, ""),
+        "云云": lambda 己: 己._拒句首("不當之終"),
+    }
+
 
 def _前處理錯誤(內容: str, 文檔名: str, 訊息: str, 索引: int) -> None:
     行號, 列偏移, 行文字 = 計算行列(內容, 索引)
@@ -2020,22 +2169,54 @@ def _取得當前目錄(文檔名: str) -> str:
 
 
 def _嘗試解析文言模組路徑(模組: str, 文檔名: str, 環境: 編譯環境) -> str | None:
-    相對 = 模組.replace("/", os.sep)
     當前目錄 = _取得當前目錄(文檔名)
-    根庫目錄 = os.path.join(環境.根目錄, "lib")
-    平台庫目錄 = os.path.join(環境.根目錄, "lib", "py")
+    鍵 = (模組, 當前目錄)
+    if 鍵 in 環境.解析快取:
+        return 環境.解析快取[鍵]
+    路徑 = _解析文言模組(模組, 當前目錄, 環境.根目錄)
+    環境.解析快取[鍵] = 路徑
+    return 路徑
+
+
+def _解析文言模組(模組: str, 當前目錄: str, 根目錄: str) -> str | None:
+    鍵 = (模組, 當前目錄, 根目錄)
+    快取 = _模組解析快取.get(鍵)
+    if 快取 is not None and all(_目錄時(目錄) == 時 for 目錄, 時 in 快取[1]):
+        return 快取[0]
+
+    相對 = 模組.replace("/", os.sep)
+    上層, 葉 = os.path.split(相對)
+    根庫目錄 = os.path.join(根目錄, "lib")
+    平台庫目錄 = os.path.join(根目錄, "lib", "py")
     if 相對 == "曆法":
         搜尋目錄 = [當前目錄, 根庫目錄, 平台庫目錄]
     else:
         搜尋目錄 = [當前目錄, 平台庫目錄, 根庫目錄]
+    索引 = _取庫索引(根目錄)
+    所經: list[tuple[str, int | None]] = []
+
+    # 索引所載之目錄逕信之；餘者列其目錄並記 mtime，後用時目錄未變則結果仍有效。
+    def 列(目錄: str) -> frozenset[str]:
+        目錄 = os.path.normpath(目錄)
+        if 目錄 in 索引:
+            return 索引[目錄]
+        所經.append((目錄, _目錄時(目錄)))
+        return _快取列目錄(目錄)
+
+    路徑: str | None = None
     for 基 in 搜尋目錄:
-        候選 = os.path.join(基, f"{相對}.wy")
-        if os.path.isfile(候選):
-            return os.path.abspath(候選)
-        候選 = os.path.join(基, 相對, "序.wy")
-        if os.path.isfile(候選):
-            return os.path.abspath(候選)
-    return None
+        父 = os.path.join(基, 上層)
+        名錄 = 列(父)
+        候選 = os.path.join(父, f"{葉}.wy")
+        if f"{葉}.wy" in 名錄 and os.path.isfile(候選):
+            路徑 = os.path.abspath(候選)
+            break
+        候選 = os.path.join(父, 葉, "序.wy")
+        if 葉 in 名錄 and "序.wy" in 列(os.path.join(父, 葉)) and os.path.isfile(候選):
+            路徑 = os.path.abspath(候選)
+            break
+    _模組解析快取[鍵] = (路徑, tuple(所經))
+    return 路徑
 
 
 def _解析模組路徑(
@@ -2076,19 +2257,6 @@ def _串接(*項: ast.expr) -> ast.expr:
     return 式
 
 
-def _造屬性指派(主體名: str, 屬性名: str, 值: ast.expr) -> ast.Assign:
-    return ast.Assign(
-        targets=[
-            ast.Attribute(
-                value=ast.Name(id=主體名, ctx=ast.Load()),
-                attr=屬性名,
-                ctx=ast.Store(),
-            )
-        ],
-        value=值,
-    )
-
-
 def _造輸出餘項文字函() -> ast.FunctionDef:
     _載 = _載名
 
@@ -2200,244 +2368,121 @@ def _造輸出可單行函() -> ast.FunctionDef:
     )
 
 
-def _造術呼叫函(函名: str) -> ast.FunctionDef:
-    _載, _存, _叫 = _載名, _存名, _叫函
+# 輸出格式之速路：常見純量直接回傳，六項以內之純量平列直接排版，
+# 皆於建立內部輔助函式之前返回；巢狀、長列與子類別才走完整分組演算法。
+# 結果須與下方通則逐字相同（單行判定即 `可單行` 之展開）。
+_輸出格式速路源碼 = """
+型 = type(值)
+if 型 is int:
+    return str(值)
+if 型 is str:
+    return 值
+if 型 is float:
+    return str(int(值)) if 值.is_integer() else str(值)
+if 型 is bool:
+    return 'true' if 值 else 'false'
+if 值 is None:
+    return 'None'
+if 型 is list and len(值) <= 6:
+    項列 = []
+    for 元 in 值:
+        元型 = type(元)
+        if 元型 is int:
+            項列.append(str(元))
+        elif 元型 is float:
+            項列.append(str(int(元)) if 元.is_integer() else str(元))
+        elif 元型 is str:
+            項列.append(元)
+        elif 元型 is bool:
+            項列.append('true' if 元 else 'false')
+        elif 元 is None:
+            項列.append('None')
+        else:
+            break
+    else:
+        項數 = len(項列)
+        起算 = 項數 * 2 + 縮排 + 11
+        if 起算 + 項數 <= 80 and 起算 + sum(map(len, 項列)) <= 80:
+            併 = ', '.join(項列)
+            if '\\n' not in 併:
+                return f'[ {併} ]'
+        前綴 = '\\n' + ' ' * 縮排
+        return '[' + 前綴 + '  ' + (',' + 前綴 + '  ').join(項列) + 前綴 + ']'
+"""
+
 
-    return ast.FunctionDef(
-        name=函名,
+def _造輸出格式函(函名: str) -> ast.FunctionDef:
+    _載, _存 = _載名, _存名
+    _叫, _串加 = _叫函, _串接
+
+    餘項文字函 = _造輸出餘項文字函()
+    可單行函 = _造輸出可單行函()
+
+    分組列元素函 = ast.FunctionDef(
+        name="分組列元素",
         args=ast.arguments(
             posonlyargs=[],
-            args=[ast.arg(arg="術", annotation=None)],
-            vararg=ast.arg(arg="args", annotation=None),
+            args=[
+                ast.arg(arg="項列", annotation=None),
+                ast.arg(arg="原列", annotation=None),
+                ast.arg(arg="縮排", annotation=None),
+                ast.arg(arg="斷行寬", annotation=None),
+                ast.arg(arg="緊湊度", annotation=None),
+                ast.arg(arg="列上限", annotation=None),
+            ],
+            vararg=None,
             kwonlyargs=[],
             kw_defaults=[],
             kwarg=None,
             defaults=[],
         ),
         body=[
-            ast.Try(
-                body=[
-                    ast.Assign(
-                        targets=[_存("需")],
-                        value=ast.Attribute(
-                            value=_載("術"), attr="__文言術參數數__", ctx=ast.Load()
+            ast.Assign(targets=[_存("總長")], value=ast.Constant(value=0)),
+            ast.Assign(targets=[_存("最長")], value=ast.Constant(value=0)),
+            ast.Assign(
+                targets=[_存("可分組項數")], value=_叫(_載("len"), [_載("項列")])
+            ),
+            ast.If(
+                test=ast.BoolOp(
+                    op=ast.And(),
+                    values=[
+                        ast.Compare(
+                            left=_叫(_載("len"), [_載("原列")]),
+                            ops=[ast.Gt()],
+                            comparators=[_載("列上限")],
                         ),
-                    )
-                ],
-                handlers=[
-                    ast.ExceptHandler(
-                        type=_載("AttributeError"),
-                        name=None,
-                        body=[
-                            ast.Return(
-                                value=_叫(
-                                    _載("術"),
-                                    [ast.Starred(value=_載("args"), ctx=ast.Load())],
-                                )
-                            )
-                        ],
+                        _載("項列"),
+                    ],
+                ),
+                body=[
+                    ast.AugAssign(
+                        target=_存("可分組項數"),
+                        op=ast.Sub(),
+                        value=ast.Constant(value=1),
                     )
                 ],
                 orelse=[],
-                finalbody=[],
             ),
             ast.Assign(
-                targets=[_存("接其餘")],
-                value=_叫(
-                    _載("getattr"),
-                    [
-                        _載("術"),
-                        ast.Constant(value="__文言術接其餘__"),
-                        ast.Constant(value=False),
-                    ],
+                targets=[_存("資料長")],
+                value=ast.BinOp(
+                    left=ast.List(elts=[ast.Constant(value=0)], ctx=ast.Load()),
+                    op=ast.Mult(),
+                    right=_載("可分組項數"),
                 ),
             ),
-            ast.Assign(
-                targets=[_存("已")],
-                value=_叫(_載("len"), [_載("args")]),
-            ),
-            ast.If(
-                test=ast.Compare(
-                    left=_載("已"), ops=[ast.GtE()], comparators=[_載("需")]
-                ),
+            ast.For(
+                target=_存("索"),
+                iter=_叫(_載("range"), [_載("可分組項數")]),
                 body=[
-                    ast.If(
-                        test=_載("接其餘"),
-                        body=[
-                            ast.Return(
-                                value=_叫(
-                                    _載("術"),
-                                    [ast.Starred(value=_載("args"), ctx=ast.Load())],
-                                )
-                            )
-                        ],
-                        orelse=[],
-                    ),
                     ast.Assign(
-                        targets=[_存("結")],
+                        targets=[_存("長度")],
                         value=_叫(
-                            _載("術"),
+                            _載("len"),
                             [
-                                ast.Starred(
-                                    value=ast.Subscript(
-                                        value=_載("args"),
-                                        slice=ast.Slice(
-                                            lower=None, upper=_載("需"), step=None
-                                        ),
-                                        ctx=ast.Load(),
-                                    ),
-                                    ctx=ast.Load(),
-                                )
-                            ],
-                        ),
-                    ),
-                    ast.If(
-                        test=ast.Compare(
-                            left=_載("已"), ops=[ast.Eq()], comparators=[_載("需")]
-                        ),
-                        body=[ast.Return(value=_載("結"))],
-                        orelse=[],
-                    ),
-                    ast.Return(
-                        value=_叫(
-                            _載(函名),
-                            [
-                                _載("結"),
-                                ast.Starred(
-                                    value=ast.Subscript(
-                                        value=_載("args"),
-                                        slice=ast.Slice(
-                                            lower=_載("需"), upper=None, step=None
-                                        ),
-                                        ctx=ast.Load(),
-                                    ),
-                                    ctx=ast.Load(),
-                                ),
-                            ],
-                        )
-                    ),
-                ],
-                orelse=[],
-            ),
-            ast.FunctionDef(
-                name="_後續",
-                args=ast.arguments(
-                    posonlyargs=[],
-                    args=[],
-                    vararg=ast.arg(arg="後", annotation=None),
-                    kwonlyargs=[],
-                    kw_defaults=[],
-                    kwarg=None,
-                    defaults=[],
-                ),
-                body=[
-                    ast.Return(
-                        value=_叫(
-                            _載(函名),
-                            [
-                                _載("術"),
-                                ast.Starred(
-                                    value=ast.BinOp(
-                                        left=_載("args"),
-                                        op=ast.Add(),
-                                        right=_載("後"),
-                                    ),
-                                    ctx=ast.Load(),
-                                ),
-                            ],
-                        )
-                    )
-                ],
-                decorator_list=[],
-                returns=None,
-                type_comment=None,
-            ),
-            _造屬性指派(
-                "_後續",
-                "__文言術參數數__",
-                ast.BinOp(left=_載("需"), op=ast.Sub(), right=_載("已")),
-            ),
-            _造屬性指派("_後續", "__文言術接其餘__", _載("接其餘")),
-            ast.Return(value=_載("_後續")),
-        ],
-        decorator_list=[],
-        returns=None,
-        type_comment=None,
-    )
-
-
-def _造輸出格式函(函名: str) -> ast.FunctionDef:
-    _載, _存 = _載名, _存名
-    _叫, _串加 = _叫函, _串接
-
-    餘項文字函 = _造輸出餘項文字函()
-    可單行函 = _造輸出可單行函()
-
-    分組列元素函 = ast.FunctionDef(
-        name="分組列元素",
-        args=ast.arguments(
-            posonlyargs=[],
-            args=[
-                ast.arg(arg="項列", annotation=None),
-                ast.arg(arg="原列", annotation=None),
-                ast.arg(arg="縮排", annotation=None),
-                ast.arg(arg="斷行寬", annotation=None),
-                ast.arg(arg="緊湊度", annotation=None),
-                ast.arg(arg="列上限", annotation=None),
-            ],
-            vararg=None,
-            kwonlyargs=[],
-            kw_defaults=[],
-            kwarg=None,
-            defaults=[],
-        ),
-        body=[
-            ast.Assign(targets=[_存("總長")], value=ast.Constant(value=0)),
-            ast.Assign(targets=[_存("最長")], value=ast.Constant(value=0)),
-            ast.Assign(
-                targets=[_存("可分組項數")], value=_叫(_載("len"), [_載("項列")])
-            ),
-            ast.If(
-                test=ast.BoolOp(
-                    op=ast.And(),
-                    values=[
-                        ast.Compare(
-                            left=_叫(_載("len"), [_載("原列")]),
-                            ops=[ast.Gt()],
-                            comparators=[_載("列上限")],
-                        ),
-                        _載("項列"),
-                    ],
-                ),
-                body=[
-                    ast.AugAssign(
-                        target=_存("可分組項數"),
-                        op=ast.Sub(),
-                        value=ast.Constant(value=1),
-                    )
-                ],
-                orelse=[],
-            ),
-            ast.Assign(
-                targets=[_存("資料長")],
-                value=ast.BinOp(
-                    left=ast.List(elts=[ast.Constant(value=0)], ctx=ast.Load()),
-                    op=ast.Mult(),
-                    right=_載("可分組項數"),
-                ),
-            ),
-            ast.For(
-                target=_存("索"),
-                iter=_叫(_載("range"), [_載("可分組項數")]),
-                body=[
-                    ast.Assign(
-                        targets=[_存("長度")],
-                        value=_叫(
-                            _載("len"),
-                            [
-                                ast.Subscript(
-                                    value=_載("項列"),
-                                    slice=_載("索"),
+                                ast.Subscript(
+                                    value=_載("項列"),
+                                    slice=_載("索"),
                                     ctx=ast.Load(),
                                 )
                             ],
@@ -3811,6 +3856,7 @@ def _造輸出格式函(函名: str) -> ast.FunctionDef:
             defaults=[ast.Constant(value=0)],
         ),
         body=[
+            *ast.parse(_輸出格式速路源碼, filename="<輸出格式>").body,
             餘項文字函,
             可單行函,
             分組列元素函,
@@ -3878,9 +3924,16 @@ def _造輸出格式函(函名: str) -> ast.FunctionDef:
 
 內建序言源碼 = """
 import json
+import sys as __系統
 
 __暫存 = []
+# 列之 <=0 下標槽：id(列) → (列, {索: 值})。表持列之強參照，故 id 不致被重用；
+# 表長達上限時清掃，見 `__負索清掃`。
 __文言負索 = {}
+__文言負索上限 = 64
+__文言負索可掃 = __系統.implementation.name == "cpython" and getattr(
+    __系統, "_is_gil_enabled", lambda: True
+)()
 
 
 def __其():
@@ -3909,6 +3962,71 @@ def __取其餘():
     return 片
 
 
+def __負索清掃():
+    # 以 sys.getrefcount 減去本表諸列、諸槽之引用，得各列之外引；外引皆無者（含自引、
+    # 互引之環）清之。上限隨存活數倍增，亦不少於掃量之八一，故清掃之功攤於每次登記。
+    # 此法恃引用計數精確：基準以同形之探列實測，不設死數，然仍限於有 GIL 之 CPython。
+    # 他者（PyPy、GraalPy、free-threaded）無從知列之存亡，寧留其槽而不清，表隨之長。
+    global __文言負索上限
+    if not __文言負索可掃:
+        __文言負索上限 = 2 * len(__文言負索)
+        return
+    引用數 = __系統.getrefcount
+    探 = {0: ([], None)}
+    for 項 in 探.values():
+        基準 = 引用數(項[0])
+    外引 = {}
+    for 鍵, 項 in __文言負索.items():
+        外引[鍵] = 引用數(項[0]) - 基準
+    掃量 = 0
+    for 項 in __文言負索.values():
+        for 容 in (項[0], 項[1].values()):
+            掃量 += len(容)
+            for 子 in 容:
+                if id(子) in 外引:
+                    外引[id(子)] -= 1
+    活 = [鍵 for 鍵, 數 in 外引.items() if 數 > 0]
+    存 = set(活)
+    while 活:
+        項 = __文言負索[活.pop()]
+        for 容 in (項[0], 項[1].values()):
+            for 子 in 容:
+                if id(子) in 外引 and id(子) not in 存:
+                    存.add(id(子))
+                    活.append(id(子))
+    for 鍵 in 外引:
+        if 鍵 not in 存:
+            del __文言負索[鍵]
+    __文言負索上限 = max(64, 2 * len(__文言負索), len(__文言負索) + 掃量 // 8)
+
+
+def __負索取(物, 索):
+    項 = __文言負索.get(id(物))
+    if 項 is None:
+        return None
+    return 項[1].get(索)
+
+
+def __負索置(物, 索, 實):
+    項 = __文言負索.get(id(物))
+    if 項 is None:
+        if len(__文言負索) >= __文言負索上限:
+            __負索清掃()
+        項 = __文言負索[id(物)] = (物, {})
+    項[1][索] = 實
+    return 實
+
+
+def __負索刪(物, 索):
+    項 = __文言負索.get(id(物))
+    if 項 is None:
+        return None
+    項[1].pop(索, None)
+    if not 項[1]:
+        del __文言負索[id(物)]
+    return None
+
+
 def 取物(物, 端):
     if isinstance(端, str):
         if isinstance(物, dict):
@@ -3924,7 +4042,7 @@ def 取物(物, 端):
     索 = int(端)
     if isinstance(物, list):
         if 索 <= 0:
-            return __文言負索.get((id(物), 索))
+            return __負索取(物, 索)
         if 索 > len(物):
             return None
         return 物[索 - 1]
@@ -3946,8 +4064,7 @@ def 置物(物, 端, 實):
     索 = int(端)
     if isinstance(物, list):
         if 索 <= 0:
-            __文言負索[(id(物), 索)] = 實
-            return 實
+            return __負索置(物, 索, 實)
         索 -= 1
         if 索 >= len(物):
             物.extend([None] * (索 - len(物) + 1))
@@ -3972,8 +4089,7 @@ def 刪物(物, 端):
     索 = int(端)
     if isinstance(物, list):
         if 索 <= 0:
-            __文言負索.pop((id(物), 索), None)
-            return None
+            return __負索刪(物, 索)
         if 索 <= len(物):
             del 物[索 - 1]
         return None
@@ -4039,6 +4155,173 @@ def 載模組(模組名):
     return __import__(模組名)
 
 
+# 數→漢字：漢字數字之逆。整數逐四位一段，段內以兩張百格表（千百、十個）查之，段間以萬、億、兆…
+# 分組；小數至多十二位以分釐毫…記之，過長者逐位以「·」記之。百內之數預存快取，其餘小整數用後存之。
+__漢字數碼 = "零一二三四五六七八九"
+__漢字大位 = ("", "萬", "億", "兆", "京", "垓", "秭", "穰", "溝", "澗", "正", "載", "極")
+__漢字小數位 = "分釐毫絲忽微纖沙塵埃渺漠"
+__漢字千百 = [
+    (__漢字數碼[i // 10] + "千" if i >= 10 else "") + (__漢字數碼[i % 10] + "百" if i % 10 else "")
+    for i in range(100)
+]
+__漢字十個 = [
+    (__漢字數碼[i // 10] + "十" if i >= 10 else "") + (__漢字數碼[i % 10] if i % 10 else "")
+    for i in range(100)
+]
+__漢字快取 = {i: 文[1:] if 10 <= i < 20 else 文 or "零" for i, 文 in enumerate(__漢字十個)}
+__漢字快取上限 = 65536
+
+
+def __漢字逐位(數字):
+    return "".join([__漢字數碼[ord(字) - 48] for 字 in 數字])
+
+
+def __漢字段(段):
+    高, 低 = divmod(段, 100)
+    if not 高:
+        return __漢字十個[低]
+    if not 低:
+        return __漢字千百[高]
+    if 高 % 10 == 0 or 低 < 10:
+        return __漢字千百[高] + "零" + __漢字十個[低]
+    return __漢字千百[高] + __漢字十個[低]
+
+
+def __整轉漢字(數):
+    if 數 < 10000:
+        if 數 == 0:
+            return "零"
+        文 = __漢字段(數)
+        return 文[1:] if 10 <= 數 < 20 else 文
+    if 數 >= 10000 ** len(__漢字大位):
+        return __漢字逐位(str(數))
+    段列 = []
+    while 數:
+        數, 段 = divmod(數, 10000)
+        段列.append(段)
+    結果 = []
+    缺 = False
+    for 序 in range(len(段列) - 1, -1, -1):
+        段 = 段列[序]
+        if not 段:
+            缺 = True
+            continue
+        if 結果 and (缺 or 段 < 1000):
+            結果.append("零")
+        缺 = False
+        結果.append(__漢字段(段) + __漢字大位[序])
+    文 = "".join(結果)
+    return 文[1:] if 文.startswith("一十") else 文
+
+
+def __數轉漢字(數):
+    文 = __漢字快取.get(數)
+    if 文 is not None:
+        return 文
+    if type(數) is float:
+        if 數 != 數 or 數 in (float("inf"), float("-inf")):
+            return __輸出格式值(數, 0)
+        if 數.is_integer():
+            return __數轉漢字(int(數))
+        數字 = repr(abs(數))
+        if "e" in 數字:
+            數字 = format(__import__("decimal").Decimal(數字), "f")
+        整數, 小數 = 數字.split(".")
+        if len(小數) > len(__漢字小數位):
+            文 = __漢字逐位(整數) + "·" + __漢字逐位(小數)
+        else:
+            尾 = "".join(
+                [__漢字數碼[ord(字) - 48] + __漢字小數位[序] for 序, 字 in enumerate(小數) if 字 != "0"]
+            )
+            文 = 尾 if 整數 == "0" else __整轉漢字(int(整數)) + "又" + 尾
+        return "負" + 文 if 數 < 0 else 文
+    文 = __整轉漢字(-數 if 數 < 0 else 數)
+    if 數 < 0:
+        文 = "負" + 文
+    if -__漢字快取上限 < 數 < __漢字快取上限:
+        __漢字快取[數] = 文
+    return 文
+
+
+def __漢字格式值(值, 縮排=0):
+    型 = type(值)
+    if 型 is str:
+        return 值
+    if 型 is int or 型 is float:
+        文 = __漢字快取.get(值)
+        return 文 if 文 is not None else __數轉漢字(值)
+    if 型 is bool:
+        return "陽" if 值 else "陰"
+    return __輸出格式值(值, 縮排)
+
+
+# 書之之輸出：模式於程式起始時定一次；模組本體執行期間逐行累積（段為 None 即直寫）。
+class 文言書者:
+    上限 = 4096
+
+    def __init__(self, 系統, 格式, 緩衝, 即時):
+        self.系統 = 系統
+        self.格式 = 格式
+        self.即時 = 即時
+        self.段 = [] if 緩衝 else None
+
+    def 書(self, 值列):
+        格式 = self.格式
+        if 格式 is None:
+            文 = str(值列[0]) if len(值列) == 1 else " ".join(map(str, 值列))
+        else:
+            文 = " ".join([格式(值, 0) for 值 in 值列])
+        段 = self.段
+        if 段 is None:
+            self.系統.stdout.write(文 + "\\n")
+            if self.即時:
+                self.系統.stdout.flush()
+            return
+        段.append(文)
+        if len(段) >= self.上限:
+            self.清()
+
+    def 清(self):
+        段 = self.段
+        if 段:
+            文 = "\\n".join(段) + "\\n"
+            段.clear()
+            self.系統.stdout.write(文)
+
+    def 閉(self):
+        self.清()
+        self.段 = None
+
+
+# 文言術：本體、固定參數數、接其餘與已綁之先參同居一物。參足即呼本體；不足則回傳綁定更多先參之
+# 新術；逾數則以前段結果承餘參（接其餘者餘參收為一列）。
+class 文言術:
+    __slots__ = ("本", "需", "接其餘", "名", "先")
+
+    def __init__(self, 本, 需, 接其餘, 名, 先=()):
+        self.本 = 本
+        self.需 = 需
+        self.接其餘 = 接其餘
+        self.名 = 名
+        self.先 = 先
+
+    def __call__(self, *參):
+        if self.先:
+            參 = self.先 + 參
+        需 = self.需
+        已 = len(參)
+        if 已 == 需 and not self.接其餘:
+            return self.本(*參)
+        if 已 < 需:
+            return 文言術(self.本, 需, self.接其餘, self.名, 參)
+        if self.接其餘:
+            return self.本(*參[:需], list(參[需:]))
+        return self.本(*參[:需])(*參[需:])
+
+    def __repr__(self):
+        return f"<術 {self.名}>"
+
+
 class 文言之禍(Exception):
     def __init__(self, 名, 訊=None):
         super().__init__(訊)
@@ -4079,24 +4362,50 @@ class String:
             return chr(int(值))
         except (TypeError, ValueError):
             return ""
+"""
 
 
-JSON.stringify.__文言術參數數__ = 1
-String.fromCharCode.__文言術參數數__ = 1
-取物.__文言術參數數__ = 2
-置物.__文言術參數數__ = 3
-刪物.__文言術參數數__ = 2
-列物之端.__文言術參數數__ = 1
-識類.__文言術參數數__ = 1
-除零商.__文言術參數數__ = 1
-除零餘.__文言術參數數__ = 0
-空術.__文言術參數數__ = 1
-載模組.__文言術參數數__ = 1
-"""
+@lru_cache(maxsize=1)
+def _內建序言句組() -> tuple[ast.stmt, ...]:
+    """序言之 AST，標為生成之碼；諸模組共用，勿就地改之。"""
+
+    句組 = tuple(ast.parse(內建序言源碼, filename="<內建序言>").body)
+    _標位(句組, _生成位, 覆寫=True)
+    return 句組
 
 
 def _內建序言AST() -> list[ast.stmt]:
-    return ast.parse(內建序言源碼, filename="<內建序言>").body
+    return list(_內建序言句組())
+
+
+@lru_cache(maxsize=8)
+def _輸出助函句組(格式函名: str, 書者名: str | None) -> tuple[ast.stmt, ...]:
+    """輸出格式函及書者之初始化（`書者名` 為 None 者略之），標為生成之碼；諸模組共用，勿就地改之。"""
+
+    句組: tuple[ast.stmt, ...] = (_造輸出格式函(格式函名),)
+    if 書者名 is not None:
+        句組 += tuple(_書者初始化AST(書者名, 格式函名))
+    _標位(句組, _生成位, 覆寫=True)
+    return 句組
+
+
+def _書者初始化AST(書者名: str, 格式函名: str) -> list[ast.stmt]:
+    """於輸出格式函定義之後建立書之輸出者；輸出模式與緩衝與否僅於此判定一次。
+
+    `__wenyan_no_output_hanzi__` 優先；否則 `__wenyan_output_hanzi__` 為真時數以漢字書之。
+    """
+
+    源碼 = (
+        f"{書者名} = 文言書者(\n"
+        "    __系統,\n"
+        f"    {格式函名} if globals().get('__wenyan_no_output_hanzi__', False)\n"
+        "    else __漢字格式值 if globals().get('__wenyan_output_hanzi__', False)\n"
+        "    else None,\n"
+        "    not globals().get('__wenyan_unbuffered__', False),\n"
+        "    globals().get('__wenyan_unbuffered__', False),\n"
+        ")\n"
+    )
+    return ast.parse(源碼, filename="<內建序言>").body
 
 
 def _掃描匯入(內容: str, 文檔名: str) -> list[tuple[str, slice]]:
@@ -4268,6 +4577,27 @@ def 擴展宏(內容: str, 宏列: list[宏定義], 文檔名: str) -> str:
     return 內容
 
 
+_前處理依據 = frozenset[tuple[str, str, str | None]]
+
+
+def _收集匯入宏(
+    內容: str, 文檔名: str, 環境: 編譯環境
+) -> tuple[list[宏定義], _前處理依據]:
+    """收 `內容` 所匯入諸書之宏；並返所經之匯入解析 `(模組, 當前目錄, 路徑)`，連遞迴者。"""
+
+    當前目錄 = _取得當前目錄(文檔名)
+    宏列: list[宏定義] = []
+    依據: set[tuple[str, str, str | None]] = set()
+    for 模組, 位 in _掃描匯入(內容, 文檔名):
+        模組路徑 = _嘗試解析文言模組路徑(模組, 文檔名, 環境)
+        依據.add((模組, 當前目錄, 模組路徑))
+        if 模組路徑 is None:
+            continue
+        宏列.extend(_收集宏遞迴(模組路徑, 文檔名, 內容, 位, 環境))
+        依據 |= 環境.宏依據[模組路徑]
+    return 宏列, frozenset(依據)
+
+
 def _收集宏遞迴(
     路徑: str, 文檔名: str, 內容: str, 位置: slice, 環境: 編譯環境
 ) -> list[宏定義]:
@@ -4277,34 +4607,52 @@ def _收集宏遞迴(
         _前處理錯誤(內容, 文檔名, "循環匯入", 位置.start)
     環境.宏解析中.add(路徑)
     原文 = _讀取源碼(路徑, 環境)
-    匯入列 = _掃描匯入(原文, 路徑)
-    宏列: list[宏定義] = []
-    for 模組, 位 in 匯入列:
-        模組路徑 = _嘗試解析文言模組路徑(模組, 路徑, 環境)
-        if 模組路徑 is None:
-            continue
-        宏列.extend(_收集宏遞迴(模組路徑, 路徑, 原文, 位, 環境))
+    宏列, 依據 = _收集匯入宏(原文, 路徑, 環境)
     宏列.extend(收集宏(原文, 路徑))
     環境.宏解析中.remove(路徑)
     環境.宏快取[路徑] = 宏列
+    環境.宏依據[路徑] = 依據
     return 宏列
 
 
-def _前處理源碼(內容: str, 文檔名: str, 環境: 編譯環境) -> str:
-    匯入列 = _掃描匯入(內容, 文檔名)
-    宏列: list[宏定義] = []
-    for 模組, 位 in 匯入列:
-        模組路徑 = _嘗試解析文言模組路徑(模組, 文檔名, 環境)
-        if 模組路徑 is None:
-            continue
-        宏列.extend(_收集宏遞迴(模組路徑, 文檔名, 內容, 位, 環境))
+def _前處理(內容: str, 文檔名: str, 環境: 編譯環境) -> tuple[str, _前處理依據]:
+    宏列, 依據 = _收集匯入宏(內容, 文檔名, 環境)
     宏列.extend(收集宏(內容, 文檔名))
-    return 擴展宏(內容, 宏列, 文檔名)
+    return 擴展宏(內容, 宏列, 文檔名), 依據
+
+
+def _前處理源碼(內容: str, 文檔名: str, 環境: 編譯環境) -> str:
+    return _前處理(內容, 文檔名, 環境)[0]
 
 
 def _解析前處理(內容: str, 文檔名: str, 環境: 編譯環境) -> tuple[程式, str]:
-    處理後 = _前處理源碼(內容, 文檔名, 環境)
+    """前處理並解析；`文檔名` 為實檔者，先查其 `.wyast` 快取，不中則解析後寫之。"""
+
+    快取檔 = _語法樹快取檔(文檔名) if 環境.語法樹快取 else None
+    if 快取檔 is None:
+        處理後 = _前處理源碼(內容, 文檔名, 環境)
+        return 文法分析器(處理後, 文檔名).解析程式(), 處理後
+    雜湊 = _源碼雜湊(內容)
+    已存 = _讀語法樹快取(快取檔, 雜湊, 內容, 環境)
+    if 已存 is not None:
+        return 已存
+    處理後, 依據 = _前處理(內容, 文檔名, 環境)
     程 = 文法分析器(處理後, 文檔名).解析程式()
+    if not sys.dont_write_bytecode:
+        附 = (
+            _剖析器戳(),
+            None if 處理後 == 內容 else 處理後,
+            tuple(
+                (
+                    模組,
+                    目錄,
+                    路徑,
+                    None if 路徑 is None else _源碼雜湊(_讀取源碼(路徑, 環境)),
+                )
+                for 模組, 目錄, 路徑 in 依據
+            ),
+        )
+        _寫語法樹快取(快取檔, _封語法樹(程, 雜湊, 附))
     return 程, 處理後
 
 
@@ -4316,6 +4664,251 @@ def 解析(內容: str, 文檔名: str = "<言>") -> 程式:
     return 程
 
 
+# ---------------------------------------------------------------------------
+# Wenyan AST 序列化（.wyast）
+# ---------------------------------------------------------------------------
+
+# 檔首：魔數、格式版、綱要指紋（4 位元組）、源碼雜湊（16 位元組）；其後為 zlib 所壓之
+# marshal 體 `(附, 始, 終, 句封列)`。節點封為 `(類序, 始, 終, *欄)` 之 tuple，欄中之列仍
+# 為 list，他值原樣；節點欄無 tuple，故 tuple 即節點。
+_語法樹魔數 = b"WYAST"
+_語法樹格式版 = 1
+_語法樹首長 = len(_語法樹魔數) + 1 + 4 + 16
+_語法樹類列: tuple[type[節點], ...] = (
+    名值,
+    言值,
+    數值,
+    爻值,
+    其值,
+    其餘值,
+    宣告句,
+    初始化句,
+    命名句,
+    匯入句,
+    術參數,
+    術定義句,
+    施句,
+    以施句,
+    取句,
+    返回句,
+    列充句,
+    列銜句,
+    物屬性,
+    物定義句,
+    書之句,
+    噫句,
+    算術句,
+    變句,
+    夫句,
+    之句,
+    之長句,
+    昔今句,
+    條件原子,
+    或若子句,
+    若句,
+    恆為是句,
+    為是遍句,
+    乃止句,
+    乃止是遍句,
+    凡句,
+    捕捉子句,
+    試句,
+    擲句,
+    註釋句,
+    宏句,
+)
+_語法樹類序 = {類: 序 for 序, 類 in enumerate(_語法樹類列)}
+_語法樹欄表 = tuple(tuple(欄.name for 欄 in fields(類))[2:] for 類 in _語法樹類列)
+# 類序、欄名或 marshal 版一變，舊檔即不可讀。
+_語法樹綱要 = zlib.crc32(
+    repr(
+        (
+            marshal.version,
+            [(類.__name__, 欄) for 類, 欄 in zip(_語法樹類列, _語法樹欄表)],
+        )
+    ).encode("utf-8")
+)
+
+
+def _源碼雜湊(內容: str) -> bytes:
+    return hashlib.blake2b(內容.encode("utf-8"), digest_size=16).digest()
+
+
+@lru_cache(maxsize=1)
+def _剖析器戳() -> tuple[int, int]:
+    """本檔之大小與 mtime；剖析器一改，快取即廢（綱要未變亦然）。"""
+
+    try:
+        狀 = os.stat(__file__)
+    except OSError:
+        return (0, 0)
+    return (狀.st_size, 狀.st_mtime_ns)
+
+
+def _封節(值: object, 字表: dict[str, str]) -> object:
+    if type(值) is str:
+        # 同文之名共一物，marshal 乃以參照記之。
+        return 字表.setdefault(值, 值)
+    if type(值) is list:
+        return [_封節(子, 字表) for 子 in 值]
+    if isinstance(值, 節點):
+        序 = _語法樹類序[type(值)]
+        return (
+            序,
+            值.始,
+            值.終,
+            *[_封節(getattr(值, 名), 字表) for 名 in _語法樹欄表[序]],
+        )
+    return 值
+
+
+def _復節(值: object) -> object:
+    if type(值) is tuple:
+        return _語法樹類列[值[0]](值[1], 值[2], *[_復節(子) for 子 in 值[3:]])
+    if type(值) is list:
+        return [_復節(子) for 子 in 值]
+    return 值
+
+
+def _封語法樹(程: 程式, 源碼雜湊: bytes, 附: object = None) -> bytes:
+    字表: dict[str, str] = {}
+    體 = (附, 程.始, 程.終, tuple(_封節(節, 字表) for 節 in 程.句列))
+    return b"".join(
+        (
+            _語法樹魔數,
+            bytes((_語法樹格式版,)),
+            _語法樹綱要.to_bytes(4, "little"),
+            源碼雜湊.ljust(16, b"\0"),
+            zlib.compress(marshal.dumps(cast(Any, 體))),
+        )
+    )
+
+
+def _驗語法樹首(首: bytes) -> bytes:
+    """驗檔首，返源碼雜湊。"""
+
+    if len(首) < _語法樹首長 or not 首.startswith(_語法樹魔數):
+        raise ValueError("非 Wenyan AST 序列")
+    格式版 = 首[len(_語法樹魔數)]
+    綱要 = int.from_bytes(首[len(_語法樹魔數) + 1 : len(_語法樹魔數) + 5], "little")
+    if 格式版 != _語法樹格式版 or 綱要 != _語法樹綱要:
+        raise ValueError("Wenyan AST 序列版本不符")
+    return 首[len(_語法樹魔數) + 5 : _語法樹首長]
+
+
+def _拆語法樹(資料: bytes) -> tuple[object, int, int, tuple[object, ...]]:
+    _驗語法樹首(資料[:_語法樹首長])
+    try:
+        附, 始, 終, 句封列 = marshal.loads(zlib.decompress(資料[_語法樹首長:]))
+    except (zlib.error, EOFError, TypeError, ValueError) as 錯:
+        raise ValueError("Wenyan AST 序列已損") from 錯
+    return 附, 始, 終, 句封列
+
+
+class _惰句列(Sequence[句]):
+    """頂層句之惰性列：某句初被取時方復其節點。"""
+
+    __slots__ = ("_句列", "_封列")
+
+    def __init__(self, 封列: tuple[object, ...]) -> None:
+        self._封列 = 封列
+        self._句列: list[句 | None] = [None] * len(封列)
+
+    def __len__(self) -> int:
+        return len(self._封列)
+
+    def __getitem__(self, 索引):  # type: ignore[override]
+        if isinstance(索引, slice):
+            return [self[序] for 序 in range(*索引.indices(len(self)))]
+        節 = self._句列[索引]
+        if 節 is None:
+            節 = self._句列[索引] = cast(句, _復節(self._封列[索引]))
+        return 節
+
+
+def 序列化語法樹(程: 程式, 源碼: str | None = None) -> bytes:
+    """Wenyan AST → `.wyast` 位元組。
+
+    Args:
+        程: `解析` 所得之程式。
+        源碼: 若給，記其雜湊於檔首，供讀者驗其與源碼相符。
+    """
+
+    return _封語法樹(程, b"" if 源碼 is None else _源碼雜湊(源碼))
+
+
+def 反序列化語法樹(資料: bytes, 惰性: bool = False) -> 程式:
+    """`.wyast` 位元組 → Wenyan AST。
+
+    Args:
+        資料: `序列化語法樹` 或 `--wyast-bin` 所出者；亦可為 `__pycache__` 中之快取檔。
+        惰性: 為真則頂層句至被取時方復原，宜於僅觀數句之工具。
+
+    Raises:
+        ValueError: 非此格式、版本不符或已損。
+    """
+
+    _, 始, 終, 句封列 = _拆語法樹(資料)
+    if 惰性:
+        return 程式(始, 終, cast(list[句], _惰句列(句封列)))
+    return 程式(始, 終, [cast(句, _復節(封)) for 封 in 句封列])
+
+
+def _語法樹快取檔(文檔名: str) -> str | None:
+    """`文檔名` 為實檔者，返其 `__pycache__/<名>.wyast`（從 `sys.pycache_prefix`）。"""
+
+    if 文檔名.startswith("<") or not os.path.isfile(文檔名):
+        return None
+    路徑 = os.path.abspath(文檔名)
+    try:
+        快取目錄 = os.path.dirname(importlib.util.cache_from_source(路徑))
+    except NotImplementedError:
+        return None
+    葉 = os.path.splitext(os.path.basename(路徑))[0]
+    return os.path.join(快取目錄, f"{葉}.wyast")
+
+
+def _讀語法樹快取(
+    快取檔: str, 雜湊: bytes, 內容: str, 環境: 編譯環境
+) -> tuple[程式, str] | None:
+    """快取之源碼雜湊、剖析器戳與前處理所經之匯入皆符者，返 `(程, 處理後)`。"""
+
+    try:
+        with open(快取檔, "rb") as 檔案:
+            資料 = 檔案.read()
+        if _驗語法樹首(資料[:_語法樹首長]) != 雜湊:
+            return None
+        附, 始, 終, 句封列 = _拆語法樹(資料)
+        戳, 處理後, 依據 = cast(tuple, 附)
+        if tuple(戳) != _剖析器戳():
+            return None
+        for 模組, 目錄, 路徑, 依雜湊 in 依據:
+            if _解析文言模組(模組, 目錄, 環境.根目錄) != 路徑:
+                return None
+            if 路徑 is not None and _源碼雜湊(_讀取源碼(路徑, 環境)) != 依雜湊:
+                return None
+    except (OSError, ValueError, TypeError):
+        return None
+    程 = 程式(始, 終, [cast(句, _復節(封)) for 封 in 句封列])
+    return 程, 內容 if 處理後 is None else 處理後
+
+
+def _寫語法樹快取(快取檔: str, 資料: bytes) -> None:
+    """先寫暫檔再換名，他行程不見半檔；不可寫則略之。"""
+
+    暫檔 = f"{快取檔}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(快取檔), exist_ok=True)
+        with open(暫檔, "wb") as 檔案:
+            檔案.write(資料)
+        os.replace(暫檔, 快取檔)
+    except OSError:
+        try:
+            os.unlink(暫檔)
+        except OSError:
+            pass
+
+
 def _還原言值(文: str) -> str:
     """將 lexer 的最小轉義字串還原成真實字元。"""
 
@@ -4347,76 +4940,1250 @@ class _作用域節點:
     術節: 術定義句 | None
 
 
-def _分析作用域(句列: list[句]) -> dict[int, 作用域資訊]:
-    根 = _作用域節點(None, set(), set(), [], None)
+@dataclass
+class _語意表:
+    """一遍語意分析所得之側表；轉譯與型別推斷查其作用域、名、綁定處，不復各自建之。
 
-    def 收集(列: list[句], 節點: _作用域節點) -> None:
-        for 節 in 列:
-            if isinstance(節, 宣告句):
-                節點.本地.update(節.名列)
-            elif isinstance(節, 初始化句):
-                if 節.名 is not None:
-                    節點.本地.add(節.名)
-            elif isinstance(節, 命名句):
-                節點.本地.update(節.名列)
-            elif isinstance(節, 物定義句):
-                節點.本地.add(節.名)
-            elif isinstance(節, 凡句):
-                節點.本地.add(節.變數名)
-                收集(節.體, 節點)
-            elif isinstance(節, 試句):
-                收集(節.體, 節點)
+    唯作用域、名之合否、綁定處與迴圈層數併於此遍；型別推斷與轉譯本身仍遞迴遍句，
+    搖樹與字串累積之輔助（`_遍節`、`_術自由名`、`_域綁名`）亦各遍其所需之子樹。
+    範圍鍵為 `id(術定義句)`，模組層為 0。
+
+    Args:
+        範圍: 範圍鍵 → 作用域節點。
+        作用域: 術之範圍鍵 → 其體所需之 `global`/`nonlocal` 宣告。
+        劣名: 所綁、所改之名中不合 Python 識別字者。
+        定義: 名 → 綁定之句（術參數計於術定義句、捕捉變數計於試句，`昔今` 僅計整名賦值）。
+        迴圈深: `id(句)` → 句於所屬術內所在之迴圈層數。
+    """
+
+    範圍: dict[int, _作用域節點]
+    作用域: dict[int, 作用域資訊]
+    劣名: set[str]
+    定義: dict[str, list[句]]
+    迴圈深: dict[int, int]
+
+
+_語意句類 = (
+    宣告句,
+    命名句,
+    初始化句,
+    物定義句,
+    昔今句,
+    匯入句,
+    若句,
+    恆為是句,
+    為是遍句,
+    凡句,
+    試句,
+    術定義句,
+)
+
+
+def _語意分析(句列: list[句]) -> _語意表:
+    """以顯式棧一遍走全程式之句，建作用域樹，並收名之合否、綁定處與迴圈層數。"""
+
+    根 = _作用域節點(None, set(), set(), [], None)
+    表 = _語意表({0: 根}, {}, set(), {}, {})
+    已驗: set[str] = set()
+
+    def 驗(名: str) -> None:
+        if 名 not in 已驗:
+            已驗.add(名)
+            if not 名.isidentifier() or keyword.iskeyword(名):
+                表.劣名.add(名)
+
+    def 綁(名: str, 節: 句) -> None:
+        驗(名)
+        表.定義.setdefault(名, []).append(節)
+
+    待訪: list[tuple[list[句], _作用域節點, int]] = [(句列, 根, 0)]
+    while 待訪:
+        列, 域, 深 = 待訪.pop()
+        for 節 in 列:
+            表.迴圈深[id(節)] = 深
+            if not isinstance(節, _語意句類):
+                continue
+            if isinstance(節, (宣告句, 命名句)):
+                域.本地.update(節.名列)
+                for 名 in 節.名列:
+                    綁(名, 節)
+            elif isinstance(節, 初始化句):
+                if 節.名 is not None:
+                    域.本地.add(節.名)
+                    綁(節.名, 節)
+            elif isinstance(節, 物定義句):
+                域.本地.add(節.名)
+                綁(節.名, 節)
+            elif isinstance(節, 昔今句):
+                驗(節.左名)
+                if 節.左下標 is None:
+                    域.賦值.add(節.左名)
+                    綁(節.左名, 節)
+            elif isinstance(節, 匯入句):
+                for 名 in 節.名列:
+                    綁(名, 節)
+            elif isinstance(節, 若句):
+                待訪.append((節.然, 域, 深))
+                待訪.extend((或若.體, 域, 深) for 或若 in 節.另若列)
+                待訪.append((節.否則, 域, 深))
+            elif isinstance(節, (恆為是句, 為是遍句)):
+                待訪.append((節.體, 域, 深 + 1))
+            elif isinstance(節, 凡句):
+                域.本地.add(節.變數名)
+                綁(節.變數名, 節)
+                待訪.append((節.體, 域, 深 + 1))
+            elif isinstance(節, 試句):
+                待訪.append((節.體, 域, 深))
                 for 捕 in 節.捕捉列:
                     if 捕.變數名 is not None:
-                        節點.本地.add(捕.變數名)
-                    收集(捕.體, 節點)
-            elif isinstance(節, 若句):
-                收集(節.然, 節點)
-                收集(節.否則, 節點)
-                for 或若 in 節.另若列:
-                    收集(或若.體, 節點)
-            elif isinstance(節, 恆為是句):
-                收集(節.體, 節點)
-            elif isinstance(節, 為是遍句):
-                收集(節.體, 節點)
+                        域.本地.add(捕.變數名)
+                        綁(捕.變數名, 節)
+                    待訪.append((捕.體, 域, 深))
             elif isinstance(節, 術定義句):
-                節點.本地.add(節.名)
-                子節 = _作用域節點(節點, set(), set(), [], 節)
-                子節.本地.update([參.名 for 參 in 節.參數列])
-                節點.子.append(子節)
-                收集(節.體, 子節)
-            elif isinstance(節, 昔今句):
-                if 節.左下標 is None:
-                    節點.賦值.add(節.左名)
-
-    def 計算(節點: _作用域節點, 結果: dict[int, 作用域資訊]) -> None:
-        for 子 in 節點.子:
-            全域: set[str] = set()
-            非區: set[str] = set()
-            for 名 in 子.賦值:
-                if 名 in 子.本地:
-                    continue
-                父 = 子.父
-                while 父 is not None:
-                    if 名 in 父.本地:
-                        if 父.術節 is None:
-                            全域.add(名)
-                        else:
-                            非區.add(名)
-                        break
-                    父 = 父.父
+                域.本地.add(節.名)
+                綁(節.名, 節)
+                子域 = _作用域節點(域, set(), set(), [], 節)
+                for 參 in 節.參數列:
+                    子域.本地.add(參.名)
+                    綁(參.名, 節)
+                域.子.append(子域)
+                表.範圍[id(節)] = 子域
+                待訪.append((節.體, 子域, 0))
+
+    for 鍵, 域 in 表.範圍.items():
+        if 域.父 is None:
+            continue
+        全域: set[str] = set()
+        非區: set[str] = set()
+        for 名 in 域.賦值 - 域.本地:
+            父: _作用域節點 | None = 域.父
+            while 父 is not None:
+                if 名 in 父.本地:
+                    if 父.術節 is None:
+                        全域.add(名)
+                    else:
+                        非區.add(名)
+                    break
+                父 = 父.父
+            else:
+                全域.add(名)
+        表.作用域[鍵] = 作用域資訊(全域, 非區)
+    return 表
+
+
+# ---------------------------------------------------------------------------
+# 型別推斷（flow-insensitive）
+# ---------------------------------------------------------------------------
+
+# 型別以標記集合表示：「數」細分為「整」（int）與「浮」（float），空集為未定。
+任型 = frozenset({"整", "浮", "言", "爻", "列", "物", "術", "元"})
+數型 = frozenset({"整", "浮"})
+_宣告型別對照: dict[str, frozenset[str]] = {
+    "數": 數型,
+    "言": frozenset({"言"}),
+    "爻": frozenset({"爻"}),
+    "列": frozenset({"列"}),
+    "物": frozenset({"物"}),
+    "術": frozenset({"術"}),
+    "元": 任型,
+}
+_宣告預設型: dict[str, frozenset[str]] = {
+    "數": frozenset({"整"}),
+    "言": frozenset({"言"}),
+    "爻": frozenset({"爻"}),
+    "列": frozenset({"列"}),
+    "物": frozenset({"物"}),
+    "術": frozenset({"術"}),
+    "元": frozenset({"元"}),
+}
+_型標序 = ("整", "浮", "言", "爻", "列", "物", "術", "元")
+
+
+def _二元標型(算: str, 左: str, 右: str) -> str | None:
+    """單一型標之二元運算結果；None 表示該組合於 Python 會拋錯。"""
+
+    似整 = {"整", "爻"}
+    if 算 in {"||", "&&"}:
+        raise AssertionError("邏輯運算另行處理")
+    if 左 in 似整 | {"浮"} and 右 in 似整 | {"浮"}:
+        if 算 == "/":
+            return "浮"
+        return "整" if 左 in 似整 and 右 in 似整 else "浮"
+    if 算 == "+" and 左 == 右 and 左 in {"言", "列"}:
+        return 左
+    if 算 == "*" and {左, 右} <= {"言", "列", "整", "爻"}:
+        if 左 in {"言", "列"} and 右 in 似整:
+            return 左
+        if 右 in {"言", "列"} and 左 in 似整:
+            return 右
+    if 算 == "%" and 左 == "言":
+        return "言"
+    return None
+
+
+def 型別文(型: frozenset[str]) -> str:
+    """型別集合之可讀表示（`--explain-types` 用）。"""
+
+    if not 型 or 型 >= 任型:
+        return "任"
+    餘 = set(型)
+    片段: list[str] = []
+    if 數型 <= 餘:
+        片段.append("數")
+        餘 -= 數型
+    片段.extend(標 for 標 in _型標序 if 標 in 餘)
+    return "|".join(片段)
+
+
+@dataclass
+class 型別資訊:
+    """型別推斷結果。
+
+    名依 Python 作用域規則歸屬其綁定之範圍；範圍鍵為 `id(術定義句)`，
+    模組層為 0。
+
+    Args:
+        名型: (範圍鍵, 名) → 可能型別；未見綁定之名不列入。
+        術型: (範圍鍵, 術名) → (固定參數數, 接其餘, 回傳型別)；僅收錄唯一定義之術。
+        範圍: 範圍鍵 → 作用域節點。
+    """
+
+    名型: dict[tuple[int, str], frozenset[str]]
+    術型: dict[tuple[int, str], tuple[int, bool, frozenset[str]]]
+    範圍: dict[int, _作用域節點]
+
+    def 歸屬(self, 名: str, 範圍鍵: int = 0) -> int:
+        """名於 `範圍鍵` 處被引用時所屬之範圍。"""
+
+        節點 = self.範圍.get(範圍鍵)
+        while 節點 is not None:
+            if 名 in 節點.本地:
+                return id(節點.術節) if 節點.術節 is not None else 0
+            節點 = 節點.父
+        return 0
+
+    def 查(self, 名: str, 範圍鍵: int = 0) -> frozenset[str]:
+        型 = self.名型.get((self.歸屬(名, 範圍鍵), 名))
+        return 型 if 型 else 任型
+
+    def 解說(self) -> list[str]:
+        """逐名列出推斷結果；術附回傳型別。"""
+
+        術名 = {
+            鍵: 節點.術節.名 for 鍵, 節點 in self.範圍.items() if 節點.術節 is not None
+        }
+        行列: list[str] = []
+        for (鍵, 名), 型 in self.名型.items():
+            前綴 = f"「{術名[鍵]}」之" if 鍵 in 術名 else ""
+            行 = f"{前綴}「{名}」：{型別文(型 if 型 else 任型)}"
+            簽 = self.術型.get((鍵, 名))
+            if 簽 is not None:
+                行 += f" → {型別文(簽[2] if 簽[2] else 任型)}"
+            行列.append(行)
+        return 行列
+
+
+class _型別推斷器:
+    """以宣告、字面量與術回傳型別為種子，對名作 flow-insensitive 推斷。
+
+    執行期不驗術參數之型，故參數恆為任型（其餘參數為列），宣告之型不作種子；
+    暫存棧於句列中模擬，區塊入口之棧底與出口之棧皆視為未知。
+    程式內所綁之名自空集起反覆套用轉移至最小不動點，故 `甲 = 甲 + …` 之迴圈不致自生型別；
+    未綁之名（宿主）恆為任型。逾輪數上限未收斂者，諸名一律退為任型。
+    """
+
+    最大輪數 = 32
+
+    def __init__(self, 句列: list[句], 語意: _語意表 | None = None) -> None:
+        self._句列 = 句列
+        if 語意 is None:
+            語意 = _語意分析(句列)
+        self._範圍: dict[int, _作用域節點] = 語意.範圍
+        self._前: 型別資訊 = 型別資訊({}, {}, self._範圍)
+        self._名型: dict[tuple[int, str], frozenset[str]] = {}
+        self._術得: dict[int, frozenset[str]] = {}
+        self._術定義: dict[tuple[int, str], list[術定義句]] = {}
+        self._他綁名: set[tuple[int, str]] = set()
+        self._術棧: list[術定義句] = []
+
+    def 推斷(self) -> 型別資訊:
+        # 術之唯一與否與型別無關，先遍一次定之；其回傳型別亦自空集起。
+        self._遍全程()
+        self._前 = 型別資訊(
+            {},
+            {
+                鍵: (需, 接其餘, frozenset())
+                for 鍵, (需, 接其餘, _) in self._彙術型().items()
+            },
+            self._範圍,
+        )
+        for _ in range(self.最大輪數):
+            self._遍全程()
+            本輪 = 型別資訊(self._名型, self._彙術型(), self._範圍)
+            if 本輪.名型 == self._前.名型 and 本輪.術型 == self._前.術型:
+                return self._前
+            self._前 = 本輪
+        return 型別資訊(
+            {鍵: 任型 for 鍵 in self._前.名型},
+            {鍵: (需, 接其餘, 任型) for 鍵, (需, 接其餘, _) in self._前.術型.items()},
+            self._範圍,
+        )
+
+    def _遍全程(self) -> None:
+        self._名型 = {}
+        self._術得 = {}
+        self._術定義 = {}
+        self._他綁名 = set()
+        self._遍句列(self._句列, [])
+
+    def _彙術型(self) -> dict[tuple[int, str], tuple[int, bool, frozenset[str]]]:
+        結果: dict[tuple[int, str], tuple[int, bool, frozenset[str]]] = {}
+        for 鍵, 定義列 in self._術定義.items():
+            if len(定義列) != 1 or 鍵 in self._他綁名:
+                continue
+            節 = 定義列[0]
+            需 = sum(1 for 參 in 節.參數列 if not 參.其餘)
+            接其餘 = any(參.其餘 for 參 in 節.參數列)
+            結果[鍵] = (需, 接其餘, self._術得.get(id(節), frozenset()))
+        return 結果
+
+    def _範圍鍵(self) -> int:
+        return id(self._術棧[-1]) if self._術棧 else 0
+
+    def _綁(self, 名: str, 型: frozenset[str], 為術定義: bool = False) -> None:
+        鍵 = (self._前.歸屬(名, self._範圍鍵()), 名)
+        self._名型[鍵] = self._名型.get(鍵, frozenset()) | 型
+        if not 為術定義:
+            self._他綁名.add(鍵)
+
+    def _值型(self, 節: 值, 棧: list[frozenset[str]] | None) -> frozenset[str]:
+        if isinstance(節, 數值):
+            return frozenset({"浮"}) if "." in 節.文 else frozenset({"整"})
+        if isinstance(節, 言值):
+            return frozenset({"言"})
+        if isinstance(節, 爻值):
+            return frozenset({"爻"})
+        if isinstance(節, 名值):
+            範圍鍵 = self._前.歸屬(節.名, self._範圍鍵())
+            if 節.名 not in self._範圍[範圍鍵].本地:
+                return 任型
+            return self._前.名型.get((範圍鍵, 節.名), frozenset())
+        if isinstance(節, 其值):
+            if 棧 is None:
+                return 任型
+            型 = 棧[-1] if 棧 else frozenset({"元"})
+            棧.clear()
+            return 型
+        return 任型
+
+    def _算型(self, 算: str, 左: frozenset[str], 右: frozenset[str]) -> frozenset[str]:
+        if 算 in {"||", "&&"}:
+            return 左 | 右
+        結果: set[str] = set()
+        for 甲 in 左:
+            for 乙 in 右:
+                標 = _二元標型(算, 甲, 乙)
+                if 標 is not None:
+                    結果.add(標)
+        return frozenset(結果)
+
+    def _呼型(self, 術: 值, 參數數: int | None) -> frozenset[str]:
+        if not isinstance(術, 名值) or 參數數 is None:
+            return 任型
+        簽 = self._前.術型.get((self._前.歸屬(術.名, self._範圍鍵()), 術.名))
+        if 簽 is None:
+            return 任型
+        需, 接其餘, 得 = 簽
+        if 參數數 < 需:
+            return frozenset({"術"})
+        if 參數數 == 需 or 接其餘:
+            return 得
+        return 任型
+
+    def _出棧(self, 棧: list[frozenset[str]] | None) -> frozenset[str]:
+        if not 棧:
+            return 任型
+        return 棧.pop()
+
+    def _遍句列(
+        self, 句列: list[句], 棧: list[frozenset[str]] | None
+    ) -> list[frozenset[str]] | None:
+        待取: int | None = None
+        for 節 in 句列:
+            棧, 待取 = self._遍句(節, 棧, 待取)
+        return 棧
+
+    def _遍區塊(self, 句列: list[句]) -> None:
+        # 區塊出入時棧底未知，以一任型墊底；其後所推者仍可追蹤。
+        self._遍句列(句列, [任型])
+
+    def _遍句(
+        self, 節: 句, 棧: list[frozenset[str]] | None, 待取: int | None
+    ) -> tuple[list[frozenset[str]] | None, int | None]:
+        def 推(型: frozenset[str]) -> None:
+            if 棧 is not None:
+                棧.append(型)
+
+        if isinstance(節, 宣告句):
+            for i in range(節.數量):
+                值節 = 節.初值列[i] if i < len(節.初值列) else None
+                if 值節 is None:
+                    型 = _宣告預設型.get(節.類型, 任型)
+                else:
+                    型 = self._值型(值節, 棧)
+                if i < len(節.名列):
+                    self._綁(節.名列[i], 型)
+                else:
+                    推(型)
+        elif isinstance(節, 初始化句):
+            型 = self._值型(節.初值, 棧)
+            if 節.名 is not None:
+                self._綁(節.名, 型)
+            else:
+                推(型)
+        elif isinstance(節, 命名句):
+            for 名 in reversed(節.名列):
+                self._綁(名, self._出棧(棧))
+        elif isinstance(節, 施句):
+            for 參 in 節.參數列:
+                self._值型(參, 棧)
+            推(self._呼型(節.術, len(節.參數列)))
+        elif isinstance(節, 取句):
+            return 棧, (None if 節.其餘 else 節.數量)
+        elif isinstance(節, (註釋句, 宏句)):
+            return 棧, 待取
+        elif isinstance(節, 以施句):
+            if 待取 is None:
+                棧 = []
+                推(任型)
+            else:
+                for _ in range(待取):
+                    self._出棧(棧)
+                推(self._呼型(節.術, 待取))
+        elif isinstance(節, 算術句):
+            左 = self._值型(節.左, 棧)
+            右 = self._值型(節.右, 棧)
+            推(self._算型(節.算, 左, 右))
+        elif isinstance(節, 變句):
+            self._值型(節.值, 棧)
+            推(frozenset({"爻"}))
+        elif isinstance(節, 夫句):
+            推(self._值型(節.值, 棧))
+        elif isinstance(節, 之長句):
+            self._值型(節.容器, 棧)
+            推(frozenset({"整"}))
+        elif isinstance(節, 之句):
+            self._值型(節.容器, 棧)
+            self._值型(節.索引, 棧)
+            推(任型)
+        elif isinstance(節, 列銜句):
+            首 = self._值型(節.列, 棧)
+            for 列 in 節.列列:
+                self._值型(列, 棧)
+            推(首 if 首 <= {"列", "言"} else 任型)
+        elif isinstance(節, 列充句):
+            self._值型(節.列, 棧)
+            for 值節 in 節.值列:
+                self._值型(值節, 棧)
+        elif isinstance(節, (書之句, 噫句)):
+            return [], None
+        elif isinstance(節, 昔今句):
+            if 節.左下標 is None:
+                if 節.刪除:
+                    self._綁(節.左名, frozenset({"元"}))
+                elif 節.右值 is not None:
+                    型 = self._值型(節.右值, 棧)
+                    if 節.右下標 is not None:
+                        型 = 任型
+                    self._綁(節.左名, 型)
+            elif 節.右值 is not None:
+                self._值型(節.右值, 棧)
+        elif isinstance(節, 物定義句):
+            self._綁(節.名, frozenset({"物"}))
+        elif isinstance(節, 術定義句):
+            self._綁(節.名, frozenset({"術"}), 為術定義=True)
+            self._術定義.setdefault(
+                (self._前.歸屬(節.名, self._範圍鍵()), 節.名), []
+            ).append(節)
+            self._術棧.append(節)
+            # 執行期不驗參數之型，宣告之型不足為證；其餘參數則恆由 `文言術` 收為列。
+            for 術參 in 節.參數列:
+                self._綁(術參.名, frozenset({"列"}) if 術參.其餘 else 任型)
+            self._術得[id(節)] = frozenset()
+            self._遍句列(節.體, [])
+            if not 節.體 or not isinstance(節.體[-1], 返回句):
+                self._術得[id(節)] |= frozenset({"元"})
+            self._術棧.pop()
+        elif isinstance(節, 返回句):
+            if 節.空無 or (not 節.取棧 and 節.值 is None):
+                型 = frozenset({"元"})
+            elif 節.取棧:
+                型 = (棧[-1] if 棧 else frozenset({"元"})) if 棧 is not None else 任型
+            else:
+                型 = self._值型(cast(值, 節.值), 棧)
+            if self._術棧:
+                鍵 = id(self._術棧[-1])
+                self._術得[鍵] = self._術得.get(鍵, frozenset()) | 型
+        elif isinstance(節, 凡句):
+            self._綁(節.變數名, 任型)
+            self._遍區塊(節.體)
+            return [任型], None
+        elif isinstance(節, 若句):
+            self._遍區塊(節.然)
+            for 子 in 節.另若列:
+                self._遍區塊(子.體)
+            self._遍區塊(節.否則)
+            return [任型], None
+        elif isinstance(節, (恆為是句, 為是遍句)):
+            self._遍區塊(節.體)
+            return [任型], None
+        elif isinstance(節, 試句):
+            self._遍區塊(節.體)
+            for 捕 in 節.捕捉列:
+                if 捕.變數名 is not None:
+                    self._綁(捕.變數名, 任型)
+                self._遍區塊(捕.體)
+            return [任型], None
+        elif isinstance(節, 匯入句):
+            for 名 in 節.名列:
+                self._綁(名, 任型)
+        elif isinstance(節, 擲句):
+            self._值型(節.名, 棧)
+            if 節.訊 is not None:
+                self._值型(節.訊, 棧)
+        return 棧, None
+
+
+def _推斷型別(句列: list[句], 語意: _語意表 | None = None) -> 型別資訊:
+    return _型別推斷器(句列, 語意).推斷()
+
+
+_內聯節點上限 = 48
+_暫存函名 = frozenset({"__其", "__取", "__取其餘"})
+
+
+@dataclass
+class _內聯模板:
+    """可於 `施` 處展開之小術。
+
+    Args:
+        參名列: 固定參數名（依序）。
+        體: 已消去暫存棧之語句（不含末句 return）。
+        得: 回傳式；None 表示回傳空無。
+        區名: 體內綁定之名（含參數），展開時一律換為新名。
+        自由名: 體內引用而非區名者；展開處須與定義處同指模組層。
+    """
+
+    參名列: list[str]
+    體: list[ast.stmt]
+    得: ast.expr | None
+    區名: frozenset[str]
+    自由名: frozenset[str]
+
+
+def _呼暫存(節: ast.AST, 暫存名: str, 方法: str) -> bool:
+    return (
+        isinstance(節, ast.Call)
+        and isinstance(節.func, ast.Attribute)
+        and isinstance(節.func.value, ast.Name)
+        and 節.func.value.id == 暫存名
+        and 節.func.attr == 方法
+    )
+
+
+def _為其呼(節: ast.AST) -> bool:
+    return (
+        isinstance(節, ast.Call)
+        and isinstance(節.func, ast.Name)
+        and 節.func.id == "__其"
+    )
+
+
+class _其替換器(ast.NodeTransformer):
+    def __init__(self, 值: ast.expr) -> None:
+        self.值 = 值
+
+    def visit_Call(self, 節: ast.Call) -> ast.AST:
+        if _為其呼(節):
+            return copy.deepcopy(self.值)
+        return self.generic_visit(節)
+
+
+def _消暫存(
+    體: list[ast.stmt], 暫存名: str
+) -> tuple[list[ast.stmt], ast.expr | None] | None:
+    """以編譯期虛棧取代術體內之暫存棧操作。
+
+    術體之暫存棧本為私有（進出皆另存還原），故可改以臨時名模擬：推入即賦臨時名，
+    `pop` 取其名，`__其()` 取棧頂並清空。體須為直線語句且 return 僅居末；
+    餘下語句若仍觸及暫存棧（書之、取、以施等）即不可消，回傳 None。
+    """
+
+    棧: list[ast.expr] = []
+    結果: list[ast.stmt] = []
+    序 = 0
+    # 剛由上一句賦值、且僅被引用一次之臨時名，可併入下一句之賦值或 return。
+    前臨時: str | None = None
+
+    def 取頂() -> ast.expr:
+        return 棧[-1] if 棧 else ast.Constant(value=None)
+
+    def 併(值: ast.expr) -> tuple[ast.expr, bool]:
+        if (
+            isinstance(值, ast.Name)
+            and 值.id == 前臨時
+            and 結果
+            and isinstance(結果[-1], ast.Assign)
+        ):
+            return cast(ast.Assign, 結果.pop()).value, True
+        return 值, False
+
+    for 索, 句節 in enumerate(體):
+        其數 = sum(1 for 子 in ast.walk(句節) if _為其呼(子))
+        if 其數 > 1:
+            return None
+        if 其數 == 1:
+            句節 = _其替換器(取頂()).visit(copy.deepcopy(句節))
+            棧.clear()
+        if isinstance(句節, ast.Expr) and _呼暫存(句節.value, 暫存名, "append"):
+            值 = cast(ast.Call, 句節.value).args[0]
+            if isinstance(值, ast.Constant):
+                棧.append(值)
+                前臨時 = None
+                continue
+            序 += 1
+            臨時 = f"__棧{序}"
+            結果.append(
+                ast.Assign(targets=[ast.Name(id=臨時, ctx=ast.Store())], value=值)
+            )
+            棧.append(ast.Name(id=臨時, ctx=ast.Load()))
+            前臨時 = 臨時
+            continue
+        if isinstance(句節, ast.Expr) and _呼暫存(句節.value, 暫存名, "clear"):
+            棧.clear()
+            continue
+        if (
+            isinstance(句節, ast.Assign)
+            and len(句節.targets) == 1
+            and isinstance(句節.targets[0], ast.Name)
+            and _呼暫存(句節.value, 暫存名, "pop")
+        ):
+            if not 棧:
+                return None
+            值, _ = 併(棧.pop())
+            結果.append(ast.Assign(targets=句節.targets, value=值))
+            前臨時 = None
+            continue
+        if isinstance(句節, ast.Return):
+            if 索 != len(體) - 1:
+                return None
+            得 = 句節.value
+            if 得 is not None:
+                得, _ = 併(得)
+                if (
+                    isinstance(得, ast.Name)
+                    and 結果
+                    and isinstance(結果[-1], ast.Assign)
+                    and isinstance(結果[-1].targets[0], ast.Name)
+                    and 結果[-1].targets[0].id == 得.id
+                    and not any(
+                        isinstance(子, ast.Name) and 子.id == 得.id
+                        for 子 in ast.walk(結果[-1].value)
+                    )
+                ):
+                    得 = cast(ast.Assign, 結果.pop()).value
+            return 結果, 得
+        if not isinstance(句節, (ast.Assign, ast.AugAssign, ast.Expr)):
+            return None
+        結果.append(句節)
+        前臨時 = None
+    return 結果, None
+
+
+def _造內聯模板(
+    自名: str, 參名列: list[str], 體: list[ast.stmt], 暫存名: str
+) -> _內聯模板 | None:
+    """術體足小、直線、不自呼且不觸暫存棧者，造其內聯模板；否則 None。"""
+
+    消 = _消暫存(體, 暫存名)
+    if 消 is None:
+        return None
+    新體, 得 = 消
+    節點數 = sum(1 for 句節 in 新體 for _ in ast.walk(句節))
+    if 得 is not None:
+        節點數 += sum(1 for _ in ast.walk(得))
+    if 節點數 > _內聯節點上限:
+        return None
+    區名 = set(參名列)
+    引用名: set[str] = set()
+    內綁名: set[str] = set()
+    全部 = [*新體, *([ast.Expr(value=得)] if 得 is not None else [])]
+    for 句節 in 全部:
+        for 子 in ast.walk(句節):
+            if isinstance(子, ast.Name):
+                if isinstance(子.ctx, ast.Store):
+                    區名.add(子.id)
                 else:
-                    全域.add(名)
-            if 子.術節 is not None:
-                結果[id(子.術節)] = 作用域資訊(全域, 非區)
-            計算(子, 結果)
-
-    收集(句列, 根)
-    結果: dict[int, 作用域資訊] = {}
-    計算(根, 結果)
+                    引用名.add(子.id)
+            elif isinstance(子, ast.Lambda):
+                內綁名.update(
+                    參.arg for 參 in ast.walk(子.args) if isinstance(參, ast.arg)
+                )
+            elif isinstance(
+                子, (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+            ):
+                return None
+            elif isinstance(子, (ast.Yield, ast.YieldFrom, ast.Await)):
+                return None
+    if 自名 in 引用名 or 引用名 & _暫存函名 or 暫存名 in 引用名 or 內綁名 & 區名:
+        return None
+    return _內聯模板(list(參名列), 新體, 得, frozenset(區名), frozenset(引用名 - 區名))
+
+
+class _改名器(ast.NodeTransformer):
+    """依對照表換名，並去除位置，使展開之節點承呼叫處之位置。"""
+
+    def __init__(self, 對照: dict[str, ast.expr]) -> None:
+        self.對照 = 對照
+
+    def generic_visit(self, 節: ast.AST) -> ast.AST:
+        for 屬 in ("lineno", "col_offset", "end_lineno", "end_col_offset"):
+            vars(節).pop(屬, None)
+        return super().generic_visit(節)
+
+    def visit_Name(self, 節: ast.Name) -> ast.AST:
+        新 = self.對照.get(節.id)
+        if 新 is None:
+            return self.generic_visit(節)
+        if isinstance(節.ctx, ast.Load):
+            return copy.deepcopy(新)
+        return ast.Name(id=cast(ast.Name, 新).id, ctx=節.ctx)
+
+
+_匯入術名 = frozenset({"__import__", "載模組"})
+_純算節點 = (
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Compare,
+    ast.Name,
+    ast.Constant,
+    ast.operator,
+    ast.unaryop,
+    ast.cmpop,
+    ast.expr_context,
+)
+
+
+def _句綁名(節: 句) -> list[str]:
+    """句本身所綁之名（不含其體內者）；`昔今` 僅計整名賦值。"""
+
+    if isinstance(節, (宣告句, 命名句, 匯入句)):
+        return list(節.名列)
+    if isinstance(節, 初始化句):
+        return [節.名] if 節.名 is not None else []
+    if isinstance(節, (物定義句, 術定義句)):
+        return [節.名]
+    if isinstance(節, 昔今句):
+        return [節.左名] if 節.左下標 is None else []
+    if isinstance(節, 凡句):
+        return [節.變數名]
+    return []
+
+
+def _句之體(節: 句) -> list[list[句]]:
+    """複合句所含之句列（術定義句除外）；單句為空。"""
+
+    if isinstance(節, 若句):
+        return [節.然, *(或若.體 for 或若 in 節.另若列), 節.否則]
+    if isinstance(節, (恆為是句, 為是遍句, 凡句)):
+        return [節.體]
+    if isinstance(節, 試句):
+        return [節.體, *(捕.體 for 捕 in 節.捕捉列)]
+    return []
+
+
+def _句首(節: 句) -> list[object]:
+    """句於入體之前所讀之部分：複合句為其條件、次數或容器，綁名之句除去所綁之名。"""
+
+    if isinstance(節, 昔今句) and 節.左下標 is None:
+        return [節.右值, 節.右下標]
+    if isinstance(節, 命名句):
+        return []
+    if isinstance(節, 宣告句):
+        return [節.初值列]
+    if isinstance(節, 初始化句):
+        return [節.初值]
+    if isinstance(節, 若句):
+        return [節.條件, *(或若.條件 for 或若 in 節.另若列)]
+    if isinstance(節, 為是遍句):
+        return [節.次數]
+    if isinstance(節, 凡句):
+        return [節.容器, 節.變數名]
+    if isinstance(節, (恆為是句, 試句)):
+        return []
+    return [節]
+
+
+def _匯入模組名(句列: list[句], 語意: _語意表) -> set[str]:
+    """模組層 `施「__import__」於「「…」」。名之曰「名」。` 所綁、全程式僅綁一次之名。"""
+
+    結果: set[str] = set()
+    for 前, 後 in zip(句列, 句列[1:]):
+        if (
+            isinstance(前, 施句)
+            and isinstance(前.術, 名值)
+            and 前.術.名 in _匯入術名
+            and len(前.參數列) == 1
+            and isinstance(前.參數列[0], 言值)
+            and isinstance(後, 命名句)
+            and len(後.名列) == 1
+            and len(語意.定義.get(後.名列[0], ())) == 1
+        ):
+            結果.add(後.名列[0])
     return 結果
 
 
+@dataclass
+class _頂層段:
+    """模組頂層自棧空起、至棧復空止之連續句，取捨以段為單位。
+
+    Args:
+        句列: 段內諸句。
+        綁名: 段所綁、所改之名；段中有呼者，凡所提及之頂層名及所呼之術
+            於頂層所改之名皆計之。
+        詞: 段內諸字串欄位及其中之識別字，即段所可提及之名。
+        常存: 含匯入句之段，恆出之。
+    """
+
+    句列: list[句]
+    綁名: set[str]
+    詞: set[str]
+    常存: bool = False
+
+
+_入棧句 = (施句, 夫句, 算術句, 之句, 之長句, 變句, 列銜句, 宣告句, 初始化句)
+
+
+def _字串詞(根: object) -> set[str]:
+    """`根` 之字串欄位，及其中之識別字（宿主表式、言值所引之名）。"""
+
+    詞: set[str] = set()
+    for 子 in _遍節(根):
+        if isinstance(子, str):
+            詞.add(子)
+            詞.update(re.findall(r"\w+", 子))
+    return 詞
+
+
+def _域綁名(句列: list[句]) -> set[str]:
+    """句列於本層作用域所綁之名（入複合句之體，不入術體；`昔今` 不計）。"""
+
+    綁: set[str] = set()
+    for 節 in 句列:
+        if not isinstance(節, 昔今句):
+            綁.update(_句綁名(節))
+        if isinstance(節, 試句):
+            綁.update(捕.變數名 for 捕 in 節.捕捉列 if 捕.變數名 is not None)
+        for 體 in _句之體(節):
+            綁 |= _域綁名(體)
+    return 綁
+
+
+def _術自由名(
+    節: 術定義句, 外本地: frozenset[str] = frozenset()
+) -> tuple[set[str], set[str]]:
+    """術體所提及、所改之名，除去本術及外層術之區域名：(提及, 所改)。"""
+
+    本地 = 外本地 | {參.名 for 參 in 節.參數列} | _域綁名(節.體)
+    詞: set[str] = set()
+    寫: set[str] = set()
+    待訪: list[object] = [節.體]
+    while 待訪:
+        當 = 待訪.pop()
+        if isinstance(當, 術定義句):
+            子詞, 子寫 = _術自由名(當, 本地)
+            詞 |= 子詞
+            寫 |= 子寫
+        elif isinstance(當, str):
+            詞.add(當)
+            詞.update(re.findall(r"\w+", 當))
+        elif isinstance(當, (list, tuple)):
+            待訪.extend(當)
+        elif isinstance(當, 節點):
+            if isinstance(當, 昔今句):
+                寫.add(當.左名)
+            elif isinstance(當, 列充句) and isinstance(當.列, 名值):
+                寫.add(當.列.名)
+            待訪.extend(getattr(當, 欄.name) for 欄 in fields(當))
+    return 詞 - 本地, 寫 - 本地
+
+
+def _頂層分段(句列: list[句]) -> list[_頂層段] | None:
+    """分模組頂層為段；頂層有書之、流程、棄而不名之呼等副作用者，返 None。"""
+
+    原段: list[tuple[list[句], bool]] = []
+    當前: list[句] = []
+    深 = 0
+    有呼 = False
+    for 節 in 句列:
+        if not isinstance(節, 術定義句) and any(
+            isinstance(子, 其值) for 子 in _遍節(節)
+        ):
+            深 = 0
+        if isinstance(節, 命名句):
+            if 深 < len(節.名列):
+                return None
+            深 -= len(節.名列)
+        elif isinstance(節, _入棧句):
+            if isinstance(節, 宣告句):
+                深 += 節.數量 - len(節.名列)
+            elif isinstance(節, 初始化句):
+                深 += 0 if 節.名 else 1
+            else:
+                深 += 1
+            有呼 = 有呼 or isinstance(節, 施句)
+        elif isinstance(節, 列充句):
+            if not isinstance(節.列, 名值):
+                return None
+        elif isinstance(節, 噫句):
+            if 深:
+                return None
+        elif not isinstance(節, (術定義句, 物定義句, 昔今句, 匯入句, 註釋句, 宏句)):
+            return None
+        當前.append(節)
+        if 深 == 0:
+            原段.append((當前, 有呼))
+            當前 = []
+            有呼 = False
+    if 當前:
+        return None
+
+    段列: list[_頂層段] = []
+    # 術所提及、所改之頂層名；同名之術再定義者併之。
+    術詞: dict[str, set[str]] = {}
+    術寫: dict[str, set[str]] = {}
+    for 段句, _ in 原段:
+        綁名: set[str] = set()
+        詞: set[str] = set()
+        for 節 in 段句:
+            綁名.update(_句綁名(節))
+            if isinstance(節, 昔今句):
+                綁名.add(節.左名)
+            elif isinstance(節, 列充句):
+                綁名.add(cast(名值, 節.列).名)
+            if isinstance(節, 術定義句):
+                自由詞, 自由寫 = _術自由名(節)
+                術詞.setdefault(節.名, set()).update(自由詞)
+                術寫.setdefault(節.名, set()).update(自由寫)
+                詞 |= 自由詞
+                詞.add(節.名)
+            else:
+                詞 |= _字串詞(節)
+        段列.append(_頂層段(段句, 綁名, 詞, any(isinstance(節, 匯入句) for 節 in 段句)))
+
+    全名 = set().union(*(段.綁名 for 段 in 段列))
+    術提及 = {術名: 詞 & 術寫.keys() for 術名, 詞 in 術詞.items()}
+    變 = True
+    while 變:
+        變 = False
+        for 術名, 他列 in 術提及.items():
+            for 他 in 他列:
+                if not 術寫[他] <= 術寫[術名]:
+                    術寫[術名] |= 術寫[他]
+                    變 = True
+    for 段, (_, 有呼) in zip(段列, 原段):
+        if 有呼:
+            提及 = 段.詞 & 全名
+            段.綁名 |= 提及
+            for 術名 in 提及 & 術寫.keys():
+                段.綁名 |= 術寫[術名] & 全名
+    return 段列
+
+
+def _彙匯入求詞(
+    句列: list[句], 文檔名: str, 環境: 編譯環境
+) -> dict[str, set[str] | None]:
+    """遍全程式之匯入圖，彙各文言模組諸匯入者之詞；有不方悟而匯入者記 None。
+
+    模組頂層僅於首次匯入處依源碼序出一次，其後之匯入所需亦須於彼時出之，
+    故先彙諸匯入者之詞。所解析之模組存於 `環境.程快取`，匯入處取之免再解析。
+    """
+
+    求詞: dict[str, set[str] | None] = {}
+    待訪 = [(句列, 文檔名)]
+    已訪: set[str] = set()
+    while 待訪:
+        列, 名 = 待訪.pop()
+        詞: set[str] | None = None
+        for 節 in _遍節(列):
+            if not isinstance(節, 匯入句):
+                continue
+            路徑 = _嘗試解析文言模組路徑(節.模組, 名, 環境)
+            if 路徑 is None:
+                continue
+            已求 = 求詞.setdefault(路徑, set())
+            if not 節.名列:
+                求詞[路徑] = None
+            elif 已求 is not None:
+                if 詞 is None:
+                    詞 = _字串詞(列)
+                已求.update(詞)
+            if 路徑 not in 已訪:
+                已訪.add(路徑)
+                程 = 環境.程快取[路徑] = _解析前處理(_讀取源碼(路徑, 環境), 路徑, 環境)
+                待訪.append((程[0].句列, 路徑))
+    return 求詞
+
+
+def _搖樹(段列: list[_頂層段], 全名: frozenset[str], 求名: Iterable[str]) -> set[int]:
+    """`求名` 及常存之段所及之段，遞移閉包之序號。"""
+
+    名段: dict[str, list[int]] = {}
+    for 序, 段 in enumerate(段列):
+        for 名 in 段.綁名:
+            名段.setdefault(名, []).append(序)
+    需: set[int] = set()
+    已名: set[str] = set()
+    待名 = [名 for 名 in 求名 if 名 in 全名]
+    待段 = [序 for 序, 段 in enumerate(段列) if 段.常存]
+    while 待名 or 待段:
+        if 待段:
+            序 = 待段.pop()
+            if 序 in 需:
+                continue
+            需.add(序)
+            待名.extend((段列[序].詞 & 全名) - 已名)
+            continue
+        名 = 待名.pop()
+        if 名 not in 已名:
+            已名.add(名)
+            待段.extend(名段.get(名, []))
+    return 需
+
+
+class _序名收集器(ast.NodeVisitor):
+    """依求值先後收集名（僅適用於 `_純算節點` 所成之式）。"""
+
+    def __init__(self) -> None:
+        self.名列: list[str] = []
+
+    def visit_Name(self, 節: ast.Name) -> None:
+        self.名列.append(節.id)
+
+
+def _純算lambda(式: ast.expr, 參數數: int) -> tuple[list[str], ast.expr] | None:
+    """`lambda x, y: x OP y` 之屬，參數恰為參數數、體為純運算且各參恰用一次者，
+    回傳 (參名列, 體)。"""
+
+    if not isinstance(式, ast.Lambda):
+        return None
+    參 = 式.args
+    if 參.posonlyargs or 參.vararg or 參.kwonlyargs or 參.kwarg or 參.defaults:
+        return None
+    參名列 = [參數.arg for 參數 in 參.args]
+    式 = 式.body
+    if len(參名列) != 參數數 or len(set(參名列)) != 參數數:
+        return None
+    if not all(isinstance(子, _純算節點) for 子 in ast.walk(式)):
+        return None
+    收集 = _序名收集器()
+    收集.visit(式)
+    if sorted(收集.名列) != sorted(參名列):
+        return None
+    return 參名列, 式
+
+
+def _遍節(根: object) -> Iterator[object]:
+    """先序交出 `根`（節點、句列或字串）所含之節點與字串欄位。"""
+
+    待訪 = [根]
+    while 待訪:
+        當 = 待訪.pop()
+        if isinstance(當, str):
+            yield 當
+        elif isinstance(當, (list, tuple)):
+            待訪.extend(reversed(當))
+        elif isinstance(當, 節點):
+            yield 當
+            待訪.extend(getattr(當, 欄.name) for 欄 in reversed(fields(當)))
+
+
+def _提及(根: object, 名: str) -> bool:
+    """`根` 之任一字串欄位含 `名`；宿主表式、言值亦計，寧寬勿漏。"""
+
+    return any(isinstance(子, str) and 名 in 子 for 子 in _遍節(根))
+
+
+def _累積對(前: 句, 後: 句 | None) -> str | None:
+    """`加「甲」以…。昔之「甲」者。今其是矣。` 之 `甲`；加數不得提及 `甲`。"""
+
+    if (
+        isinstance(前, 算術句)
+        and 前.算 == "+"
+        and isinstance(前.左, 名值)
+        and isinstance(後, 昔今句)
+        and 後.左名 == 前.左.名
+        and 後.左下標 is None
+        and isinstance(後.右值, 其值)
+        and 後.右下標 is None
+        and not 後.刪除
+        and not _提及(前.右, 前.左.名)
+    ):
+        return 前.左.名
+    return None
+
+
+def _祖先鏈(句列: list[句], 目標: 句) -> list[句] | None:
+    """自 `句列` 首層至 `目標`（含）之複合句鏈；不入術定義句。"""
+
+    for 節 in 句列:
+        if 節 is 目標:
+            return [節]
+        for 體 in _句之體(節):
+            鏈 = _祖先鏈(體, 目標)
+            if 鏈 is not None:
+                return [節, *鏈]
+    return None
+
+
+def _字串累積名(術節: 術定義句, 迴圈: 句) -> list[str]:
+    """`迴圈` 內可改以串列累積之名（僅察語法形狀，型別與歸屬由轉譯器判定）。
+
+    其名於迴圈內除累加對外，只在單句或複合句首被讀、被綁；迴圈不在試句之中，
+    且迴圈之前已於術體首層綁定；術內無子術、宿主表式提及其名，亦非術參數。
+    """
+
+    鏈 = _祖先鏈(術節.體, 迴圈)
+    if 鏈 is None or any(isinstance(祖, 試句) for 祖 in 鏈):
+        return []
+    候選: list[str] = []
+    for 子 in _遍節(迴圈):
+        if isinstance(子, 術定義句):
+            continue
+        for 體 in _句之體(子) if isinstance(子, 句) else []:
+            for 前, 後 in zip(體, 體[1:]):
+                名 = _累積對(前, 後)
+                if 名 is not None and 名 not in 候選:
+                    候選.append(名)
+    if not 候選:
+        return []
+    參名 = {參.名 for 參 in 術節.參數列}
+    子術 = [子 for 子 in _遍節(術節.體) if isinstance(子, 術定義句)]
+    宿主式 = [
+        子.名
+        for 子 in _遍節(術節.體)
+        if isinstance(子, 名值)
+        and not (子.名.isidentifier() and not keyword.iskeyword(子.名))
+    ]
+
+    def 合式(列: list[句], 名: str) -> bool:
+        序 = 0
+        while 序 < len(列):
+            節 = 列[序]
+            if _累積對(節, 列[序 + 1] if 序 + 1 < len(列) else None) == 名:
+                序 += 2
+                continue
+            if isinstance(節, 凡句) and _提及(節.變數名, 名):
+                return False
+            if isinstance(節, 試句) and any(
+                _提及([捕.錯名, 捕.變數名], 名) for 捕 in 節.捕捉列
+            ):
+                return False
+            if not all(合式(體, 名) for 體 in _句之體(節)):
+                return False
+            序 += 1
+        return True
+
+    def 先綁(名: str) -> bool:
+        for 節 in 術節.體:
+            if 節 is 鏈[0]:
+                return False
+            if not _句之體(節) and 名 in _句綁名(節):
+                return True
+        return False
+
+    return [
+        名
+        for 名 in 候選
+        if 名 not in 參名
+        and not any(_提及(術, 名) for 術 in 子術)
+        and not any(名 in 式 for 式 in 宿主式)
+        and 合式(_句之體(迴圈)[0], 名)
+        and 先綁(名)
+    ]
+
+
+# 序言、輸出格式函等生成之碼標於第 0 行，回溯與剖析器一望即知其非出自源碼。
+_生成位 = (0, 0, 0, 0)
+
+
+class _行索引:
+    """源碼索引 → 行號與列之 UTF-8 位元組偏移；行首及每 64 字之位元組數預先累計。"""
+
+    __slots__ = ("_位元", "_內容", "_行首", "_行首位元")
+
+    def __init__(self, 內容: str) -> None:
+        self._內容 = 內容
+        self._行首 = [0, *(配.end() for 配 in re.finditer("\n", 內容))]
+        self._位元 = [0]
+        for 起 in range(0, len(內容), 64):
+            self._位元.append(self._位元[-1] + len(內容[起 : 起 + 64].encode()))
+        self._行首位元 = [self._位元數(首) for 首 in self._行首]
+
+    def _位元數(self, 索引: int) -> int:
+        段, 餘 = divmod(索引, 64)
+        return self._位元[段] + len(self._內容[索引 - 餘 : 索引].encode())
+
+    def 位(self, 始: int, 終: int) -> tuple[int, int, int, int]:
+        """`[始, 終)` 之 (lineno, col_offset, end_lineno, end_col_offset)。"""
+
+        行首, 內容, 位元 = self._行首, self._內容, self._位元
+        行 = bisect.bisect_right(行首, 始)
+        末行 = 行
+        if 行 < len(行首) and 終 >= 行首[行]:
+            末行 = bisect.bisect_right(行首, 終, 行)
+        始段, 始餘 = divmod(始, 64)
+        終段, 終餘 = divmod(終, 64)
+        return (
+            行,
+            位元[始段] + len(內容[始 - 始餘 : 始].encode()) - self._行首位元[行 - 1],
+            末行,
+            位元[終段] + len(內容[終 - 終餘 : 終].encode()) - self._行首位元[末行 - 1],
+        )
+
+
+# 其子孫皆不帶位置之節點，標位時不必深入。
+_無位子節點 = (ast.Name, ast.Constant)
+
+
+def _標位(
+    節列: Iterable[ast.AST], 位: tuple[int, int, int, int], 覆寫: bool = False
+) -> None:
+    """為節點及其子孫標上位置 `位`（lineno, col_offset, end_lineno, end_col_offset）。
+
+    預設只補未標者；已標之節點，其子孫必已先標，故不再深入。`覆寫` 則一律改標。
+    """
+
+    行, 列, 末行, 末列 = 位
+    待訪 = list(節列)
+    while 待訪:
+        節 = 待訪.pop()
+        if "lineno" in 節._attributes:
+            if not 覆寫 and hasattr(節, "lineno"):
+                continue
+            vars(節).update(
+                lineno=行, col_offset=列, end_lineno=末行, end_col_offset=末列
+            )
+        if isinstance(節, _無位子節點):
+            continue
+        for 欄 in 節._fields:
+            子 = getattr(節, 欄, None)
+            if isinstance(子, ast.AST):
+                待訪.append(子)
+            elif isinstance(子, list):
+                待訪.extend(孫 for 孫 in 子 if isinstance(孫, ast.AST))
+
+
 class PythonAST轉譯器:
     """將 Wenyan AST 轉譯為 Python `ast`。"""
 
@@ -4436,21 +6203,57 @@ class PythonAST轉譯器:
         self._其函名 = "__其"
         self._待取數: int | None = None
         self._待取其餘 = False
-        self._作用域資訊: dict[int, 作用域資訊] = {}
+        self._語意表 = _語意表({}, {}, set(), {}, {})
+        self._型別資訊 = 型別資訊({}, {}, {})
+        self._範圍鍵 = 0
         self._環境 = 環境 if 環境 is not None else _建立編譯環境()
         self._插入序言 = 插入序言
         self._輸出格式函名 = "__輸出格式值"
+        self._書者名 = "__文言書"
+        self._宿主名: set[str] = set()
+        self._內聯術: dict[str, _內聯模板] = {}
+        # 宿主表式之提升：式之 dump → 模組層名；模組名所綁之句，其後插入該模組屬性鏈之提升。
+        self._宿主常名: dict[str, str] = {}
+        self._提升句: list[ast.stmt] = []
+        self._模組名: set[str] = set()
+        self._模組綁定句: dict[str, ast.stmt] = {}
+        self._模組提升: dict[str, list[ast.stmt]] = {}
+        # 迴圈內串列累積之言：名 → 串列名。
+        self._累積名: dict[str, str] = {}
+        # 所生節點之位置：據源碼行索引；內聯匯入之模組則一律標為匯入句之位置。
+        self._行索引: _行索引 | None = None
+        self._固定位: tuple[int, int, int, int] | None = None
 
     def 轉譯(self, 程: 程式) -> ast.Module:
-        """轉譯整個程式。"""
+        """轉譯整個程式。
+
+        模組本體包於 `try/finally`，結束（含未捕之禍）時清出書之緩衝，
+        其後改為直寫，供外部於模組載入後呼叫之術即時輸出。
+        所轉之句與值皆標其源碼位置；序言等生成之碼標於第 0 行。
+        """
 
+        self._環境.根程 = (程.句列, self.文檔名)
+        self._環境.匯入求詞 = None
         主體: list[ast.stmt] = []
         if self._插入序言:
             主體.extend(self._序言())
-        主體.append(_造輸出格式函(self._輸出格式函名))
-        主體.extend(self._轉譯句列(程))
+        主體.extend(
+            _輸出助函句組(self._輸出格式函名, self._書者名 if self._插入序言 else None)
+        )
+        if self._插入序言:
+            主體.append(
+                ast.Try(
+                    body=self._填體(self._轉譯句列(程)),
+                    handlers=[],
+                    orelse=[],
+                    finalbody=[self._書者呼("閉")],
+                )
+            )
+        else:
+            主體.extend(self._轉譯句列(程))
         模組 = ast.Module(body=主體, type_ignores=[])
-        return ast.fix_missing_locations(模組)
+        _標位([模組], _生成位)
+        return 模組
 
     def _序言(self) -> list[ast.stmt]:
         return _內建序言AST()
@@ -4458,8 +6261,20 @@ class PythonAST轉譯器:
     def _轉譯句列(self, 程: 程式) -> list[ast.stmt]:
         self._待取數 = None
         self._待取其餘 = False
-        self._作用域資訊 = _分析作用域(程.句列)
-        return self._轉句列(程.句列)
+        self._語意表 = _語意分析(程.句列)
+        self._型別資訊 = _推斷型別(程.句列, self._語意表)
+        self._模組名 = _匯入模組名(程.句列, self._語意表)
+        主體 = self._轉句列(程.句列)
+        if self._模組提升:
+            綁定處 = {id(句節): 名 for 名, 句節 in self._模組綁定句.items()}
+            新主體: list[ast.stmt] = []
+            for 句節 in 主體:
+                新主體.append(句節)
+                名 = 綁定處.get(id(句節))
+                if 名 is not None:
+                    新主體.extend(self._模組提升.get(名, []))
+            主體 = 新主體
+        return self._提升句 + 主體
 
     def _新內部名(self, 前綴: str) -> str:
         self._內部序 += 1
@@ -4470,12 +6285,23 @@ class PythonAST轉譯器:
         行號, 列偏移, 行文字 = 計算行列(self.內容, 索引)
         raise 文法之禍(訊息, (self.文檔名, 行號, 列偏移, 行文字))
 
-    def _檢名(self, 名: str, 位置: slice) -> None:
-        if not 名.isidentifier() or keyword.iskeyword(名):
-            self._拋出文法錯誤("名不合 Python 識別字", 位置.start)
+    def _位(self, 節: 節點) -> tuple[int, int, int, int]:
+        if self._固定位 is not None:
+            return self._固定位
+        if self._行索引 is None:
+            self._行索引 = _行索引(self.內容)
+        return self._行索引.位(節.始, 節.終)
 
-    def _轉JS片段(self, 文: str) -> ast.expr | None:
-        簡 = "".join(文.split())
+    def _定位(self, 句列: list[ast.stmt], 節: 節點) -> list[ast.stmt]:
+        _標位(句列, self._位(節))
+        return 句列
+
+    def _檢名(self, 名: str, 索引: int) -> None:
+        if 名 in self._語意表.劣名:
+            self._拋出文法錯誤("名不合 Python 識別字", 索引)
+
+    def _轉JS片段(self, 文: str) -> ast.expr | None:
+        簡 = "".join(文.split())
         if 簡 == '(()=>document.getElementById("out").innerHTML="")':
             return ast.Lambda(
                 args=ast.arguments(
@@ -4514,9 +6340,12 @@ class PythonAST轉譯器:
             if JS代 is not None:
                 return JS代
             try:
-                return ast.parse(節.名, mode="eval").body
+                宿主式 = ast.parse(節.名, mode="eval").body
             except SyntaxError:
                 self._拋出文法錯誤("名不合 Python 表達式", 節.位置.start)
+            # 宿主表式自帶其字串內之位置，改標為此名所在。
+            _標位([宿主式], self._位(節), 覆寫=True)
+            return self._提升宿主式(宿主式)
         if isinstance(節, 言值):
             return ast.Constant(value=_還原言值(節.文))
         if isinstance(節, 數值):
@@ -4552,13 +6381,132 @@ class PythonAST轉譯器:
                 slice=ast.Slice(lower=ast.Constant(value=1), upper=None, step=None),
                 ctx=ast.Load(),
             )
-        索引 = self._轉下標索引(索)
-        return ast.Call(
-            func=ast.Name(id="取物", ctx=ast.Load()),
-            args=[基, 索引],
-            keywords=[],
+        if isinstance(索, 言值):
+            return ast.Call(
+                func=ast.Name(id="取物", ctx=ast.Load()),
+                args=[基, self._轉下標索引(索)],
+                keywords=[],
+            )
+        if isinstance(索, 數值):
+            return self._造列下標讀(
+                基, self._轉下標索引(索), self._型為(原子.值, "列"), True
+            )
+        return self._造列下標讀(
+            基, self._轉值(索), self._型為(原子.值, "列"), self._型為(索, "整")
+        )
+
+    def _造列下標讀(
+        self, 基: ast.expr, 索: ast.expr, 列已證: bool, 整已證: bool
+    ) -> ast.expr:
+        """數字下標之讀取：列之界內直取內聯，負索與越界等慢路徑交 `取物`。
+
+        `索` 為未經 `文言轉整` 之原式（常數下標則為 int 常數）；
+        容器與下標皆僅求值一次，必要時以 `:=` 暫存。
+        """
+
+        def 載(名: str) -> ast.Name:
+            return ast.Name(id=名, ctx=ast.Load())
+
+        def 型是(式: ast.expr, 型名: str) -> ast.expr:
+            return ast.Compare(
+                left=ast.Call(func=載("type"), args=[式], keywords=[]),
+                ops=[ast.Is()],
+                comparators=[載(型名)],
+            )
+
+        def 長(式: ast.expr) -> ast.expr:
+            return ast.Call(func=載("len"), args=[式], keywords=[])
+
+        常數 = isinstance(索, ast.Constant) and type(索.value) is int
+        列已證 = 列已證 and isinstance(基, ast.Name)
+        整已證 = 常數 or (整已證 and isinstance(索, ast.Name))
+        if 常數 and cast(int, cast(ast.Constant, 索).value) <= 0:
+            return ast.Call(func=載("取物"), args=[基, 索], keywords=[])
+
+        基可重讀 = isinstance(基, ast.Name)
+        索可重讀 = isinstance(索, (ast.Name, ast.Constant))
+        if not 基可重讀 and not 索可重讀:
+            return ast.Call(
+                func=載("取物"),
+                args=[
+                    基,
+                    ast.Call(
+                        func=載("文言轉整"),
+                        args=[索, ast.Constant(value=0)],
+                        keywords=[],
+                    ),
+                ],
+                keywords=[],
+            )
+        基首式 = 基
+        if not 基可重讀:
+            暫名 = self._新內部名("基")
+            基首式 = ast.NamedExpr(target=ast.Name(id=暫名, ctx=ast.Store()), value=基)
+            基 = 載(暫名)
+        索首式 = 索
+        if not 索可重讀:
+            暫名 = self._新內部名("索")
+            索首式 = ast.NamedExpr(target=ast.Name(id=暫名, ctx=ast.Store()), value=索)
+            索 = 載(暫名)
+
+        # 未可重讀者必居首測，確保先於其他子式求值。
+        測列: list[ast.expr] = []
+        if not 列已證:
+            測列.append(型是(基首式, "list"))
+        if not 整已證:
+            測列.insert(0 if not 索可重讀 else len(測列), 型是(索首式, "int"))
+        if 常數:
+            k = cast(int, cast(ast.Constant, 索).value)
+            界測: ast.expr = ast.Compare(
+                left=長(基), ops=[ast.GtE()], comparators=[ast.Constant(value=k)]
+            )
+            取式: ast.expr = ast.Constant(value=k - 1)
+        else:
+            界測 = ast.Compare(
+                left=ast.Constant(value=0),
+                ops=[ast.Lt(), ast.LtE()],
+                comparators=[索, 長(基)],
+            )
+            取式 = ast.BinOp(left=索, op=ast.Sub(), right=ast.Constant(value=1))
+        測列.append(界測)
+
+        if 列已證 and 常數:
+            慢式: ast.expr = ast.Constant(value=None)
+        else:
+            慢式 = ast.Call(
+                func=載("取物"),
+                args=[
+                    基,
+                    索
+                    if 整已證
+                    else ast.Call(
+                        func=載("文言轉整"),
+                        args=[索, ast.Constant(value=0)],
+                        keywords=[],
+                    ),
+                ],
+                keywords=[],
+            )
+        return ast.IfExp(
+            test=測列[0] if len(測列) == 1 else ast.BoolOp(op=ast.And(), values=測列),
+            body=ast.Subscript(value=基, slice=_造索引(取式), ctx=ast.Load()),
+            orelse=慢式,
         )
 
+    def _型(self, 節: 值) -> frozenset[str]:
+        if isinstance(節, 數值):
+            return frozenset({"浮"}) if "." in 節.文 else frozenset({"整"})
+        if isinstance(節, 言值):
+            return frozenset({"言"})
+        if isinstance(節, 爻值):
+            return frozenset({"爻"})
+        if isinstance(節, 名值):
+            return self._型別資訊.查(節.名, self._範圍鍵)
+        return 任型
+
+    def _型為(self, 節: 值, 標: str) -> bool:
+        return self._型(節) == frozenset({標})
+
     def _轉下標索引(self, 索: 值) -> ast.expr:
         if isinstance(索, 言值):
             return ast.Constant(value=_還原言值(索.文))
@@ -4568,6 +6516,8 @@ class PythonAST轉譯器:
             except ValueError:
                 self._拋出文法錯誤("非法下標", 索.位置.start)
         索式 = self._轉值(索)
+        if isinstance(索式, ast.Name) and self._型為(索, "整"):
+            return 索式
         return ast.Call(
             func=ast.Name(id="文言轉整", ctx=ast.Load()),
             args=[索式, ast.Constant(value=0)],
@@ -4685,846 +6635,986 @@ class PythonAST轉譯器:
     def _清暫存(self) -> ast.stmt:
         return ast.Expr(value=self._暫存術呼("clear", []))
 
-    def _轉句列(self, 句列: list[句]) -> list[ast.stmt]:
-        主體: list[ast.stmt] = []
-        for 句節 in 句列:
-            主體.extend(self._轉句(句節))
-        if self._待取數 is not None or self._待取其餘:
-            索引 = 句列[-1].位置.stop if 句列 else 0
-            self._拋出文法錯誤("取後未以施", 索引)
-        return 主體
+    def _書者呼(self, 方法: str, 參數: list[ast.expr] | None = None) -> ast.stmt:
+        return ast.Expr(
+            value=ast.Call(
+                func=ast.Attribute(
+                    value=ast.Name(id=self._書者名, ctx=ast.Load()),
+                    attr=方法,
+                    ctx=ast.Load(),
+                ),
+                args=參數 or [],
+                keywords=[],
+            )
+        )
 
-    def _轉句(self, 節: 句) -> list[ast.stmt]:
-        if (self._待取數 is not None or self._待取其餘) and not isinstance(
-            節, (以施句, 取句, 註釋句, 宏句)
+    def _或為宿主術(self, 術: 值) -> bool:
+        """呼叫對象未證為文言術者，呼前須先清出書之緩衝。
+
+        宿主表式、宿主匯入、未綁定之名、其，及元、`夫「宿主」` 所綁之名皆屬之；
+        唯推斷所證、僅由術定義句所綁之名，方為文言術。
+        """
+
+        if not isinstance(術, 名值):
+            return True
+        if not 術.名.isidentifier() or keyword.iskeyword(術.名):
+            return True
+        if 術.名 in self._宿主名:
+            return True
+        範圍 = self._型別資訊.歸屬(術.名, self._範圍鍵)
+        return (範圍, 術.名) not in self._型別資訊.術型
+
+    def _宿主界(self, 術: 值, 句列: list[ast.stmt]) -> list[ast.stmt]:
+        """進入宿主呼叫前先清出書之緩衝，保持與宿主輸出之先後。"""
+
+        if not self._或為宿主術(術):
+            return 句列
+        return [self._書者呼("清")] + 句列
+
+    def _登記內聯(
+        self, 節: 術定義句, 參名列: list[str], 接其餘: bool, 體: list[ast.stmt]
+    ) -> None:
+        """模組層、唯一定義且不另綁之小術，記其模板供 `施` 處展開。"""
+
+        self._內聯術.pop(節.名, None)
+        if not self._環境.內聯 or 接其餘 or self._範圍鍵 != 0:
+            return
+        if (0, 節.名) not in self._型別資訊.術型:
+            return
+        資訊 = self._語意表.作用域.get(id(節))
+        if 資訊 is not None and (資訊.全域 - {self._暫存名} or 資訊.非區):
+            return
+        模板 = _造內聯模板(節.名, 參名列, 體, self._暫存名)
+        if 模板 is not None:
+            self._內聯術[節.名] = 模板
+
+    def _展開內聯(self, 節: 施句) -> list[ast.stmt] | None:
+        """參數恰足之直接 `施`：先依序綁參，再展開術體，結果推入暫存。"""
+
+        if not isinstance(節.術, 名值):
+            return None
+        模板 = self._內聯術.get(節.術.名)
+        if 模板 is None or len(節.參數列) != len(模板.參名列):
+            return None
+        資訊 = self._型別資訊
+        if any(資訊.歸屬(名, self._範圍鍵) != 0 for 名 in (節.術.名, *模板.自由名)):
+            return None
+        結果: list[ast.stmt] = []
+        對照: dict[str, ast.expr] = {}
+        已存 = {
+            子.id
+            for 句節 in 模板.體
+            for 子 in ast.walk(句節)
+            if isinstance(子, ast.Name) and isinstance(子.ctx, ast.Store)
+        }
+        for 參名, 參 in zip(模板.參名列, 節.參數列):
+            參式 = self._轉值(參)
+            if isinstance(參式, ast.Constant) and 參名 not in 已存:
+                對照[參名] = 參式
+                continue
+            新名 = self._新內部名("聯")
+            結果.append(self._名指派(新名, 參式))
+            對照[參名] = ast.Name(id=新名, ctx=ast.Load())
+        for 名 in sorted(模板.區名 - set(對照)):
+            對照[名] = ast.Name(id=self._新內部名("聯"), ctx=ast.Load())
+        改名 = _改名器(對照)
+        for 句節 in 模板.體:
+            結果.append(cast(ast.stmt, 改名.visit(copy.deepcopy(句節))))
+        得: ast.expr = (
+            cast(ast.expr, 改名.visit(copy.deepcopy(模板.得)))
+            if 模板.得 is not None
+            else ast.Constant(value=None)
+        )
+        結果.extend(self._附暫存(得))
+        return 結果
+
+    def _提升宿主式(self, 式: ast.expr) -> ast.expr:
+        """無副作用之宿主表式提升為模組層名，僅求值一次；其餘原樣留於原處。
+
+        可提升者：不引用術內區名之 lambda（提升至程式之首），及已匯入之模組名之屬性鏈
+        （提升至綁定該模組名之句後）。
+        """
+
+        if isinstance(式, ast.Lambda):
+            if not self._可提升lambda(式):
+                return 式
+            return self._提升(式, self._提升句)
+        基 = 式
+        while isinstance(基, ast.Attribute):
+            基 = 基.value
+        if (
+            基 is not 式
+            and isinstance(基, ast.Name)
+            and 基.id in self._模組綁定句
+            and self._型別資訊.歸屬(基.id, self._範圍鍵) == 0
         ):
-            self._拋出文法錯誤("取後需以施", 節.位置.start)
-        if isinstance(節, 匯入句):
-            return self._轉匯入句(節)
+            return self._提升(式, self._模組提升.setdefault(基.id, []))
+        return 式
 
-        if isinstance(節, 術定義句):
-            self._檢名(節.名, 節.位置)
-            固定參列: list[術參數] = []
-            其餘參: 術參數 | None = None
-            for 參 in 節.參數列:
-                self._檢名(參.名, 節.位置)
-                if 參.其餘:
-                    if 其餘參 is None:
-                        其餘參 = 參
-                else:
-                    固定參列.append(參)
-            本參數列 = [ast.arg(arg=參.名, annotation=None) for 參 in 固定參列]
-            if 其餘參 is not None:
-                本參數列.append(ast.arg(arg=其餘參.名, annotation=None))
-            原待取 = self._待取數
-            原待取其餘 = self._待取其餘
-            self._待取數 = None
-            self._待取其餘 = False
-            原體 = self._轉句列(節.體)
-            self._待取數 = 原待取
-            self._待取其餘 = 原待取其餘
-            原體 = self._填體(原體)
-            宣告列: list[ast.stmt] = []
-            資訊 = self._作用域資訊.get(id(節))
-            全域名 = set(資訊.全域) if 資訊 is not None else set()
-            非區名 = set(資訊.非區) if 資訊 is not None else set()
-            全域名.add(self._暫存名)
-            if 全域名:
-                宣告列.append(ast.Global(names=sorted(全域名)))
-            if 非區名:
-                宣告列.append(ast.Nonlocal(names=sorted(非區名)))
-            暫名 = self._新內部名("暫存")
-            初始化 = [
-                self._名指派(暫名, ast.Name(id=self._暫存名, ctx=ast.Load())),
-                self._名指派(self._暫存名, ast.List(elts=[], ctx=ast.Load())),
-            ]
-            復原 = self._名指派(self._暫存名, ast.Name(id=暫名, ctx=ast.Load()))
-            體 = (
-                宣告列
-                + 初始化
-                + [ast.Try(body=原體, handlers=[], orelse=[], finalbody=[復原])]
-            )
-            本名 = self._新內部名("術本")
-            本函 = ast.FunctionDef(
-                name=本名,
-                args=ast.arguments(
-                    posonlyargs=[],
-                    args=本參數列,
-                    vararg=None,
-                    kwonlyargs=[],
-                    kw_defaults=[],
-                    kwarg=None,
-                    defaults=[],
-                ),
-                body=體,
-                decorator_list=[],
-                returns=None,
-                type_comment=None,
-            )
-            群名 = self._新內部名("參群")
-            已名 = self._新內部名("已")
-            結名 = self._新內部名("結")
-            後名 = self._新內部名("後群")
-            續名 = self._新內部名("續")
-            呼名 = self._新內部名("調用")
-            需數 = len(固定參列)
-            接其餘 = 其餘參 is not None
-
-            if 接其餘:
-                呼本參列: list[ast.expr] = []
-                if 需數 > 0:
-                    呼本參列.append(
-                        ast.Starred(
-                            value=ast.Subscript(
-                                value=ast.Name(id=群名, ctx=ast.Load()),
-                                slice=ast.Slice(
-                                    lower=None,
-                                    upper=ast.Constant(value=需數),
-                                    step=None,
-                                ),
-                                ctx=ast.Load(),
-                            ),
-                            ctx=ast.Load(),
-                        )
-                    )
-                呼本參列.append(
-                    ast.Call(
-                        func=ast.Name(id="list", ctx=ast.Load()),
-                        args=[
-                            ast.Subscript(
-                                value=ast.Name(id=群名, ctx=ast.Load()),
-                                slice=ast.Slice(
-                                    lower=ast.Constant(value=需數),
-                                    upper=None,
-                                    step=None,
-                                ),
-                                ctx=ast.Load(),
-                            )
-                        ],
+    def _可提升lambda(self, 式: ast.Lambda) -> bool:
+        if 式.args.defaults or any(預設 is not None for 預設 in 式.args.kw_defaults):
+            return False
+        綁名: set[str] = set()
+        for 子 in ast.walk(式):
+            if isinstance(子, ast.arg):
+                綁名.add(子.arg)
+            elif isinstance(子, (ast.NamedExpr, ast.Yield, ast.YieldFrom, ast.Await)):
+                return False
+        return all(
+            子.id in 綁名 or self._型別資訊.歸屬(子.id, self._範圍鍵) == 0
+            for 子 in ast.walk(式)
+            if isinstance(子, ast.Name)
+        )
+
+    def _提升(self, 式: ast.expr, 句列: list[ast.stmt]) -> ast.Name:
+        鍵 = ast.dump(式)
+        名 = self._宿主常名.get(鍵)
+        if 名 is None:
+            名 = self._新內部名("宿主常")
+            self._宿主常名[鍵] = 名
+            句列.append(self._名指派(名, 式))
+        return ast.Name(id=名, ctx=ast.Load())
+
+    def _宿主算式(self, 節: 施句) -> ast.expr | None:
+        """`施` 純運算之 lambda 且參數恰足者，直接代入為運算式。"""
+
+        if not isinstance(節.術, 名值) or 節.術.名.isidentifier():
+            return None
+        try:
+            式 = ast.parse(節.術.名, mode="eval").body
+        except SyntaxError:
+            return None
+        拆 = _純算lambda(式, len(節.參數列))
+        if 拆 is None:
+            return None
+        參名列, 體 = 拆
+        參式列 = [self._轉值(參) for 參 in 節.參數列]
+        收集 = _序名收集器()
+        收集.visit(體)
+        if 收集.名列 != 參名列 and not all(
+            isinstance(參式, (ast.Name, ast.Constant)) for 參式 in 參式列
+        ):
+            return None
+        return cast(
+            ast.expr, _改名器(dict(zip(參名列, 參式列))).visit(copy.deepcopy(體))
+        )
+
+    def _可累積名(self, 迴圈: 句) -> list[str]:
+        """術內迴圈中可改以串列累積之言（見 `_字串累積名`），且確為本術區域之言。"""
+
+        術節 = self._型別資訊.範圍.get(self._範圍鍵)
+        if self._範圍鍵 == 0 or 術節 is None or 術節.術節 is None:
+            return []
+        return [
+            名
+            for 名 in _字串累積名(術節.術節, 迴圈)
+            if 名 not in self._累積名
+            and self._型別資訊.歸屬(名, self._範圍鍵) == self._範圍鍵
+            and self._型別資訊.查(名, self._範圍鍵) == frozenset({"言"})
+        ]
+
+    def _轉累積迴圈(self, 迴圈: 句, 名列: list[str]) -> list[ast.stmt]:
+        """迴圈前以 `[名]` 起段、體內累加改為 `append`，迴圈後 `''.join` 一次還原。"""
+
+        段名表 = {名: self._新內部名("段") for 名 in 名列}
+        前 = [self._名指派(段名, self._段初(名)) for 名, 段名 in 段名表.items()]
+        self._累積名.update(段名表)
+        體 = self._轉句(迴圈)
+        for 名 in 名列:
+            del self._累積名[名]
+        後 = [self._名指派(名, self._合段(段名)) for 名, 段名 in 段名表.items()]
+        return 前 + 體 + 後
+
+    def _合所提段(self, 主體: list[ast.stmt], 根: object) -> None:
+        """`根` 提及累積中之言者，先合其段以得現值。"""
+
+        for 名, 段名 in self._累積名.items():
+            if _提及(根, 名):
+                # 合後以 `[名]` 重起，連讀時 `''.join` 單元素即回原串。
+                主體.append(self._名指派(名, self._合段(段名)))
+                主體.append(self._名指派(段名, self._段初(名)))
+
+    def _段初(self, 名: str) -> ast.expr:
+        return ast.List(elts=[ast.Name(id=名, ctx=ast.Load())], ctx=ast.Load())
+
+    def _合段(self, 段名: str) -> ast.expr:
+        return ast.Call(
+            func=ast.Attribute(
+                value=ast.Constant(value=""), attr="join", ctx=ast.Load()
+            ),
+            args=[ast.Name(id=段名, ctx=ast.Load())],
+            keywords=[],
+        )
+
+    def _累積附加(self, 名: str, 加數: 值) -> list[ast.stmt]:
+        """`加「名」以加數。昔之「名」者。今其是矣。` 之累積版。
+
+        原句以 `__其()` 取回，暫存棧因而清空；加數為其者已清，否則補清。
+        加數非確為言者，執行期非 `str` 即先合段再以 `+` 相加，錯誤與 `__radd__` 皆如原句。
+        """
+
+        段名 = self._累積名[名]
+        段 = ast.Name(id=段名, ctx=ast.Load())
+        句列: list[ast.stmt] = []
+        if self._型為(加數, "言"):
+            句列.append(
+                ast.Expr(
+                    value=ast.Call(
+                        func=ast.Attribute(value=段, attr="append", ctx=ast.Load()),
+                        args=[self._轉值(加數)],
                         keywords=[],
                     )
                 )
-                滿足體: list[ast.stmt] = [
-                    ast.Return(
-                        value=ast.Call(
-                            func=ast.Name(id=本名, ctx=ast.Load()),
-                            args=呼本參列,
-                            keywords=[],
-                        )
-                    )
-                ]
-            else:
-                滿足體 = [
-                    self._名指派(
-                        結名,
-                        ast.Call(
-                            func=ast.Name(id=本名, ctx=ast.Load()),
-                            args=[
-                                ast.Starred(
-                                    value=ast.Subscript(
-                                        value=ast.Name(id=群名, ctx=ast.Load()),
-                                        slice=ast.Slice(
-                                            lower=None,
-                                            upper=ast.Constant(value=需數),
-                                            step=None,
-                                        ),
-                                        ctx=ast.Load(),
-                                    ),
-                                    ctx=ast.Load(),
-                                )
-                            ],
-                            keywords=[],
-                        ),
-                    ),
-                    ast.If(
-                        test=ast.Compare(
-                            left=ast.Name(id=已名, ctx=ast.Load()),
-                            ops=[ast.Eq()],
-                            comparators=[ast.Constant(value=需數)],
-                        ),
-                        body=[ast.Return(value=ast.Name(id=結名, ctx=ast.Load()))],
-                        orelse=[
-                            ast.Return(
-                                value=ast.Call(
-                                    func=ast.Name(id=呼名, ctx=ast.Load()),
-                                    args=[
-                                        ast.Name(id=結名, ctx=ast.Load()),
-                                        ast.Starred(
-                                            value=ast.Subscript(
-                                                value=ast.Name(id=群名, ctx=ast.Load()),
-                                                slice=ast.Slice(
-                                                    lower=ast.Constant(value=需數),
-                                                    upper=None,
-                                                    step=None,
-                                                ),
-                                                ctx=ast.Load(),
-                                            ),
-                                            ctx=ast.Load(),
-                                        ),
-                                    ],
-                                    keywords=[],
-                                )
-                            )
-                        ],
-                    ),
-                ]
-
-            包函 = ast.FunctionDef(
-                name=節.名,
-                args=ast.arguments(
-                    posonlyargs=[],
-                    args=[],
-                    vararg=ast.arg(arg=群名, annotation=None),
-                    kwonlyargs=[],
-                    kw_defaults=[],
-                    kwarg=None,
-                    defaults=[],
-                ),
-                body=[
-                    self._名指派(
-                        已名,
-                        ast.Call(
-                            func=ast.Name(id="len", ctx=ast.Load()),
-                            args=[ast.Name(id=群名, ctx=ast.Load())],
+            )
+        else:
+            項 = self._轉值(加數)
+            if not isinstance(項, (ast.Name, ast.Constant)):
+                項名 = self._新內部名("項")
+                句列.append(self._名指派(項名, 項))
+                項 = ast.Name(id=項名, ctx=ast.Load())
+            句列.append(
+                ast.If(
+                    test=ast.Compare(
+                        left=ast.Call(
+                            func=ast.Name(id="type", ctx=ast.Load()),
+                            args=[項],
                             keywords=[],
                         ),
+                        ops=[ast.Is()],
+                        comparators=[ast.Name(id="str", ctx=ast.Load())],
                     ),
-                    ast.If(
-                        test=ast.Compare(
-                            left=ast.Name(id=已名, ctx=ast.Load()),
-                            ops=[ast.GtE()],
-                            comparators=[ast.Constant(value=需數)],
-                        ),
-                        body=滿足體,
-                        orelse=[
-                            ast.FunctionDef(
-                                name=續名,
-                                args=ast.arguments(
-                                    posonlyargs=[],
-                                    args=[],
-                                    vararg=ast.arg(arg=後名, annotation=None),
-                                    kwonlyargs=[],
-                                    kw_defaults=[],
-                                    kwarg=None,
-                                    defaults=[],
+                    body=[
+                        ast.Expr(
+                            value=ast.Call(
+                                func=ast.Attribute(
+                                    value=段, attr="append", ctx=ast.Load()
                                 ),
-                                body=[
-                                    ast.Return(
-                                        value=ast.Call(
-                                            func=ast.Name(id=呼名, ctx=ast.Load()),
-                                            args=[
-                                                ast.Name(id=節.名, ctx=ast.Load()),
-                                                ast.Starred(
-                                                    value=ast.BinOp(
-                                                        left=ast.Name(
-                                                            id=群名, ctx=ast.Load()
-                                                        ),
-                                                        op=ast.Add(),
-                                                        right=ast.Name(
-                                                            id=後名, ctx=ast.Load()
-                                                        ),
-                                                    ),
-                                                    ctx=ast.Load(),
-                                                ),
-                                            ],
-                                            keywords=[],
-                                        )
+                                args=[項],
+                                keywords=[],
+                            )
+                        )
+                    ],
+                    orelse=[
+                        self._名指派(
+                            段名,
+                            ast.List(
+                                elts=[
+                                    ast.BinOp(
+                                        left=self._合段(段名), op=ast.Add(), right=項
                                     )
                                 ],
-                                decorator_list=[],
-                                returns=None,
-                                type_comment=None,
-                            ),
-                            ast.Return(value=ast.Name(id=續名, ctx=ast.Load())),
-                        ],
-                    ),
-                ],
-                decorator_list=[],
-                returns=None,
-                type_comment=None,
-            )
-            呼函 = _造術呼叫函(呼名)
-            設本參 = _造屬性指派(本名, "__文言術參數數__", ast.Constant(value=需數))
-            設包參 = _造屬性指派(節.名, "__文言術參數數__", ast.Constant(value=需數))
-            設本餘 = _造屬性指派(本名, "__文言術接其餘__", ast.Constant(value=接其餘))
-            設包餘 = _造屬性指派(節.名, "__文言術接其餘__", ast.Constant(value=接其餘))
-            return [本函, 呼函, 包函, 設本參, 設包參, 設本餘, 設包餘]
-        if isinstance(節, 宣告句):
-            結果: list[ast.stmt] = []
-            預設值表: dict[str, int | str | bool | None] = {
-                "數": 0,
-                "言": "",
-                "爻": False,
-                "元": None,
-            }
-            for i in range(節.數量):
-                值節 = 節.初值列[i] if i < len(節.初值列) else None
-                值式: ast.expr
-                if 值節 is None:
-                    if 節.類型 == "列":
-                        值式 = ast.List(elts=[], ctx=ast.Load())
-                    elif 節.類型 == "物":
-                        值式 = ast.Dict(keys=[], values=[])
-                    elif 節.類型 == "術":
-                        值式 = ast.Lambda(
-                            args=ast.arguments(
-                                posonlyargs=[],
-                                args=[],
-                                vararg=None,
-                                kwonlyargs=[],
-                                kw_defaults=[],
-                                kwarg=None,
-                                defaults=[],
+                                ctx=ast.Load(),
                             ),
-                            body=ast.Constant(value=0),
                         )
-                    else:
-                        值式 = ast.Constant(value=預設值表.get(節.類型))
-                else:
-                    值式 = self._轉值(值節)
-                if i < len(節.名列):
-                    名 = 節.名列[i]
-                    self._檢名(名, 節.位置)
-                    結果.append(self._名指派(名, 值式))
-                else:
-                    結果.extend(self._附暫存(值式))
-            return 結果
+                    ],
+                )
+            )
+        if not isinstance(加數, 其值):
+            句列.append(self._清暫存())
+        return 句列
 
-        if isinstance(節, 初始化句):
-            值式 = self._轉值(節.初值)
-            if 節.名 is not None:
-                self._檢名(節.名, 節.位置)
-                return [self._名指派(節.名, 值式)]
-            return self._附暫存(值式)
+    def _以施呼(self, 節: 以施句, 參數: list[ast.expr]) -> list[ast.stmt]:
+        呼 = ast.Call(func=self._轉值(節.術), args=參數, keywords=[])
+        return self._宿主界(節.術, self._附暫存(呼))
 
-        if isinstance(節, 命名句):
-            命名結果: list[ast.stmt] = []
-            for 名 in reversed(節.名列):
-                self._檢名(名, 節.位置)
-                命名結果.append(self._名指派(名, self._暫存術呼("pop", [])))
-            return 命名結果
-
-        if isinstance(節, 施句):
-            呼 = ast.Call(
-                func=self._轉值(節.術),
-                args=[self._轉值(參) for 參 in 節.參數列],
-                keywords=[],
-            )
-            return self._附暫存(呼)
+    def _取前推(self, 主體: list[ast.stmt], 數量: int, 術: 值) -> list[ast.expr] | None:
+        """`取 n 以施` 前恰為 n 句 `__暫存.append(式)` 者，回傳諸式以直接為參。
 
-        if isinstance(節, 以施句):
-            if self._待取數 is None and not self._待取其餘:
-                self._拋出文法錯誤("以施需先取", 節.位置.start)
-            數量 = self._待取數
-            取其餘 = self._待取其餘
-            self._待取數 = None
-            self._待取其餘 = False
-            if 取其餘:
-                取值呼 = ast.Call(
-                    func=ast.Name(id="__取其餘", ctx=ast.Load()), args=[], keywords=[]
-                )
-            else:
-                if 數量 is None:
-                    self._拋出文法錯誤("以施需先取", 節.位置.start)
-                取值呼 = ast.Call(
-                    func=ast.Name(id="__取", ctx=ast.Load()),
-                    args=[ast.Constant(value=數量)],
-                    keywords=[],
-                )
-            呼 = ast.Call(
-                func=self._轉值(節.術),
-                args=[
-                    ast.Starred(
-                        value=取值呼,
-                        ctx=ast.Load(),
-                    ),
-                ],
-                keywords=[],
-            )
-            return self._附暫存(呼)
+        後式不得再觸暫存棧（如 `__其()`），否則原式先推之值已被清去；術須為單名，
+        使其求值先後不致因移至諸式之前而有別。
+        """
 
-        if isinstance(節, 取句):
-            self._待取其餘 = 節.其餘
-            self._待取數 = None if 節.其餘 else 節.數量
-            return []
+        if len(主體) < 數量 or not isinstance(self._轉值(術), ast.Name):
+            return None
+        參數: list[ast.expr] = []
+        for 序, 句節 in enumerate(主體[len(主體) - 數量 :]):
+            if not (
+                isinstance(句節, ast.Expr)
+                and _呼暫存(句節.value, self._暫存名, "append")
+            ):
+                return None
+            式 = cast(ast.Call, 句節.value).args[0]
+            if 序 and any(
+                isinstance(子, ast.Name)
+                and (子.id in _暫存函名 or 子.id == self._暫存名)
+                for 子 in ast.walk(式)
+            ):
+                return None
+            參數.append(式)
+        return 參數
 
-        if isinstance(節, 返回句):
-            if 節.空無:
-                return [ast.Return(value=ast.Constant(value=None))]
-            if 節.取棧:
-                return [
-                    ast.Return(
-                        value=ast.Call(
-                            func=ast.Name(id=self._其函名, ctx=ast.Load()),
-                            args=[],
-                            keywords=[],
-                        )
-                    )
-                ]
-            if 節.值 is None:
-                return [ast.Return(value=None)]
-            return [ast.Return(value=self._轉值(節.值))]
-
-        if isinstance(節, 列充句):
-            列式 = self._轉值(節.列)
-            列充結果: list[ast.stmt]
-            if not isinstance(列式, ast.Name):
-                暫名 = self._新內部名("列")
-                暫存指派 = self._名指派(暫名, 列式)
-                列式 = ast.Name(id=暫名, ctx=ast.Load())
-                列充結果 = [暫存指派]
-            else:
-                列充結果 = []
-            for 值節 in 節.值列:
-                列充結果.append(
-                    ast.Expr(
-                        value=ast.Call(
-                            func=ast.Attribute(
-                                value=列式, attr="append", ctx=ast.Load()
-                            ),
-                            args=[self._轉值(值節)],
-                            keywords=[],
-                        )
-                    )
-                )
-            return 列充結果
+    def _轉句列(self, 句列: list[句]) -> list[ast.stmt]:
+        主體: list[ast.stmt] = []
+        序 = 0
+        while 序 < len(句列):
+            句節 = 句列[序]
+            序 += 1
+            if isinstance(句節, 以施句) and self._待取數:
+                參數 = self._取前推(主體, self._待取數, 句節.術)
+                if 參數 is not None:
+                    del 主體[len(主體) - len(參數) :]
+                    self._待取數 = None
+                    主體.extend(self._定位(self._以施呼(句節, 參數), 句節))
+                    continue
+            if not self._累積名:
+                主體.extend(self._轉句(句節))
+                continue
+            後 = 句列[序] if 序 < len(句列) else None
+            名 = _累積對(句節, 後)
+            if 名 in self._累積名 and self._待取數 is None and not self._待取其餘:
+                加數 = cast(算術句, 句節).右
+                # 加數或讀他名之段（如內迴圈所累者），須先合之。
+                self._合所提段(主體, 加數)
+                主體.extend(self._定位(self._累積附加(cast(str, 名), 加數), 句節))
+                序 += 1
+                continue
+            self._合所提段(主體, _句首(句節))
+            主體.extend(self._轉句(句節))
+            if not _句之體(句節):
+                for 名 in _句綁名(句節):
+                    段名 = self._累積名.get(名)
+                    if 段名 is not None:
+                        主體.append(self._名指派(段名, self._段初(名)))
+        if self._待取數 is not None or self._待取其餘:
+            索引 = 句列[-1].位置.stop if 句列 else 0
+            self._拋出文法錯誤("取後未以施", 索引)
+        return 主體
 
-        if isinstance(節, 列銜句):
-            列列 = [self._轉值(節.列)] + [self._轉值(列) for 列 in 節.列列]
-            式 = 列列[0]
-            for 右 in 列列[1:]:
-                式 = ast.BinOp(left=式, op=ast.Add(), right=右)
-            return self._附暫存(式)
-
-        if isinstance(節, 物定義句):
-            self._檢名(節.名, 節.位置)
-            keys: list[ast.expr | None] = [self._轉值(屬.鍵) for 屬 in 節.屬性列]
-            values = [self._轉值(屬.值) for 屬 in 節.屬性列]
-            return [self._名指派(節.名, ast.Dict(keys=keys, values=values))]
-
-        if isinstance(節, 凡句):
-            self._檢名(節.變數名, 節.位置)
-            體 = self._填體(self._轉句列(節.體))
-            return [
-                ast.For(
-                    target=ast.Name(id=節.變數名, ctx=ast.Store()),
-                    iter=self._轉值(節.容器),
-                    body=體,
-                    orelse=[],
-                )
-            ]
+    def _轉句(self, 節: 句) -> list[ast.stmt]:
+        if (self._待取數 is not None or self._待取其餘) and not isinstance(
+            節, (以施句, 取句, 註釋句, 宏句)
+        ):
+            self._拋出文法錯誤("取後需以施", 節.位置.start)
+        if isinstance(節, (恆為是句, 為是遍句, 凡句)):
+            累積 = self._可累積名(節)
+            if 累積:
+                return self._定位(self._轉累積迴圈(節, 累積), 節)
+        轉 = self._句轉譯表.get(type(節))
+        if 轉 is not None:
+            return self._定位(轉(self, 節), 節)
+        self._拋出文法錯誤("此句未支援", 節.位置.start)
+        raise AssertionError("unreachable")
 
-        if isinstance(節, 試句):
-            體 = self._填體(self._轉句列(節.體))
-            if not 節.捕捉列:
-                handlers = [
-                    ast.ExceptHandler(
-                        type=ast.Name(id="文言之禍", ctx=ast.Load()),
-                        name=None,
-                        body=[ast.Pass()],
+    def _轉術定義句(self, 節: 術定義句) -> list[ast.stmt]:
+        self._檢名(節.名, 節.始)
+        固定參列: list[術參數] = []
+        其餘參: 術參數 | None = None
+        for 參 in 節.參數列:
+            self._檢名(參.名, 節.始)
+            if 參.其餘:
+                if 其餘參 is None:
+                    其餘參 = 參
+            else:
+                固定參列.append(參)
+        本參數列 = [ast.arg(arg=參.名, annotation=None) for 參 in 固定參列]
+        if 其餘參 is not None:
+            本參數列.append(ast.arg(arg=其餘參.名, annotation=None))
+        原待取 = self._待取數
+        原待取其餘 = self._待取其餘
+        原範圍鍵 = self._範圍鍵
+        self._待取數 = None
+        self._待取其餘 = False
+        self._範圍鍵 = id(節)
+        原體 = self._轉句列(節.體)
+        self._待取數 = 原待取
+        self._待取其餘 = 原待取其餘
+        self._範圍鍵 = 原範圍鍵
+        self._登記內聯(節, [參.名 for 參 in 固定參列], 其餘參 is not None, 原體)
+        原體 = self._填體(原體)
+        宣告列: list[ast.stmt] = []
+        資訊 = self._語意表.作用域.get(id(節))
+        全域名 = set(資訊.全域) if 資訊 is not None else set()
+        非區名 = set(資訊.非區) if 資訊 is not None else set()
+        全域名.add(self._暫存名)
+        if 全域名:
+            宣告列.append(ast.Global(names=sorted(全域名)))
+        if 非區名:
+            宣告列.append(ast.Nonlocal(names=sorted(非區名)))
+        暫名 = self._新內部名("暫存")
+        初始化 = [
+            self._名指派(暫名, ast.Name(id=self._暫存名, ctx=ast.Load())),
+            self._名指派(self._暫存名, ast.List(elts=[], ctx=ast.Load())),
+        ]
+        復原 = self._名指派(self._暫存名, ast.Name(id=暫名, ctx=ast.Load()))
+        體 = (
+            宣告列
+            + 初始化
+            + [ast.Try(body=原體, handlers=[], orelse=[], finalbody=[復原])]
+        )
+        本名 = self._新內部名("術本")
+        本函 = ast.FunctionDef(
+            name=本名,
+            args=ast.arguments(
+                posonlyargs=[],
+                args=本參數列,
+                vararg=None,
+                kwonlyargs=[],
+                kw_defaults=[],
+                kwarg=None,
+                defaults=[],
+            ),
+            body=體,
+            decorator_list=[],
+            returns=None,
+            type_comment=None,
+        )
+        包值 = ast.Call(
+            func=ast.Name(id="文言術", ctx=ast.Load()),
+            args=[
+                ast.Name(id=本名, ctx=ast.Load()),
+                ast.Constant(value=len(固定參列)),
+                ast.Constant(value=其餘參 is not None),
+                ast.Constant(value=節.名),
+            ],
+            keywords=[],
+        )
+        return [本函, self._名指派(節.名, 包值)]
+
+    def _轉宣告句(self, 節: 宣告句) -> list[ast.stmt]:
+        結果: list[ast.stmt] = []
+        預設值表: dict[str, int | str | bool | None] = {
+            "數": 0,
+            "言": "",
+            "爻": False,
+            "元": None,
+        }
+        for i in range(節.數量):
+            值節 = 節.初值列[i] if i < len(節.初值列) else None
+            值式: ast.expr
+            if 值節 is None:
+                if 節.類型 == "列":
+                    值式 = ast.List(elts=[], ctx=ast.Load())
+                elif 節.類型 == "物":
+                    值式 = ast.Dict(keys=[], values=[])
+                elif 節.類型 == "術":
+                    值式 = ast.Lambda(
+                        args=ast.arguments(
+                            posonlyargs=[],
+                            args=[],
+                            vararg=None,
+                            kwonlyargs=[],
+                            kw_defaults=[],
+                            kwarg=None,
+                            defaults=[],
+                        ),
+                        body=ast.Constant(value=0),
                     )
-                ]
-                return [ast.Try(body=體, handlers=handlers, orelse=[], finalbody=[])]
-            禍名 = self._新內部名("禍")
-            鏈: ast.stmt | None = None
-            尾: ast.If | None = None
-            捕尾體: list[ast.stmt] | None = None
-            for 捕 in 節.捕捉列:
-                子體 = self._填體(self._轉句列(捕.體))
-                if 捕.變數名 is not None:
-                    self._檢名(捕.變數名, 節.位置)
-                    子體 = [
-                        self._名指派(捕.變數名, ast.Name(id=禍名, ctx=ast.Load()))
-                    ] + 子體
-                if 捕.亦可:
-                    捕尾體 = 子體
-                    break
-                錯名 = 捕.錯名
-                if 錯名 is None:
-                    self._拋出文法錯誤("捕捉需錯名", 節.位置.start)
-                錯名值 = cast(值, 錯名)
-                測 = ast.Compare(
-                    left=ast.Attribute(
-                        value=ast.Name(id=禍名, ctx=ast.Load()),
-                        attr="名",
-                        ctx=ast.Load(),
-                    ),
-                    ops=[ast.Eq()],
-                    comparators=[self._轉值(錯名值)],
-                )
-                節點 = ast.If(test=測, body=子體, orelse=[])
-                if 鏈 is None:
-                    鏈 = 節點
                 else:
-                    if 尾 is None:
-                        self._拋出文法錯誤("捕捉鏈不連續", 節.位置.start)
-                    尾節 = cast(ast.If, 尾)
-                    尾節.orelse = [節點]
-                尾 = 節點
-            if 捕尾體 is None:
-                捕尾體 = [ast.Pass()]
-            if 鏈 is None:
-                處理體 = 捕尾體
+                    值式 = ast.Constant(value=預設值表.get(節.類型))
             else:
-                if 尾 is None:
-                    self._拋出文法錯誤("捕捉鏈不連續", 節.位置.start)
-                尾節 = cast(ast.If, 尾)
-                尾節.orelse = 捕尾體
-                處理體 = [鏈]
-            handlers = [
-                ast.ExceptHandler(
-                    type=ast.Name(id="文言之禍", ctx=ast.Load()), name=禍名, body=處理體
-                )
-            ]
-            return [ast.Try(body=體, handlers=handlers, orelse=[], finalbody=[])]
+                值式 = self._轉值(值節)
+            if i < len(節.名列):
+                名 = 節.名列[i]
+                self._檢名(名, 節.始)
+                結果.append(self._名指派(名, 值式))
+            else:
+                結果.extend(self._附暫存(值式))
+        return 結果
+
+    def _轉初始化句(self, 節: 初始化句) -> list[ast.stmt]:
+        值式 = self._轉值(節.初值)
+        if 節.名 is not None:
+            self._檢名(節.名, 節.始)
+            return [self._名指派(節.名, 值式)]
+        return self._附暫存(值式)
+
+    def _轉命名句(self, 節: 命名句) -> list[ast.stmt]:
+        命名結果: list[ast.stmt] = []
+        for 名 in reversed(節.名列):
+            self._檢名(名, 節.始)
+            命名結果.append(self._名指派(名, self._暫存術呼("pop", [])))
+        if self._範圍鍵 == 0 and len(節.名列) == 1 and 節.名列[0] in self._模組名:
+            self._模組綁定句[節.名列[0]] = 命名結果[0]
+        return 命名結果
+
+    def _轉施句(self, 節: 施句) -> list[ast.stmt]:
+        展開 = self._展開內聯(節)
+        if 展開 is not None:
+            return 展開
+        算式 = self._宿主算式(節)
+        if 算式 is not None:
+            return self._附暫存(算式)
+        呼 = ast.Call(
+            func=self._轉值(節.術),
+            args=[self._轉值(參) for 參 in 節.參數列],
+            keywords=[],
+        )
+        return self._宿主界(節.術, self._附暫存(呼))
 
-        if isinstance(節, 擲句):
-            args = [self._轉值(節.名)]
-            if 節.訊 is not None:
-                args.append(self._轉值(節.訊))
+    def _轉以施句(self, 節: 以施句) -> list[ast.stmt]:
+        if self._待取數 is None and not self._待取其餘:
+            self._拋出文法錯誤("以施需先取", 節.位置.start)
+        數量 = self._待取數
+        取其餘 = self._待取其餘
+        self._待取數 = None
+        self._待取其餘 = False
+        if 取其餘:
+            取值呼 = ast.Call(
+                func=ast.Name(id="__取其餘", ctx=ast.Load()), args=[], keywords=[]
+            )
+        else:
+            if 數量 is None:
+                self._拋出文法錯誤("以施需先取", 節.位置.start)
+            取值呼 = ast.Call(
+                func=ast.Name(id="__取", ctx=ast.Load()),
+                args=[ast.Constant(value=數量)],
+                keywords=[],
+            )
+        return self._以施呼(節, [ast.Starred(value=取值呼, ctx=ast.Load())])
+
+    def _轉取句(self, 節: 取句) -> list[ast.stmt]:
+        self._待取其餘 = 節.其餘
+        self._待取數 = None if 節.其餘 else 節.數量
+        return []
+
+    def _轉返回句(self, 節: 返回句) -> list[ast.stmt]:
+        if 節.空無:
+            return [ast.Return(value=ast.Constant(value=None))]
+        if 節.取棧:
             return [
-                ast.Raise(
-                    exc=ast.Call(
-                        func=ast.Name(id="文言之禍", ctx=ast.Load()),
-                        args=args,
+                ast.Return(
+                    value=ast.Call(
+                        func=ast.Name(id=self._其函名, ctx=ast.Load()),
+                        args=[],
                         keywords=[],
-                    ),
-                    cause=None,
+                    )
                 )
             ]
-
-        if isinstance(節, (註釋句, 宏句)):
-            return []
-
-        if isinstance(節, 書之句):
-            輸出列式: ast.expr = ast.IfExp(
-                test=ast.UnaryOp(
-                    op=ast.Not(),
-                    operand=ast.Call(
-                        func=ast.Attribute(
-                            value=ast.Call(
-                                func=ast.Name(id="globals", ctx=ast.Load()),
-                                args=[],
-                                keywords=[],
-                            ),
-                            attr="get",
-                            ctx=ast.Load(),
-                        ),
+        if 節.值 is None:
+            return [ast.Return(value=None)]
+        return [ast.Return(value=self._轉值(節.值))]
+
+    def _轉列充句(self, 節: 列充句) -> list[ast.stmt]:
+        列式 = self._轉值(節.列)
+        列充結果: list[ast.stmt]
+        if not isinstance(列式, ast.Name):
+            暫名 = self._新內部名("列")
+            暫存指派 = self._名指派(暫名, 列式)
+            列式 = ast.Name(id=暫名, ctx=ast.Load())
+            列充結果 = [暫存指派]
+        else:
+            列充結果 = []
+        if len(節.值列) > 1 and self._型為(節.列, "列"):
+            列充結果.append(
+                ast.Expr(
+                    value=ast.Call(
+                        func=ast.Attribute(value=列式, attr="extend", ctx=ast.Load()),
                         args=[
-                            ast.Constant(value="__wenyan_no_output_hanzi__"),
-                            ast.Constant(value=False),
+                            ast.Tuple(
+                                elts=[self._轉值(值節) for 值節 in 節.值列],
+                                ctx=ast.Load(),
+                            )
                         ],
                         keywords=[],
-                    ),
-                ),
-                body=ast.Name(id=self._暫存名, ctx=ast.Load()),
-                orelse=ast.ListComp(
-                    elt=ast.Call(
-                        func=ast.Name(id=self._輸出格式函名, ctx=ast.Load()),
-                        args=[ast.Name(id="值", ctx=ast.Load()), ast.Constant(value=0)],
-                        keywords=[],
-                    ),
-                    generators=[
-                        ast.comprehension(
-                            target=ast.Name(id="值", ctx=ast.Store()),
-                            iter=ast.Name(id=self._暫存名, ctx=ast.Load()),
-                            ifs=[],
-                            is_async=0,
-                        )
-                    ],
-                ),
-            )
-            呼句 = ast.Expr(
-                value=ast.Call(
-                    func=ast.Name(id="print", ctx=ast.Load()),
-                    args=[
-                        ast.Starred(
-                            value=輸出列式,
-                            ctx=ast.Load(),
-                        )
-                    ],
-                    keywords=[],
+                    )
+                )
+            )
+            return 列充結果
+        for 值節 in 節.值列:
+            列充結果.append(
+                ast.Expr(
+                    value=ast.Call(
+                        func=ast.Attribute(value=列式, attr="append", ctx=ast.Load()),
+                        args=[self._轉值(值節)],
+                        keywords=[],
+                    )
                 )
             )
-            return [呼句, self._清暫存()]
-
-        if isinstance(節, 噫句):
-            return [self._清暫存()]
-
-        if isinstance(節, 算術句):
-            左 = self._轉值(節.左)
-            右 = self._轉值(節.右)
-            if 節.算 in {"+", "-", "*", "/", "%"}:
-                運算對照 = {
-                    "+": ast.Add(),
-                    "-": ast.Sub(),
-                    "*": ast.Mult(),
-                    "/": ast.Div(),
-                    "%": ast.Mod(),
-                }
-                式 = ast.BinOp(left=左, op=運算對照[節.算], right=右)
-            elif 節.算 in {"||", "&&"}:
-                式 = ast.BoolOp(
-                    op=ast.Or() if 節.算 == "||" else ast.And(), values=[左, 右]
+        return 列充結果
+
+    def _轉列銜句(self, 節: 列銜句) -> list[ast.stmt]:
+        列列 = [self._轉值(節.列)] + [self._轉值(列) for 列 in 節.列列]
+        if len(列列) > 2 and all(self._型為(列, "列") for 列 in [節.列, *節.列列]):
+            # 首二列相加得恰足之新列，餘列就地 `+=`，不另生中間列。
+            銜名 = self._新內部名("銜")
+            銜 = ast.Name(id=銜名, ctx=ast.Load())
+            return (
+                [
+                    self._名指派(
+                        銜名, ast.BinOp(left=列列[0], op=ast.Add(), right=列列[1])
+                    )
+                ]
+                + [
+                    ast.AugAssign(
+                        target=ast.Name(id=銜名, ctx=ast.Store()),
+                        op=ast.Add(),
+                        value=右,
+                    )
+                    for 右 in 列列[2:]
+                ]
+                + self._附暫存(銜)
+            )
+        式 = 列列[0]
+        for 右 in 列列[1:]:
+            式 = ast.BinOp(left=式, op=ast.Add(), right=右)
+        return self._附暫存(式)
+
+    def _轉物定義句(self, 節: 物定義句) -> list[ast.stmt]:
+        self._檢名(節.名, 節.始)
+        keys: list[ast.expr | None] = [self._轉值(屬.鍵) for 屬 in 節.屬性列]
+        values = [self._轉值(屬.值) for 屬 in 節.屬性列]
+        return [self._名指派(節.名, ast.Dict(keys=keys, values=values))]
+
+    def _轉凡句(self, 節: 凡句) -> list[ast.stmt]:
+        self._檢名(節.變數名, 節.始)
+        體 = self._填體(self._轉句列(節.體))
+        return [
+            ast.For(
+                target=ast.Name(id=節.變數名, ctx=ast.Store()),
+                iter=self._轉值(節.容器),
+                body=體,
+                orelse=[],
+            )
+        ]
+
+    def _轉試句(self, 節: 試句) -> list[ast.stmt]:
+        體 = self._填體(self._轉句列(節.體))
+        if not 節.捕捉列:
+            handlers = [
+                ast.ExceptHandler(
+                    type=ast.Name(id="文言之禍", ctx=ast.Load()),
+                    name=None,
+                    body=[ast.Pass()],
                 )
+            ]
+            return [ast.Try(body=體, handlers=handlers, orelse=[], finalbody=[])]
+        禍名 = self._新內部名("禍")
+        鏈: ast.stmt | None = None
+        尾: ast.If | None = None
+        捕尾體: list[ast.stmt] | None = None
+        for 捕 in 節.捕捉列:
+            子體 = self._填體(self._轉句列(捕.體))
+            if 捕.變數名 is not None:
+                self._檢名(捕.變數名, 節.始)
+                子體 = [
+                    self._名指派(捕.變數名, ast.Name(id=禍名, ctx=ast.Load()))
+                ] + 子體
+            if 捕.亦可:
+                捕尾體 = 子體
+                break
+            錯名 = 捕.錯名
+            if 錯名 is None:
+                self._拋出文法錯誤("捕捉需錯名", 節.位置.start)
+            錯名值 = cast(值, 錯名)
+            測 = ast.Compare(
+                left=ast.Attribute(
+                    value=ast.Name(id=禍名, ctx=ast.Load()),
+                    attr="名",
+                    ctx=ast.Load(),
+                ),
+                ops=[ast.Eq()],
+                comparators=[self._轉值(錯名值)],
+            )
+            節點 = ast.If(test=測, body=子體, orelse=[])
+            if 鏈 is None:
+                鏈 = 節點
             else:
-                self._拋出文法錯誤("未知運算", 節.位置.start)
-                raise AssertionError("unreachable")
-            return self._附暫存(式)
+                if 尾 is None:
+                    self._拋出文法錯誤("捕捉鏈不連續", 節.位置.start)
+                尾節 = cast(ast.If, 尾)
+                尾節.orelse = [節點]
+            尾 = 節點
+        if 捕尾體 is None:
+            捕尾體 = [ast.Pass()]
+        if 鏈 is None:
+            處理體 = 捕尾體
+        else:
+            if 尾 is None:
+                self._拋出文法錯誤("捕捉鏈不連續", 節.位置.start)
+            尾節 = cast(ast.If, 尾)
+            尾節.orelse = 捕尾體
+            處理體 = [鏈]
+        handlers = [
+            ast.ExceptHandler(
+                type=ast.Name(id="文言之禍", ctx=ast.Load()), name=禍名, body=處理體
+            )
+        ]
+        return [ast.Try(body=體, handlers=handlers, orelse=[], finalbody=[])]
+
+    def _轉擲句(self, 節: 擲句) -> list[ast.stmt]:
+        args = [self._轉值(節.名)]
+        if 節.訊 is not None:
+            args.append(self._轉值(節.訊))
+        return [
+            ast.Raise(
+                exc=ast.Call(
+                    func=ast.Name(id="文言之禍", ctx=ast.Load()),
+                    args=args,
+                    keywords=[],
+                ),
+                cause=None,
+            )
+        ]
+
+    def _轉註釋句(self, 節: 註釋句 | 宏句) -> list[ast.stmt]:
+        return []
+
+    def _轉書之句(self, 節: 書之句) -> list[ast.stmt]:
+        return [
+            self._書者呼("書", [ast.Name(id=self._暫存名, ctx=ast.Load())]),
+            self._清暫存(),
+        ]
 
-        if isinstance(節, 變句):
-            return self._附暫存(ast.UnaryOp(op=ast.Not(), operand=self._轉值(節.值)))
+    def _轉噫句(self, 節: 噫句) -> list[ast.stmt]:
+        return [self._清暫存()]
+
+    def _轉算術句(self, 節: 算術句) -> list[ast.stmt]:
+        左 = self._轉值(節.左)
+        右 = self._轉值(節.右)
+        if 節.算 in {"+", "-", "*", "/", "%"}:
+            運算對照 = {
+                "+": ast.Add(),
+                "-": ast.Sub(),
+                "*": ast.Mult(),
+                "/": ast.Div(),
+                "%": ast.Mod(),
+            }
+            式: ast.expr = ast.BinOp(left=左, op=運算對照[節.算], right=右)
+        elif 節.算 in {"||", "&&"}:
+            式 = ast.BoolOp(
+                op=ast.Or() if 節.算 == "||" else ast.And(), values=[左, 右]
+            )
+        else:
+            self._拋出文法錯誤("未知運算", 節.位置.start)
+            raise AssertionError("unreachable")
+        return self._附暫存(式)
 
-        if isinstance(節, 夫句):
-            return self._附暫存(self._轉值(節.值))
+    def _轉變句(self, 節: 變句) -> list[ast.stmt]:
+        return self._附暫存(ast.UnaryOp(op=ast.Not(), operand=self._轉值(節.值)))
 
-        if isinstance(節, 之長句):
-            return self._附暫存(
-                ast.Call(
-                    func=ast.Name(id="len", ctx=ast.Load()),
-                    args=[self._轉值(節.容器)],
-                    keywords=[],
-                )
+    def _轉夫句(self, 節: 夫句) -> list[ast.stmt]:
+        return self._附暫存(self._轉值(節.值))
+
+    def _轉之長句(self, 節: 之長句) -> list[ast.stmt]:
+        return self._附暫存(
+            ast.Call(
+                func=ast.Name(id="len", ctx=ast.Load()),
+                args=[self._轉值(節.容器)],
+                keywords=[],
             )
+        )
+
+    def _轉之句(self, 節: 之句) -> list[ast.stmt]:
+        return self._附暫存(
+            self._轉條件原子(條件原子(節.始, 節.終, 節.容器, 節.索引, False))
+        )
 
-        if isinstance(節, 之句):
-            return self._附暫存(
-                self._轉條件原子(條件原子(節.位置, 節.容器, 節.索引, False))
+    def _轉昔今句(self, 節: 昔今句) -> list[ast.stmt]:
+        self._檢名(節.左名, 節.始)
+        前置: list[ast.stmt] = []
+        左索為言 = False
+        if 節.左下標 is None:
+            目標: ast.expr = ast.Name(id=節.左名, ctx=ast.Store())
+            索 = None
+        else:
+            if isinstance(節.左下標, 其餘值):
+                self._拋出文法錯誤("不可對其餘賦值", 節.位置.start)
+            左索為言 = isinstance(節.左下標, 言值)
+            索名 = self._新內部名("索")
+            前置.append(self._名指派(索名, self._轉下標索引(節.左下標)))
+            索 = ast.Name(id=索名, ctx=ast.Load())
+            索式 = (
+                索
+                if 左索為言
+                else ast.BinOp(left=索, op=ast.Sub(), right=ast.Constant(value=1))
+            )
+            目標 = ast.Subscript(
+                value=ast.Name(id=節.左名, ctx=ast.Load()),
+                slice=_造索引(索式),
+                ctx=ast.Store(),
             )
 
-        if isinstance(節, 昔今句):
-            self._檢名(節.左名, 節.位置)
-            前置: list[ast.stmt] = []
-            左索為言 = False
+        if 節.刪除:
             if 節.左下標 is None:
-                目標: ast.expr = ast.Name(id=節.左名, ctx=ast.Store())
-                索 = None
-            else:
-                if isinstance(節.左下標, 其餘值):
-                    self._拋出文法錯誤("不可對其餘賦值", 節.位置.start)
-                左索為言 = isinstance(節.左下標, 言值)
-                索名 = self._新內部名("索")
-                前置.append(self._名指派(索名, self._轉下標索引(節.左下標)))
-                索 = ast.Name(id=索名, ctx=ast.Load())
-                索式 = (
-                    索
-                    if 左索為言
-                    else ast.BinOp(left=索, op=ast.Sub(), right=ast.Constant(value=1))
+                return [self._名指派(節.左名, ast.Constant(value=None))]
+            if 索 is None:
+                self._拋出文法錯誤("缺左下標", 節.位置.start)
+            索式值 = cast(ast.expr, 索)
+            return 前置 + [
+                ast.Expr(
+                    value=ast.Call(
+                        func=ast.Name(id="刪物", ctx=ast.Load()),
+                        args=[ast.Name(id=節.左名, ctx=ast.Load()), 索式值],
+                        keywords=[],
+                    )
                 )
-                目標 = ast.Subscript(
-                    value=ast.Name(id=節.左名, ctx=ast.Load()),
-                    slice=_造索引(索式),
-                    ctx=ast.Store(),
+            ]
+
+        if 節.右值 is None:
+            self._拋出文法錯誤("缺右值", 節.位置.start)
+        右值 = cast(值, 節.右值)
+        右式: ast.expr = self._轉值(右值)
+        if 節.右下標 is not None:
+            原右 = 條件原子(節.始, 節.終, 右值, 節.右下標, False)
+            右式 = self._轉條件原子(原右)
+        if 節.左下標 is None:
+            return 前置 + [ast.Assign(targets=[目標], value=右式)]
+        if 左索為言:
+            return 前置 + [
+                ast.Try(
+                    body=[ast.Assign(targets=[目標], value=右式)],
+                    handlers=[
+                        ast.ExceptHandler(
+                            type=ast.Name(id="Exception", ctx=ast.Load()),
+                            name=None,
+                            body=[ast.Pass()],
+                        )
+                    ],
+                    orelse=[],
+                    finalbody=[],
                 )
+            ]
+        if 索 is None:
+            self._拋出文法錯誤("缺左下標", 節.位置.start)
+        索式值 = cast(ast.expr, 索)
+        左型 = self._型別資訊.查(節.左名, self._範圍鍵)
+        if "列" not in 左型:
+            return 前置 + [ast.Assign(targets=[目標], value=右式)]
+
+        def 列測(比較: ast.expr) -> ast.expr:
+            # 已證為列者免 isinstance 檢查。
+            if 左型 == frozenset({"列"}):
+                return 比較
+            return ast.BoolOp(
+                op=ast.And(),
+                values=[
+                    ast.Call(
+                        func=ast.Name(id="isinstance", ctx=ast.Load()),
+                        args=[
+                            ast.Name(id=節.左名, ctx=ast.Load()),
+                            ast.Name(id="list", ctx=ast.Load()),
+                        ],
+                        keywords=[],
+                    ),
+                    比較,
+                ],
+            )
 
-            if 節.刪除:
-                if 節.左下標 is None:
-                    return [self._名指派(節.左名, ast.Constant(value=None))]
-                if 索 is None:
-                    self._拋出文法錯誤("缺左下標", 節.位置.start)
-                索式值 = cast(ast.expr, 索)
-                return 前置 + [
+        return 前置 + [
+            ast.If(
+                test=列測(
+                    ast.Compare(
+                        left=索式值,
+                        ops=[ast.LtE()],
+                        comparators=[ast.Constant(value=0)],
+                    )
+                ),
+                body=[
                     ast.Expr(
                         value=ast.Call(
-                            func=ast.Name(id="刪物", ctx=ast.Load()),
-                            args=[ast.Name(id=節.左名, ctx=ast.Load()), 索式值],
+                            func=ast.Name(id="__負索置", ctx=ast.Load()),
+                            args=[
+                                ast.Name(id=節.左名, ctx=ast.Load()),
+                                索式值,
+                                右式,
+                            ],
                             keywords=[],
                         )
                     )
-                ]
-
-            if 節.右值 is None:
-                self._拋出文法錯誤("缺右值", 節.位置.start)
-            右值 = cast(值, 節.右值)
-            右式: ast.expr = self._轉值(右值)
-            if 節.右下標 is not None:
-                原右 = 條件原子(節.位置, 右值, 節.右下標, False)
-                右式 = self._轉條件原子(原右)
-            if 節.左下標 is None:
-                return 前置 + [ast.Assign(targets=[目標], value=右式)]
-            if 左索為言:
-                return 前置 + [
-                    ast.Try(
-                        body=[ast.Assign(targets=[目標], value=右式)],
-                        handlers=[
-                            ast.ExceptHandler(
-                                type=ast.Name(id="Exception", ctx=ast.Load()),
-                                name=None,
-                                body=[ast.Pass()],
-                            )
-                        ],
-                        orelse=[],
-                        finalbody=[],
-                    )
-                ]
-            if 索 is None:
-                self._拋出文法錯誤("缺左下標", 節.位置.start)
-            索式值 = cast(ast.expr, 索)
-
-            return 前置 + [
-                ast.If(
-                    test=ast.BoolOp(
-                        op=ast.And(),
-                        values=[
-                            ast.Call(
-                                func=ast.Name(id="isinstance", ctx=ast.Load()),
-                                args=[
-                                    ast.Name(id=節.左名, ctx=ast.Load()),
-                                    ast.Name(id="list", ctx=ast.Load()),
-                                ],
-                                keywords=[],
-                            ),
+                ],
+                orelse=[
+                    ast.If(
+                        test=列測(
                             ast.Compare(
                                 left=索式值,
-                                ops=[ast.LtE()],
-                                comparators=[ast.Constant(value=0)],
-                            ),
-                        ],
-                    ),
-                    body=[
-                        ast.Assign(
-                            targets=[
-                                ast.Subscript(
-                                    value=ast.Name(id="__文言負索", ctx=ast.Load()),
-                                    slice=_造索引(
-                                        ast.Tuple(
-                                            elts=[
-                                                ast.Call(
+                                ops=[ast.Gt()],
+                                comparators=[
+                                    ast.Call(
+                                        func=ast.Name(id="len", ctx=ast.Load()),
+                                        args=[ast.Name(id=節.左名, ctx=ast.Load())],
+                                        keywords=[],
+                                    )
+                                ],
+                            )
+                        ),
+                        body=[
+                            ast.Expr(
+                                value=ast.Call(
+                                    func=ast.Attribute(
+                                        value=ast.Name(id=節.左名, ctx=ast.Load()),
+                                        attr="extend",
+                                        ctx=ast.Load(),
+                                    ),
+                                    args=[
+                                        ast.BinOp(
+                                            left=ast.List(
+                                                elts=[ast.Constant(value=None)],
+                                                ctx=ast.Load(),
+                                            ),
+                                            op=ast.Mult(),
+                                            right=ast.BinOp(
+                                                left=索式值,
+                                                op=ast.Sub(),
+                                                right=ast.Call(
                                                     func=ast.Name(
-                                                        id="id", ctx=ast.Load()
+                                                        id="len", ctx=ast.Load()
                                                     ),
                                                     args=[
                                                         ast.Name(
-                                                            id=節.左名, ctx=ast.Load()
+                                                            id=節.左名,
+                                                            ctx=ast.Load(),
                                                         )
                                                     ],
                                                     keywords=[],
                                                 ),
-                                                索式值,
-                                            ],
-                                            ctx=ast.Load(),
+                                            ),
                                         )
-                                    ),
-                                    ctx=ast.Store(),
-                                )
-                            ],
-                            value=右式,
-                        )
-                    ],
-                    orelse=[
-                        ast.If(
-                            test=ast.BoolOp(
-                                op=ast.And(),
-                                values=[
-                                    ast.Call(
-                                        func=ast.Name(id="isinstance", ctx=ast.Load()),
-                                        args=[
-                                            ast.Name(id=節.左名, ctx=ast.Load()),
-                                            ast.Name(id="list", ctx=ast.Load()),
-                                        ],
-                                        keywords=[],
-                                    ),
-                                    ast.Compare(
-                                        left=索式值,
-                                        ops=[ast.Gt()],
-                                        comparators=[
-                                            ast.Call(
-                                                func=ast.Name(id="len", ctx=ast.Load()),
-                                                args=[
-                                                    ast.Name(id=節.左名, ctx=ast.Load())
-                                                ],
-                                                keywords=[],
-                                            )
-                                        ],
-                                    ),
-                                ],
-                            ),
-                            body=[
-                                ast.Expr(
-                                    value=ast.Call(
-                                        func=ast.Attribute(
-                                            value=ast.Name(id=節.左名, ctx=ast.Load()),
-                                            attr="extend",
-                                            ctx=ast.Load(),
-                                        ),
-                                        args=[
-                                            ast.BinOp(
-                                                left=ast.List(
-                                                    elts=[ast.Constant(value=None)],
-                                                    ctx=ast.Load(),
-                                                ),
-                                                op=ast.Mult(),
-                                                right=ast.BinOp(
-                                                    left=索式值,
-                                                    op=ast.Sub(),
-                                                    right=ast.Call(
-                                                        func=ast.Name(
-                                                            id="len", ctx=ast.Load()
-                                                        ),
-                                                        args=[
-                                                            ast.Name(
-                                                                id=節.左名,
-                                                                ctx=ast.Load(),
-                                                            )
-                                                        ],
-                                                        keywords=[],
-                                                    ),
-                                                ),
-                                            )
-                                        ],
-                                        keywords=[],
-                                    )
+                                    ],
+                                    keywords=[],
                                 )
-                            ],
-                            orelse=[],
-                        ),
-                        ast.Assign(targets=[目標], value=右式),
-                    ],
-                )
-            ]
-
-        if isinstance(節, 若句):
-            試 = self._轉條件式(節.條件, 節.反轉)
-            然體 = self._填體(self._轉句列(節.然))
-            否體: list[ast.stmt] = self._轉句列(節.否則)
-
-            下個: list[ast.stmt] = self._填體(否體) if 否體 else []
-            for 子 in reversed(節.另若列):
-                子試 = self._轉條件式(子.條件, False)
-                子體 = self._填體(self._轉句列(子.體))
-                下個 = [ast.If(test=子試, body=子體, orelse=下個)]
-            return [ast.If(test=試, body=然體, orelse=下個)]
-
-        if isinstance(節, 恆為是句):
-            體 = self._填體(self._轉句列(節.體))
-            return [ast.While(test=ast.Constant(value=True), body=體, orelse=[])]
-
-        if isinstance(節, 為是遍句):
-            迭名 = self._新內部名("遍")
-            體 = self._填體(self._轉句列(節.體))
-            return [
-                ast.For(
-                    target=ast.Name(id=迭名, ctx=ast.Store()),
-                    iter=ast.Call(
-                        func=ast.Name(id="range", ctx=ast.Load()),
-                        args=[self._轉值(節.次數)],
-                        keywords=[],
+                            )
+                        ],
+                        orelse=[],
                     ),
-                    body=體,
-                    orelse=[],
-                )
-            ]
-
-        if isinstance(節, 乃止句):
-            return [ast.Break()]
+                    ast.Assign(targets=[目標], value=右式),
+                ],
+            )
+        ]
 
-        if isinstance(節, 乃止是遍句):
-            return [ast.Continue()]
+    def _轉若句(self, 節: 若句) -> list[ast.stmt]:
+        試 = self._轉條件式(節.條件, 節.反轉)
+        然體 = self._填體(self._轉句列(節.然))
+        否體: list[ast.stmt] = self._轉句列(節.否則)
+
+        下個: list[ast.stmt] = self._填體(否體) if 否體 else []
+        for 子 in reversed(節.另若列):
+            子試 = self._轉條件式(子.條件, False)
+            子體 = self._填體(self._轉句列(子.體))
+            下個 = [ast.If(test=子試, body=子體, orelse=下個)]
+        return [ast.If(test=試, body=然體, orelse=下個)]
+
+    def _轉恆為是句(self, 節: 恆為是句) -> list[ast.stmt]:
+        體 = self._填體(self._轉句列(節.體))
+        return [ast.While(test=ast.Constant(value=True), body=體, orelse=[])]
+
+    def _轉為是遍句(self, 節: 為是遍句) -> list[ast.stmt]:
+        迭名 = self._新內部名("遍")
+        體 = self._填體(self._轉句列(節.體))
+        return [
+            ast.For(
+                target=ast.Name(id=迭名, ctx=ast.Store()),
+                iter=ast.Call(
+                    func=ast.Name(id="range", ctx=ast.Load()),
+                    args=[self._轉值(節.次數)],
+                    keywords=[],
+                ),
+                body=體,
+                orelse=[],
+            )
+        ]
 
-        self._拋出文法錯誤("此句未支援", 節.位置.start)
-        raise AssertionError("unreachable")
+    def _轉乃止句(self, 節: 乃止句 | 乃止是遍句) -> list[ast.stmt]:
+        if self._語意表.迴圈深.get(id(節)) == 0:
+            self._拋出文法錯誤("乃止不在迴圈之中", 節.始)
+        return [ast.Break() if isinstance(節, 乃止句) else ast.Continue()]
 
     def _轉匯入句(self, 節: 匯入句) -> list[ast.stmt]:
+        """內聯所匯入之文言模組。
+
+        凡匯入皆有 `方悟`、模組頂層可分段者，於首次匯入處僅出全程式諸匯入者所提及之名
+        之遞移閉包；頂層有副作用者，仍全出之。模組頂層皆僅於首次匯入處依源碼序出一次。
+        """
+
         路徑 = _嘗試解析文言模組路徑(節.模組, self.文檔名, self._環境)
         if 路徑 is None:
             return self._轉宿主匯入句(節)
@@ -5537,22 +7627,49 @@ class PythonAST轉譯器:
             return self._環境.模組快取[路徑]
         self._環境.編譯中.add(路徑)
         try:
-            原文 = _讀取源碼(路徑, self._環境)
-            程, 處理後 = _解析前處理(原文, 路徑, self._環境)
+            求詞 = self._模組求詞(路徑) if 節.名列 else None
+            已存 = self._環境.程快取.pop(路徑, None)
+            程, 處理後 = 已存 or _解析前處理(
+                _讀取源碼(路徑, self._環境), 路徑, self._環境
+            )
             轉譯器 = PythonAST轉譯器(處理後, 路徑, self._環境, 插入序言=False)
-            句列 = 轉譯器._轉譯句列(程)
-            self._環境.模組快取[路徑] = 句列
+            轉譯器._固定位 = self._位(節)
+            段列 = None if 求詞 is None else _頂層分段(程.句列)
+            if 段列 is None:
+                結果 = 轉譯器._轉譯句列(程)
+                self._環境.模組快取[路徑] = 結果
+            else:
+                全名 = frozenset().union(*(段.綁名 for 段 in 段列))
+                需 = _搖樹(段列, 全名, 全名 & cast(set[str], 求詞))
+                句列 = [句節 for 序 in sorted(需) for 句節 in 段列[序].句列]
+                結果 = (
+                    轉譯器._轉譯句列(程式(句列[0].始, 句列[-1].終, 句列))
+                    if 句列
+                    else []
+                )
             self._環境.已載入.add(路徑)
-            return 句列
+            return 結果
         finally:
             self._環境.編譯中.discard(路徑)
 
+    def _模組求詞(self, 路徑: str) -> set[str] | None:
+        """全程式諸匯入者於 `路徑` 所可求之詞；有不方悟而匯入者、或無根程式者，返 None。"""
+
+        環境 = self._環境
+        if 環境.匯入求詞 is None:
+            if 環境.根程 is None:
+                return None
+            環境.匯入求詞 = _彙匯入求詞(*環境.根程, 環境)
+        return 環境.匯入求詞.get(路徑)
+
     def _轉宿主匯入句(self, 節: 匯入句) -> list[ast.stmt]:
         名列 = 節.名列
         for 名 in 名列:
-            self._檢名(名, 節.位置)
+            self._檢名(名, 節.始)
+        self._宿主名.update(名列)
         模組名 = self._新內部名("宿主模組")
         句列: list[ast.stmt] = [
+            self._書者呼("清"),
             ast.Assign(
                 targets=[ast.Name(id=模組名, ctx=ast.Store())],
                 value=ast.Call(
@@ -5577,7 +7694,7 @@ class PythonAST轉譯器:
                     ],
                     keywords=[],
                 ),
-            )
+            ),
         ]
         for 名 in 名列:
             句列.append(
@@ -5595,6 +7712,42 @@ class PythonAST轉譯器:
             )
         return 句列
 
+    # ---- 句類分派 -----------------------------------------------------
+
+    # 句類 → 轉譯之術。新增句類、或欲逐類改寫者，於此登記（子類可覆寫此表）。
+    _句轉譯表: dict[type[句], Callable[["PythonAST轉譯器", Any], list[ast.stmt]]] = {
+        匯入句: _轉匯入句,
+        術定義句: _轉術定義句,
+        宣告句: _轉宣告句,
+        初始化句: _轉初始化句,
+        命名句: _轉命名句,
+        施句: _轉施句,
+        以施句: _轉以施句,
+        取句: _轉取句,
+        返回句: _轉返回句,
+        列充句: _轉列充句,
+        列銜句: _轉列銜句,
+        物定義句: _轉物定義句,
+        凡句: _轉凡句,
+        試句: _轉試句,
+        擲句: _轉擲句,
+        註釋句: _轉註釋句,
+        宏句: _轉註釋句,
+        書之句: _轉書之句,
+        噫句: _轉噫句,
+        算術句: _轉算術句,
+        變句: _轉變句,
+        夫句: _轉夫句,
+        之長句: _轉之長句,
+        之句: _轉之句,
+        昔今句: _轉昔今句,
+        若句: _轉若句,
+        恆為是句: _轉恆為是句,
+        為是遍句: _轉為是遍句,
+        乃止句: _轉乃止句,
+        乃止是遍句: _轉乃止句,
+    }
+
 
 def 轉譯為PythonAST(
     程: 程式, 內容: str, 文檔名: str = "<言>", 環境: 編譯環境 | None = None
@@ -5612,6 +7765,210 @@ def 編譯為PythonAST(內容: str, 文檔名: str = "<言>") -> ast.Module:
     return 轉譯為PythonAST(程, 處理後, 文檔名, 環境)
 
 
+_剖析器型 = TypeVar("_剖析器型", bound="文言行剖析器")
+
+
+class 文言行剖析器:
+    """逐 Wenyan 源碼行計執行次數與耗時。
+
+    3.12+ 佔一空閒工具號，唯於 `編譯` 所出之碼設 `sys.monitoring` 之局部 LINE 事件；
+    無空號或 3.10/3.11 則退用 `sys.settrace`，唯源自所剖之檔、非盡為生成碼之框逐行溯之。
+    序言等第 0 行之生成碼及庫函不立行，其時歸於呼之之文言行。所剖之模組須以 `編譯` 編之。
+    """
+
+    __slots__ = (
+        "_前時",
+        "_原溯",
+        "_始時",
+        "_工具",
+        "_檔名集",
+        "_生成碼",
+        "_當",
+        "_監",
+        "_碼列",
+        "_行移",
+        "_計",
+        "總時",
+    )
+
+    # 未派用途之工具號；0/1/2/5 分屬除錯、覆蓋、剖析（cProfile 用之）、優化。
+    _工具候選 = (3, 4)
+
+    def __init__(self, 檔名集: Iterable[str]) -> None:
+        self._檔名集 = frozenset(檔名集)
+        self._計: dict[tuple[str, int], list[int]] = {}
+        self._當: list[int] | None = None
+        self._前時 = 0
+        self._始時 = 0
+        self._原溯: Any = None
+        self._監: Any = getattr(sys, "monitoring", None)
+        self._工具: int | None = None
+        self._碼列: list[Any] = []
+        self._生成碼: dict[object, bool] = {}
+        # 3.10 之 compile 以第 0 行為第 1 行，生成碼與首行無以別，故編譯前諸行移後一行。
+        self._行移 = 1 if sys.version_info < (3, 11) else 0
+        self.總時 = 0
+
+    def __enter__(self: _剖析器型) -> _剖析器型:
+        self.始()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.止()
+
+    def 編譯(self, 模組樹: ast.Module, 文檔名: str) -> Any:
+        """編譯所剖之模組；須移行者，於副本移之，不動共用之序言節點。"""
+
+        if self._行移:
+            模組樹 = ast.increment_lineno(copy.deepcopy(模組樹), self._行移)
+        程式碼 = compile(模組樹, 文檔名, "exec")
+        待 = [程式碼]
+        while 待:
+            碼 = 待.pop()
+            self._碼列.append(碼)
+            待.extend(常 for 常 in 碼.co_consts if isinstance(常, types.CodeType))
+        return 程式碼
+
+    def 始(self) -> None:
+        監 = self._監
+        self._工具 = None if 監 is None else self._佔工具(監)
+        if self._工具 is not None:
+            # 事件唯設於所編之碼，他碼不觸，故無須 DISABLE 後再 restart_events 擾他工具。
+            監.register_callback(self._工具, 監.events.LINE, self._監行)
+            for 碼 in self._碼列:
+                監.set_local_events(self._工具, 碼, 監.events.LINE)
+        else:
+            self._原溯 = sys.gettrace()
+            sys.settrace(self._溯)
+        self._當 = None
+        self._始時 = self._前時 = time.perf_counter_ns()
+
+    @classmethod
+    def _佔工具(cls, 監: Any) -> int | None:
+        """佔一空閒之工具號；皆為他者所佔，返 None 以退用 `sys.settrace`。"""
+
+        for 工具 in cls._工具候選:
+            try:
+                監.use_tool_id(工具, "wenyan")
+            except ValueError:
+                continue
+            return 工具
+        return None
+
+    def 止(self) -> None:
+        今 = time.perf_counter_ns()
+        監, 工具 = self._監, self._工具
+        if 工具 is not None:
+            for 碼 in self._碼列:
+                監.set_local_events(工具, 碼, 0)
+            監.register_callback(工具, 監.events.LINE, None)
+            監.free_tool_id(工具)
+            self._工具 = None
+        else:
+            sys.settrace(self._原溯)
+        if self._當 is not None:
+            self._當[1] += 今 - self._前時
+            self._當 = None
+        self.總時 += 今 - self._始時
+
+    def _入行(self, 檔名: str, 行: int) -> None:
+        今 = time.perf_counter_ns()
+        if self._當 is not None:
+            self._當[1] += 今 - self._前時
+        項 = self._計.get((檔名, 行))
+        if 項 is None:
+            項 = self._計[(檔名, 行)] = [0, 0]
+        項[0] += 1
+        self._當 = 項
+        # 剖析器自身之耗時不計入任何行。
+        self._前時 = time.perf_counter_ns()
+
+    def _監行(self, 碼: Any, 行: int) -> object:
+        if not 行:
+            return self._監.DISABLE
+        self._入行(碼.co_filename, 行)
+        return None
+
+    def _溯(self, 框: Any, 事: str, 參: object) -> Any:
+        碼 = 框.f_code
+        if 碼.co_filename not in self._檔名集:
+            return None
+        生成 = self._生成碼.get(碼)
+        if 生成 is None:
+            # 序言之術、類諸行皆為生成碼，其框不溯。
+            生成 = self._生成碼[碼] = all(
+                not 行 or 行 <= self._行移 for *_, 行 in 碼.co_lines()
+            )
+        return None if 生成 else self._溯行
+
+    def _溯行(self, 框: Any, 事: str, 參: object) -> Any:
+        if 事 == "line" and 框.f_lineno > self._行移:
+            self._入行(框.f_code.co_filename, 框.f_lineno - self._行移)
+        return self._溯行
+
+    def 行表(self) -> dict[str, list[tuple[int, int, int]]]:
+        """各檔之 (行號, 次數, 納秒) 列，依行號排序。"""
+
+        表: dict[str, list[tuple[int, int, int]]] = {}
+        for (檔名, 行), (次, 時) in sorted(self._計.items()):
+            表.setdefault(檔名, []).append((行, 次, 時))
+        return 表
+
+    def 致JSON(self) -> dict[str, object]:
+        """`--profile-json` 所寫之物；時皆以納秒計。"""
+
+        return {
+            "總時": self.總時,
+            "檔": {
+                檔名: [{"行": 行, "次": 次, "時": 時} for 行, 次, 時 in 列]
+                for 檔名, 列 in self.行表().items()
+            },
+        }
+
+    def 報告(self, 源碼表: dict[str, str] | None = None, 最熱數: int = 10) -> str:
+        """最熱之行及逐行標註之源碼；源碼表所無之檔，試自磁碟讀之。"""
+
+        總時 = self.總時 or 1
+        輸出: list[str] = []
+        各檔源行: dict[str, list[str]] = {}
+        for 檔名 in self.行表():
+            源碼 = (源碼表 or {}).get(檔名)
+            if 源碼 is None:
+                try:
+                    with open(檔名, "r", encoding="utf-8") as 檔案:
+                        源碼 = 檔案.read()
+                except OSError:
+                    源碼 = ""
+            各檔源行[檔名] = 源碼.splitlines()
+
+        def 源行(檔名: str, 行: int) -> str:
+            行列 = 各檔源行[檔名]
+            return 行列[行 - 1].strip() if 行 <= len(行列) else ""
+
+        輸出.append(f"總時 {self.總時 / 1e6:.3f} 毫秒")
+        輸出.append("最熱之行：")
+        最熱 = sorted(self._計.items(), key=lambda 項: 項[1][1], reverse=True)
+        for (檔名, 行), (次, 時) in 最熱[:最熱數]:
+            輸出.append(
+                f"  {檔名}:{行:<5} {次:>9} {時 / 1e6:>11.3f} {時 * 100 / 總時:>5.1f}%"
+                f"  {源行(檔名, 行)[:40]}"
+            )
+        for 檔名, 列 in self.行表().items():
+            輸出.append("")
+            輸出.append(f"{檔名}：")
+            輸出.append(f"{'行':>5} {'次數':>9} {'毫秒':>11} {'佔':>6}  源碼")
+            計 = {行: (次, 時) for 行, 次, 時 in 列}
+            for 行, 文 in enumerate(各檔源行[檔名], 1):
+                if 行 in 計:
+                    次, 時 = 計[行]
+                    輸出.append(
+                        f"{行:>5} {次:>9} {時 / 1e6:>11.3f} {時 * 100 / 總時:>5.1f}%  {文}"
+                    )
+                else:
+                    輸出.append(f"{行:>5} {'':>9} {'':>11} {'':>6}  {文}")
+        return "\n".join(輸出)
+
+
 def _自舉檔路徑() -> str:
     return os.path.join(os.path.dirname(__file__), "wenyan.wy")
 
@@ -5753,13 +8110,30 @@ def 主術(參數列表: list[str] | None = None) -> int:
 
     def 顯示說明() -> None:
         print(
-            "用法：wenyan [--tokens|--wyast|--pyast] [--no-outputHanzi] <檔案.wy|-> ..."
+            "用法：wenyan [--tokens|--wyast|--wyast-bin|--pyast|--explain-types]"
+            " [--no-outputHanzi]"
+            " [--unbuffered] [--no-inline] [--profile-lines] [--profile-json 路徑]"
+            " <檔案.wy|-> ..."
         )
-        print("  預設：編譯為 Python AST 並執行。")
+        print("      wenyan --write-lib-index")
+        print("  預設：編譯為 Python AST 並執行；書之以漢字記數，列以 Node 式顯示。")
         print("  --tokens：僅輸出詞法符號（debug）。")
         print("  --wyast：輸出 Wenyan AST（debug）。")
+        print("  --wyast-bin：以 .wyast 二進位格式輸出 Wenyan AST 至標準輸出。")
         print("  --pyast：輸出 Python AST dump（debug）。")
-        print("  --no-outputHanzi：執行模式輸出阿拉伯數字（與 @wenyan/cli 相容）。")
+        print("  --explain-types：輸出型別推斷結果（debug）。")
+        print(
+            "  --no-outputHanzi：書之改以阿拉伯數字輸出（舊版預設；與 @wenyan/cli 相容）。"
+        )
+        print("  --unbuffered：書之逐句直寫並 flush（互動用；預設緩衝至程式結束）。")
+        print("  --no-inline：不於施處展開小術（debug 用；預設展開）。")
+        print(
+            "  --profile-lines：逐文言行計執行次數與耗時，畢則以標註源碼輸出至標準錯誤。"
+        )
+        print("  --profile-json 路徑：同上，並將逐行計數寫為 JSON。")
+        print(
+            "  --write-lib-index：寫入 lib/庫索引.json，編譯期匯入解析免逐檔 stat（宜於安裝時為之）。"
+        )
 
     if not 參數:
         顯示說明()
@@ -5767,6 +8141,10 @@ def 主術(參數列表: list[str] | None = None) -> int:
 
     模式 = "exec"
     不輸出漢字 = False
+    不緩衝 = False
+    不內聯 = False
+    剖析 = False
+    剖析JSON路徑: str | None = None
     while 參數 and 參數[0] != "-":
         選項 = 參數[0]
         if 選項 in {"-h", "--help"}:
@@ -5780,14 +8158,45 @@ def 主術(參數列表: list[str] | None = None) -> int:
             模式 = "wyast"
             參數 = 參數[1:]
             continue
+        if 選項 == "--wyast-bin":
+            模式 = "wyast-bin"
+            參數 = 參數[1:]
+            continue
         if 選項 in {"--pyast", "--ast"}:
             模式 = "pyast"
             參數 = 參數[1:]
             continue
+        if 選項 == "--explain-types":
+            模式 = "types"
+            參數 = 參數[1:]
+            continue
         if 選項 == "--no-outputHanzi":
             不輸出漢字 = True
             參數 = 參數[1:]
             continue
+        if 選項 == "--unbuffered":
+            不緩衝 = True
+            參數 = 參數[1:]
+            continue
+        if 選項 == "--no-inline":
+            不內聯 = True
+            參數 = 參數[1:]
+            continue
+        if 選項 == "--profile-lines":
+            剖析 = True
+            參數 = 參數[1:]
+            continue
+        if 選項 == "--profile-json":
+            if len(參數) < 2:
+                print("--profile-json 須指定路徑。", file=sys.stderr)
+                return 2
+            剖析 = True
+            剖析JSON路徑 = 參數[1]
+            參數 = 參數[2:]
+            continue
+        if 選項 == "--write-lib-index":
+            print(寫入文言庫索引())
+            return 0
         if 選項.startswith("-"):
             print(f"未知選項：{選項}", file=sys.stderr)
             return 2
@@ -5797,6 +8206,12 @@ def 主術(參數列表: list[str] | None = None) -> int:
         print("未指定檔案。可用 -h/--help。", file=sys.stderr)
         return 2
 
+    剖析器 = (
+        文言行剖析器("<stdin>" if 路徑 == "-" else 路徑 for 路徑 in 參數)
+        if 剖析 and 模式 == "exec"
+        else None
+    )
+    源碼表: dict[str, str] = {}
     for 路徑 in 參數:
         try:
             if 路徑 == "-":
@@ -5808,6 +8223,7 @@ def 主術(參數列表: list[str] | None = None) -> int:
                 文檔名 = 路徑
 
             環境 = _建立編譯環境()
+            環境.內聯 = not 不內聯
             if 模式 == "tokens":
                 處理後 = _前處理源碼(內容, 文檔名, 環境)
                 print(list(詞法分析器(處理後, 文檔名)))
@@ -5816,21 +8232,43 @@ def 主術(參數列表: list[str] | None = None) -> int:
                 程, _ = _解析前處理(內容, 文檔名, 環境)
                 print(程)
                 continue
+            if 模式 == "wyast-bin":
+                程, _ = _解析前處理(內容, 文檔名, 環境)
+                sys.stdout.flush()
+                sys.stdout.buffer.write(序列化語法樹(程, 內容))
+                sys.stdout.buffer.flush()
+                continue
             if 模式 == "pyast":
                 程, 處理後 = _解析前處理(內容, 文檔名, 環境)
                 模組樹 = 轉譯為PythonAST(程, 處理後, 文檔名, 環境)
                 print(ast.dump(模組樹, include_attributes=True))
                 continue
+            if 模式 == "types":
+                程, _ = _解析前處理(內容, 文檔名, 環境)
+                for 行 in _推斷型別(程.句列).解說():
+                    print(行)
+                continue
 
             程, 處理後 = _解析前處理(內容, 文檔名, 環境)
             模組樹 = 轉譯為PythonAST(程, 處理後, 文檔名, 環境)
-            程式碼 = compile(模組樹, 文檔名, "exec")
+            程式碼 = (
+                compile(模組樹, 文檔名, "exec")
+                if 剖析器 is None
+                else 剖析器.編譯(模組樹, 文檔名)
+            )
             作用域 = {
                 "__name__": "__main__",
                 "__file__": 文檔名,
                 "__wenyan_no_output_hanzi__": 不輸出漢字,
+                "__wenyan_output_hanzi__": not 不輸出漢字,
+                "__wenyan_unbuffered__": 不緩衝,
             }
-            exec(程式碼, 作用域, 作用域)
+            if 剖析器 is None:
+                exec(程式碼, 作用域, 作用域)
+            else:
+                源碼表[文檔名] = 內容
+                with 剖析器:
+                    exec(程式碼, 作用域, 作用域)
         except 文法之禍 as 錯:
             檔名 = getattr(錯, "filename", "<言>") or "<言>"
             行號 = getattr(錯, "lineno", 0) or 0
@@ -5848,6 +8286,11 @@ def 主術(參數列表: list[str] | None = None) -> int:
             print(f"{路徑}: {錯}", file=sys.stderr)
             return 1
 
+    if 剖析器 is not None:
+        print(剖析器.報告(源碼表), file=sys.stderr)
+        if 剖析JSON路徑 is not None:
+            with open(剖析JSON路徑, "w", encoding="utf-8") as 檔案:
+                json.dump(剖析器.致JSON(), 檔案, ensure_ascii=False, indent=1)
     return 0
 
 